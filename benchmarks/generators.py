@@ -0,0 +1,29 @@
+"""Synthetic documents and pointers for the benchmark suite."""
+
+from fast_json_pointer import JsonPointer
+
+
+def nested(depth: int, key: str = "key") -> tuple[dict, JsonPointer]:
+    """Objects nested ``depth`` deep, and the pointer to the innermost value."""
+    doc: dict = {"leaf": True}
+    for level in reversed(range(depth)):
+        doc = {f"{key}{level}": doc, "sibling": level}
+    return doc, JsonPointer([f"{key}{level}" for level in range(depth)] + ["leaf"])
+
+
+def wide(width: int) -> tuple[dict, JsonPointer]:
+    """One object with ``width`` keys, and the pointer to it's last key."""
+    doc = {f"key{i}": i for i in range(width)}
+    return doc, JsonPointer([f"key{width - 1}"])
+
+
+def array(size: int) -> tuple[list, JsonPointer]:
+    """An array of ``size`` small objects, and the pointer into it's last one."""
+    doc = [{"id": i, "name": f"item{i}"} for i in range(size)]
+    return doc, JsonPointer([str(size - 1), "name"])
+
+
+def pointer_str(depth: int, *, escaped: bool = False) -> str:
+    """A serialized pointer with ``depth`` parts, optionally all needing escapes."""
+    part = "a~0b~1c" if escaped else "abc"
+    return "".join(f"/{part}{i}" for i in range(depth))
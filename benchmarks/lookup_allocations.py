@@ -0,0 +1,67 @@
+"""Compare per-lookup allocations of the trail building ``resolve`` against ``get``.
+
+Run from the repo root::
+
+    python benchmarks/lookup_allocations.py --max-depth 20
+
+For every depth a document nested that deep is built, then a single lookup of the
+deepest leaf is traced with :mod:`tracemalloc`. ``peak`` is the high water mark (in
+bytes) of memory allocated during the lookup, ``us`` the mean time per lookup.
+"""
+
+import argparse
+import timeit
+import tracemalloc
+
+from generators import nested
+
+from fast_json_pointer import resolver
+
+
+def traced(fn, *args) -> int:
+    fn(*args)  # warm up any caches
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    result = fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-depth", type=int, default=20)
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'depth':>5} | {'resolve peak':>12} {'resolve us':>10} | "
+        f"{'get peak':>8} {'get us':>8}"
+    )
+    for depth in range(1, args.max_depth + 1):
+        doc, pointer = nested(depth)
+
+        resolve_peak = traced(resolver.resolve, doc, pointer)
+        get_peak = traced(resolver.get, doc, pointer)
+
+        resolve_us = (
+            timeit.timeit(lambda: resolver.resolve(doc, pointer), number=args.number)
+            / args.number
+            * 1e6
+        )
+        get_us = (
+            timeit.timeit(lambda: resolver.get(doc, pointer), number=args.number)
+            / args.number
+            * 1e6
+        )
+
+        print(
+            f"{depth:>5} | {resolve_peak:>12} {resolve_us:>10.2f} | "
+            f"{get_peak:>8} {get_us:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
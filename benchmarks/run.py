@@ -0,0 +1,335 @@
+"""Benchmark suite for parsing, resolution and mutation.
+
+Run every benchmark (or those matching ``--filter``) and save the results::
+
+    python benchmarks/run.py --output before.json
+    python benchmarks/run.py --output after.json
+
+Then compare two runs, exiting non-zero if anything got slower than ``--threshold``
+percent::
+
+    python benchmarks/run.py compare before.json after.json --threshold 10
+
+Timings are the best of ``--repeat`` runs, each long enough to be measurable (see
+:meth:`timeit.Timer.autorange`), reported in nanoseconds per call.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import timeit
+from typing import *
+
+from generators import array, nested, pointer_str, wide
+
+from fast_json_pointer import (
+    JsonPointer,
+    cache,
+    compiler,
+    patch,
+    persistent,
+    rel_parser,
+    resolver,
+    threadsafe,
+    value_index,
+)
+from fast_json_pointer.cursor import JsonCursor
+from fast_json_pointer.exceptions import ResolutionException
+from fast_json_pointer import rfc6901_parser
+
+BENCHMARKS: dict[str, Callable[[], Callable[[], Any]]] = {}
+"""Benchmark name to factory, factories do any setup and return the timed callable."""
+
+
+def benchmark(name: str):
+    def register(factory):
+        BENCHMARKS[name] = factory
+        return factory
+
+    return register
+
+
+def _register_parsing() -> None:
+    for depth in [1, 10]:
+        for escaped in [False, True]:
+            tag = f"depth={depth},escaped={escaped}"
+            s = pointer_str(depth, escaped=escaped)
+            parts = rfc6901_parser.parse(s)
+
+            benchmark(f"rfc6901.parse[{tag}]")(lambda s=s: lambda: rfc6901_parser.parse(s))
+            benchmark(f"rfc6901.unparse[{tag}]")(
+                lambda parts=parts: lambda: rfc6901_parser.unparse(parts)
+            )
+            benchmark(f"rel.parse[{tag}]")(lambda s=s: lambda: rel_parser.parse(f"1{s}"))
+
+    for escaped in [False, True]:
+        part = "a~b/c" if escaped else "abc"
+        benchmark(f"rfc6901.escape[escaped={escaped}]")(
+            lambda part=part: lambda: rfc6901_parser.escape(part)
+        )
+        benchmark(f"rfc6901.unescape[escaped={escaped}]")(
+            lambda part=rfc6901_parser.escape(part): lambda: rfc6901_parser.unescape(part)
+        )
+
+
+def _register_resolution() -> None:
+    cases = [
+        *(("depth", depth, nested(depth)) for depth in [1, 5, 10, 20]),
+        *(("width", width, wide(width)) for width in [10, 1000, 100_000]),
+        *(("array", size, array(size)) for size in [10, 1000, 100_000]),
+    ]
+    for kind, n, (doc, pointer) in cases:
+        s = str(pointer)
+        benchmark(f"resolver.get[{kind}={n}]")(
+            lambda doc=doc, s=s: lambda: resolver.get(doc, s)
+        )
+        benchmark(f"resolver.resolve[{kind}={n}]")(
+            lambda doc=doc, pointer=pointer: lambda: resolver.resolve(doc, pointer)
+        )
+        benchmark(f"compiler.getter[{kind}={n}]")(
+            lambda doc=doc, pointer=pointer: (
+                lambda getter=compiler.compile_getter(pointer): lambda: getter(doc)
+            )()
+        )
+
+    doc, leaf = nested(10)
+    pointers = [str(JsonPointer(leaf.parts[:depth])) for depth in range(1, 11)]
+    trie = resolver.PointerTrie(pointers)
+    benchmark("resolver.get[loop=10]")(
+        lambda: lambda: [resolver.get(doc, p) for p in pointers]
+    )
+    benchmark("resolver.get_many[trie=10]")(lambda: lambda: trie.get_many(doc))
+
+    s, cached = str(leaf), cache.CachedDocument(doc)
+    benchmark("cache.get[depth=10]")(lambda: lambda: cached.get(s))
+
+    shared = threadsafe.ConcurrentDocument(doc)
+    benchmark("threadsafe.get[depth=10]")(lambda: lambda: shared.get(s))
+
+    cursor = JsonCursor.at(doc, leaf)
+    benchmark("resolver.get[depth=10,rel=2/sibling]")(
+        lambda: lambda: resolver.get(doc, s, rel="2/sibling")
+    )
+    benchmark("cursor.get[depth=10,rel=2/sibling]")(
+        lambda: lambda: cursor.get("2/sibling")
+    )
+
+    def get_or_none(doc, s):
+        try:
+            return resolver.get(doc, s)
+        except ResolutionException:
+            return None
+
+    miss = s + "/missing"
+    benchmark("resolver.get[depth=10,miss,except]")(
+        lambda: lambda: get_or_none(doc, miss)
+    )
+    benchmark("resolver.get[depth=10,miss,default]")(
+        lambda: lambda: resolver.get(doc, miss, default=None)
+    )
+    benchmark("resolver.exists[depth=10,miss]")(
+        lambda: lambda: resolver.exists(doc, miss)
+    )
+
+
+def _register_mutation() -> None:
+    # Each timed callable leaves the document as it found it, restoring state
+    # directly (w/o the resolver) where the operation isn't idempotent.
+    def doc():
+        doc, _ = nested(10)
+        return doc, doc["key0"]["key1"]["key2"]
+
+    prefix = "/key0/key1/key2"
+
+    @benchmark("resolver.add")
+    def _():
+        root, _ = doc()
+        return lambda: resolver.add(root, f"{prefix}/new", 1)
+
+    @benchmark("resolver.replace")
+    def _():
+        root, _ = doc()
+        return lambda: resolver.replace(root, f"{prefix}/sibling", 1)
+
+    @benchmark("resolver.remove")
+    def _():
+        root, parent = doc()
+
+        def run():
+            resolver.remove(root, f"{prefix}/sibling")
+            parent["sibling"] = 2
+
+        return run
+
+    @benchmark("resolver.move")
+    def _():
+        root, parent = doc()
+
+        def run():
+            resolver.move(root, f"{prefix}/sibling", f"{prefix}/moved")
+            parent["sibling"] = parent.pop("moved")
+
+        return run
+
+    @benchmark("resolver.copy")
+    def _():
+        root, _ = doc()
+        return lambda: resolver.copy(root, f"{prefix}/sibling", f"{prefix}/copied")
+
+    @benchmark("resolver.test")
+    def _():
+        root, _ = doc()
+        return lambda: resolver.test(root, f"{prefix}/sibling", 2)
+
+    @benchmark("patch.apply_patch[move]")
+    def _():
+        root, parent = doc()
+        ops = [{"op": "move", "from": f"{prefix}/sibling", "path": f"{prefix}/moved"}]
+
+        def run():
+            patch.apply_patch(root, ops)
+            parent["sibling"] = parent.pop("moved")
+
+        return run
+
+    @benchmark("resolver.remove[array=100000,count=1000]")
+    def _():
+        items = list(range(100_000))
+        # Removed back to front, so earlier removes don't shift later indexes
+        pointers = [f"/{idx}" for idx in reversed(range(0, 100_000, 100))]
+
+        def run():
+            doc = items[:]
+            for pointer in pointers:
+                resolver.remove(doc, pointer)
+
+        return run
+
+    @benchmark("resolver.remove_many[array=100000,count=1000]")
+    def _():
+        items = list(range(100_000))
+        pointers = [f"/{idx}" for idx in range(0, 100_000, 100)]
+        return lambda: resolver.remove_many(items[:], pointers)
+
+    @benchmark("persistent.assoc")
+    def _():
+        root, _ = doc()
+        return lambda: persistent.assoc(root, f"{prefix}/sibling", 1)
+
+    @benchmark("persistent.batch[updates=3]")
+    def _():
+        root, _ = doc()
+        updates = [(f"{prefix}/sibling", 1), (f"{prefix}/new", 2), ("/sibling", 3)]
+        return lambda: persistent.batch(root, updates)
+
+    @benchmark("value_index.find[records=10000]")
+    def _():
+        index = value_index.ValueIndex(
+            {"records": [{"id": f"id{i}", "ref": f"id{i // 2}"} for i in range(10_000)]}
+        )
+        return lambda: index.find("id5000")
+
+    @benchmark("value_index.replace[records=10000]")
+    def _():
+        index = value_index.ValueIndex(
+            {"records": [{"id": f"id{i}", "ref": f"id{i // 2}"} for i in range(10_000)]}
+        )
+        return lambda: index.replace("/records/5000/ref", "id0")
+
+
+_register_parsing()
+_register_resolution()
+_register_mutation()
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> float:
+    """Best time in nanoseconds per call of ``fn``."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def metadata() -> dict[str, str]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "unknown"
+
+    return {
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "commit": commit,
+    }
+
+
+def run(args: argparse.Namespace) -> None:
+    results = {}
+    for name, factory in BENCHMARKS.items():
+        if args.filter and args.filter not in name:
+            continue
+        results[name] = measure(factory(), args.repeat)
+        print(f"{name:<50} {results[name]:>12.1f} ns")
+
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump({"metadata": metadata(), "results": results}, fp, indent=2)
+
+
+def compare(args: argparse.Namespace) -> int:
+    with open(args.before) as fp:
+        before = json.load(fp)["results"]
+    with open(args.after) as fp:
+        after = json.load(fp)["results"]
+
+    regressions = 0
+    for name in sorted(before.keys() & after.keys()):
+        change = (after[name] - before[name]) / before[name] * 100
+        flag = ""
+        if change > args.threshold:
+            flag = "REGRESSION"
+            regressions += 1
+        elif change < -args.threshold:
+            flag = "improved"
+        print(
+            f"{name:<50} {before[name]:>12.1f} {after[name]:>12.1f} "
+            f"{change:>+8.1f}% {flag}"
+        )
+
+    for name in sorted(before.keys() ^ after.keys()):
+        print(f"{name:<50} only in {'before' if name in before else 'after'}")
+
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    parser.add_argument("--output", "-o", help="Save results to this JSON file.")
+    parser.add_argument("--filter", "-k", help="Only run benchmarks containing this.")
+    parser.add_argument("--repeat", type=int, default=5)
+
+    compare_parser = commands.add_parser("compare", help="Compare two saved runs.")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=10.0, help="Percent change to flag."
+    )
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        return compare(args)
+
+    run(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
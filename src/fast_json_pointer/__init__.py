@@ -1 +1,7 @@
-from .pointer import JsonPointer, RelativeJsonPointer
+from .pointer import (
+    JsonPointer,
+    RelativeJsonPointer,
+    clear_parse_cache,
+    parse_cache_info,
+    set_parse_cache_size,
+)
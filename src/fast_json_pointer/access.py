@@ -0,0 +1,183 @@
+"""Pluggable access to containers that aren't plain ``dict`` / ``list``.
+
+The resolver indexes plain ``dict`` and ``list`` nodes directly, anything else is
+accessed through the :class:`Accessor` registered for it's type, so documents made
+of read only mappings, tuples, structs or lazily loaded proxies can be resolved and
+mutated in place, without first being converted to plain json.
+
+Any :class:`~collections.abc.Mapping` or :class:`~collections.abc.Sequence` (other
+than strings) is handled out of the box, other types have to be registered.
+
+>>> from types import MappingProxyType
+>>> from fast_json_pointer import resolver
+>>> resolver.get(MappingProxyType({"a": ({"b": 1},)}), "/a/0/b")
+1
+
+>>> from dataclasses import dataclass
+>>> @dataclass
+... class Point:
+...     x: int
+...     y: int
+>>> register_accessor(Point, AttributeAccessor())
+>>> doc = {"points": [Point(1, 2)]}
+>>> resolver.get(doc, "/points/0/y")
+2
+>>> resolver.add(doc, "/points/0/x", 5)
+>>> doc
+{'points': [Point(x=5, y=2)]}
+>>> unregister_accessor(Point)
+"""
+
+import abc
+import collections.abc
+import functools
+from typing import *
+
+from . import rfc6901_parser
+
+
+class Accessor(abc.ABC):
+    """How pointer parts are looked up, set and deleted in one type of container.
+
+    ``get`` and ``delete`` raise :exc:`LookupError` (``KeyError`` / ``IndexError``)
+    for parts that aren't in the container, read only containers raise
+    :exc:`TypeError` from ``set`` and ``delete``. Membership is only ever tested by
+    a ``get``, so lazily loaded values are loaded once.
+    """
+
+    @abc.abstractmethod
+    def get(self, node: Any, part: str) -> Any:
+        ...
+
+    def set(self, node: Any, part: str, value: Any) -> None:
+        raise TypeError(f"'{type(node).__name__}' is read only")
+
+    def delete(self, node: Any, part: str) -> None:
+        raise TypeError(f"'{type(node).__name__}' is read only")
+
+
+class MappingAccessor(Accessor):
+    """Parts are keys, :class:`~collections.abc.MutableMapping` s can be mutated."""
+
+    def get(self, node: Mapping, part: str) -> Any:
+        return node[part]
+
+    def set(self, node: Mapping, part: str, value: Any) -> None:
+        if not isinstance(node, collections.abc.MutableMapping):
+            super().set(node, part, value)
+        node[part] = value
+
+    def delete(self, node: Mapping, part: str) -> None:
+        if not isinstance(node, collections.abc.MutableMapping):
+            super().delete(node, part)
+        del node[part]
+
+
+class SequenceAccessor(Accessor):
+    """Parts are array indexes, :class:`~collections.abc.MutableSequence` s can be
+    mutated."""
+
+    @staticmethod
+    def _index(part: str) -> int:
+        if not rfc6901_parser.is_array_index(part):
+            raise KeyError(part)
+        return int(part)
+
+    def get(self, node: Sequence, part: str) -> Any:
+        return node[self._index(part)]
+
+    def set(self, node: Sequence, part: str, value: Any) -> None:
+        if not isinstance(node, collections.abc.MutableSequence):
+            super().set(node, part, value)
+        node[self._index(part)] = value
+
+    def delete(self, node: Sequence, part: str) -> None:
+        if not isinstance(node, collections.abc.MutableSequence):
+            super().delete(node, part)
+        del node[self._index(part)]
+
+
+class AttributeAccessor(Accessor):
+    """Parts are attribute names, for dataclasses, attrs / msgspec structs and the
+    like. Names starting with ``_`` are never accessible."""
+
+    @staticmethod
+    def _check(part: str) -> None:
+        if not part or part.startswith("_"):
+            raise KeyError(part)
+
+    def get(self, node: Any, part: str) -> Any:
+        self._check(part)
+        try:
+            return getattr(node, part)
+        except AttributeError as e:
+            raise KeyError(part) from e
+
+    def set(self, node: Any, part: str, value: Any) -> None:
+        self._check(part)
+        setattr(node, part, value)
+
+    def delete(self, node: Any, part: str) -> None:
+        self._check(part)
+        try:
+            delattr(node, part)
+        except AttributeError as e:
+            raise KeyError(part) from e
+
+
+_registered: dict[type, Accessor | None] = {}
+
+
+def _build_dispatch() -> Callable[[Any], Accessor | None]:
+    @functools.singledispatch
+    def dispatch(node: Any) -> Accessor | None:
+        return None
+
+    for cls, accessor in _registered.items():
+        dispatch.register(cls, lambda node, accessor=accessor: accessor)
+    return dispatch
+
+
+_dispatch = _build_dispatch()
+
+
+def register_accessor(cls: type, accessor: Accessor | None) -> None:
+    """Access instances of ``cls`` (and it's subclasses) with ``accessor``, ``None``
+    makes them unnavigable.
+
+    Lookups follow the MRO, and abstract base classes, like
+    :func:`functools.singledispatch`.
+    """
+    _registered[cls] = accessor
+    _dispatch.register(cls, lambda node: accessor)
+
+
+def unregister_accessor(cls: type) -> None:
+    """Undo :func:`register_accessor`, instances of ``cls`` are accessed like their
+    bases are again.
+
+    :raises: :exc:`KeyError`: If ``cls`` isn't registered.
+    """
+    global _dispatch
+
+    del _registered[cls]
+    # `singledispatch` can't unregister, so rebuild it w/o `cls`
+    _dispatch = _build_dispatch()
+
+
+def accessor_for(node: Any) -> Accessor | None:
+    """Accessor registered for ``node``'s type, ``None`` if it's unnavigable.
+
+    >>> accessor_for(()).get(("a", "b"), "1")
+    'b'
+    >>> accessor_for("strings are scalars") is None
+    True
+    """
+    return _dispatch(node)
+
+
+register_accessor(collections.abc.Mapping, MappingAccessor())
+register_accessor(collections.abc.Sequence, SequenceAccessor())
+register_accessor(str, None)
+register_accessor(bytes, None)
+register_accessor(bytearray, None)
@@ -0,0 +1,229 @@
+"""Memoized pointer resolution over long lived, mostly read documents.
+
+A :class:`CachedDocument` caches the values (and the parent containers) of the
+pointers it resolves, in a bounded LRU cache. Mutations made through it evict only
+the cached pointers they could have changed, those at or below the mutated pointer,
+and for array inserts / removals, the later items of the array, who's indexes shift.
+
+>>> cached = CachedDocument({"users": [{"name": "a"}, {"name": "b"}], "n": 2})
+>>> cached.get("/users/1/name"), cached.get("/users/1/name")
+('b', 'b')
+>>> cached.remove("/users/0")
+>>> cached.get("/users/0/name"), cached.get("/n")
+('b', 2)
+>>> cached.cache_info()
+CacheInfo(hits=1, misses=3, maxsize=4096, currsize=4)
+
+Cached values are the document's own objects, mutating them other than through the
+:class:`CachedDocument` leaves the cache stale.
+"""
+
+from collections import OrderedDict
+from typing import *
+
+from . import patch, resolver, rfc6901_parser
+from .patch import Operation
+from .pointer import JsonPointer
+from .resolver import JsonType
+
+DEFAULT_CACHE_SIZE = 4096
+"""Default number of pointers a :class:`CachedDocument` keeps the values of."""
+
+_Parts = tuple[str, ...]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache, ``0.0`` before any lookups.
+
+        >>> CacheInfo(hits=3, misses=1, maxsize=8, currsize=1).hit_rate
+        0.75
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _parts(pointer: str | JsonPointer) -> _Parts:
+    match pointer:
+        case str():
+            pointer = JsonPointer.parse(pointer)
+    return pointer.parts
+
+
+class CachedDocument:
+    """A json document, with a resolution cache kept in sync with it's mutations.
+
+    Mutations follow RFC 6902 semantics, see :func:`.apply_patch`.
+    """
+
+    def __init__(self, doc: JsonType, *, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        self._doc = doc
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._values: OrderedDict[_Parts, JsonType] = OrderedDict()
+        # Nested `{part: {part: ...}}` trie of the cached pointers, so everything
+        # below a prefix can be evicted without scanning the whole cache
+        self._trie: dict[str, dict] = {}
+
+    @property
+    def doc(self) -> JsonType:
+        """The document, which may be replaced by mutating it's root."""
+        return self._doc
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._values))
+
+    def cache_clear(self) -> None:
+        """Empty the cache and reset it's statistics."""
+        self._values.clear()
+        self._trie.clear()
+        self.hits = self.misses = 0
+
+    def _store(self, parts: _Parts, value: JsonType) -> None:
+        if self.maxsize <= 0:
+            return
+
+        if parts not in self._values:
+            node = self._trie
+            for part in parts:
+                node = node.setdefault(part, {})
+        self._values[parts] = value
+        self._values.move_to_end(parts)
+
+        while len(self._values) > self.maxsize:
+            oldest, _ = self._values.popitem(last=False)
+            self._prune(oldest)
+
+    def _prune(self, parts: _Parts) -> None:
+        """Drop trie nodes along ``parts`` that no longer lead to cached pointers."""
+        nodes = [self._trie]
+        for part in parts:
+            if (node := nodes[-1].get(part)) is None:
+                return
+            nodes.append(node)
+
+        for depth in reversed(range(len(parts))):
+            node, prefix = nodes[depth + 1], parts[: depth + 1]
+            if node or prefix in self._values:
+                return
+            del nodes[depth][parts[depth]]
+
+    def _evict(self, prefix: _Parts) -> None:
+        """Evict ``prefix`` and every cached pointer below it."""
+        self._values.pop(prefix, None)
+
+        parent = self._trie
+        for part in prefix[:-1]:
+            if (parent := parent.get(part)) is None:
+                return
+        node = parent.pop(prefix[-1], None) if prefix else parent
+        if node is None:
+            return
+
+        stack = [(prefix, node)]
+        while stack:
+            parts, node = stack.pop()
+            for part, child in node.items():
+                self._values.pop((*parts, part), None)
+                stack.append(((*parts, part), child))
+
+        if prefix:
+            self._prune(prefix[:-1])
+        else:
+            self._trie = {}
+
+    def _evict_shifted(self, parts: _Parts) -> None:
+        """Evict ``parts``, and any later siblings, if it's an array index."""
+        if not parts:
+            self._evict(parts)
+            return
+
+        *parent, part = parts
+        if not rfc6901_parser.is_array_index(part):
+            self._evict(parts)
+            return
+
+        node = self._trie
+        for parent_part in parent:
+            if (node := node.get(parent_part)) is None:
+                return
+        for sibling in list(node):
+            if rfc6901_parser.is_array_index(sibling) and int(sibling) >= int(part):
+                self._evict((*parent, sibling))
+
+    def _resolve(self, parts: _Parts) -> JsonType:
+        # Start from the parent if it's cached, otherwise walk from the root
+        if parts:
+            parent = self._values.get(parts[:-1], resolver.MISSING)
+            if parent is not resolver.MISSING:
+                value = resolver.step(parent, parts[-1])
+                if value is not resolver.MISSING:
+                    return value
+
+        nodes = [self._doc]
+        for idx, part in enumerate(parts):
+            if idx == len(parts) - 1:
+                self._store(parts[:-1], nodes[-1])
+            node = resolver.step(nodes[-1], part)
+            if node is resolver.MISSING:
+                raise resolver.miss(nodes, parts)
+            nodes.append(node)
+        return nodes[-1]
+
+    def get(self, pointer: str | JsonPointer) -> JsonType:
+        """Get the value at ``pointer``, see :func:`.resolver.get`.
+
+        :raises: :exc:`.ResolutionException`: If ``pointer`` doesn't resolve.
+        """
+        parts = _parts(pointer)
+        value = self._values.get(parts, resolver.MISSING)
+        if value is not resolver.MISSING:
+            self.hits += 1
+            self._values.move_to_end(parts)
+            return value
+
+        self.misses += 1
+        value = self._resolve(parts)
+        self._store(parts, value)
+        return value
+
+    def patch(self, ops: Iterable[Operation]) -> None:
+        """Apply RFC 6902 operations, see :func:`.apply_patch`, evicting the cached
+        pointers they affect.
+
+        :raises: :exc:`.PatchException`: If any operation fails, the document and the
+            cache are left as they were.
+        """
+        ops = list(ops)
+        self._doc = patch.apply_patch(self._doc, ops)
+
+        for op in ops:
+            match op:
+                case {"op": "add" | "remove" | "copy", "path": path}:
+                    self._evict_shifted(_parts(path))
+                case {"op": "replace", "path": path}:
+                    self._evict(_parts(path))
+                case {"op": "move", "from": from_, "path": path}:
+                    self._evict_shifted(_parts(from_))
+                    self._evict_shifted(_parts(path))
+
+    def add(self, pointer: str | JsonPointer, value: JsonType) -> None:
+        self.patch([{"op": "add", "path": str(pointer), "value": value}])
+
+    def remove(self, pointer: str | JsonPointer) -> None:
+        self.patch([{"op": "remove", "path": str(pointer)}])
+
+    def replace(self, pointer: str | JsonPointer, value: JsonType) -> None:
+        self.patch([{"op": "replace", "path": str(pointer), "value": value}])
+
+    def move(self, from_: str | JsonPointer, pointer: str | JsonPointer) -> None:
+        self.patch([{"op": "move", "from": str(from_), "path": str(pointer)}])
+
+    def copy(self, from_: str | JsonPointer, pointer: str | JsonPointer) -> None:
+        self.patch([{"op": "copy", "from": str(from_), "path": str(pointer)}])
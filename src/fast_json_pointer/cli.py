@@ -1,19 +1,278 @@
+import asyncio
+import collections
+import json
+import sys
+from enum import Enum
+from typing import *
+
 import typer
 
+from . import index as span_index
+from . import parallel, server
+from .exceptions import JsonPointerException
+
+BUFFER_SIZE = 1 << 20
+"""Bytes read / written at a time when streaming JSON Lines."""
+
 app = typer.Typer()
 
+index_app = typer.Typer(help="Build and query pointer -> byte span indexes.")
+app.add_typer(index_app, name="index")
+
+
+@index_app.command("build")
+def index_build(
+    json_path: str = typer.Argument(..., help="JSON file to index."),
+    output: Optional[str] = typer.Option(
+        None, "--output", "-o", help="Index path, defaults to JSON_PATH.fjpi"
+    ),
+    depth: int = typer.Option(
+        span_index.DEFAULT_MAX_DEPTH, "--depth", "-d", help="Deepest pointers indexed."
+    ),
+):
+    """Scan a JSON file once and write it's sidecar index."""
+    path = span_index.build_index(json_path, output, max_depth=depth)
+    typer.echo(path)
+
+
+@index_app.command("get")
+def index_get(
+    json_path: str = typer.Argument(..., help="Indexed JSON file."),
+    pointers: List[str] = typer.Argument(..., help="Pointers to get."),
+    index_path: Optional[str] = typer.Option(None, "--index", "-i"),
+):
+    """Print the value of each pointer, one JSON document per line."""
+    with span_index.SpanIndex(json_path, index_path) as index:
+        for pointer in pointers:
+            typer.echo(json.dumps(index.get(pointer)))
+
+
+@index_app.command("ls")
+def index_ls(
+    json_path: str = typer.Argument(..., help="Indexed JSON file."),
+    prefix: str = typer.Argument("", help="Only list pointers under this one."),
+    index_path: Optional[str] = typer.Option(None, "--index", "-i"),
+):
+    """List indexed pointers with their byte offset and length."""
+    with span_index.SpanIndex(json_path, index_path) as index:
+        for pointer, (offset, length) in index.prefix(prefix):
+            typer.echo(f"{pointer}\t{offset}\t{length}")
+
+
+def _load_patch(patch: str) -> list:
+    """Patch given inline as JSON, or as ``@path`` to a JSON file."""
+    if patch.startswith("@"):
+        with open(patch[1:], "rb") as fp:
+            return json.load(fp)
+    return json.loads(patch)
+
+
+@app.command("serve")
+def serve(
+    socket: str = typer.Argument(..., help="Unix socket path to listen on."),
+    docs: List[str] = typer.Argument(None, help="Documents to load, as NAME=PATH."),
+    root: Optional[str] = typer.Option(
+        None, help="Directory clients may load documents from, none by default."
+    ),
+):
+    """Keep documents loaded, serving get / patch requests over a unix socket."""
+    doc_server = server.DocumentServer(root=root)
+    for doc in docs or []:
+        name, sep, path = doc.partition("=")
+        if not sep:
+            raise typer.BadParameter(f"'{doc}' isn't NAME=PATH")
+        doc_server.load(name, path)
+
+    try:
+        asyncio.run(doc_server.serve(socket))
+    except KeyboardInterrupt:
+        pass
+
+
+class Format(str, Enum):
+    jsonl = "jsonl"
+    tsv = "tsv"
+
+
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _tsv_field(value: Any) -> str:
+    """Strings as is (escaped), anything else as JSON, like ``jq -r``."""
+    if isinstance(value, str):
+        return value.translate(_TSV_ESCAPES)
+    return json.dumps(value)
+
+
+def _tsv_row(values: list) -> bytes:
+    return ("\t".join(map(_tsv_field, values)) + "\n").encode()
+
+
+def _jsonl_row(value: Any) -> bytes:
+    return json.dumps(value).encode() + b"\n"
+
+
+_Position = tuple[str, int]
+
+
+def _non_blank(
+    name: str, fp: Iterable[bytes], positions: Deque[_Position]
+) -> Iterator[bytes]:
+    for line_number, line in enumerate(fp, 1):
+        if line.strip():
+            positions.append((name, line_number))
+            yield line
+
+
+def _records(inputs: List[str], positions: Deque[_Position]) -> Iterator[bytes]:
+    """Non blank lines of each input (``-`` being stdin), read in large blocks.
+
+    The ``(input, 1-based line number)`` of each record is appended to
+    ``positions``, as it's read.
+    """
+    for path in inputs or ["-"]:
+        if path == "-":
+            yield from _non_blank("<stdin>", sys.stdin.buffer, positions)
+            continue
+        with open(path, "rb", buffering=BUFFER_SIZE) as fp:
+            yield from _non_blank(path, fp, positions)
+
+
+def _stream(
+    results: Iterable[Any],
+    positions: Deque[_Position],
+    encode: Callable[[Any], bytes],
+    placeholder: bytes,
+) -> bool:
+    """Write encoded results to stdout in large blocks, with ``placeholder`` for
+    failed records, so output lines stay aligned with the records, reporting them
+    on stderr. Returns whether any record failed."""
+    out = sys.stdout.buffer
+    failed = False
+    block, size = [], 0
+
+    for result in results:
+        name, line_number = positions.popleft()
+        if isinstance(result, Exception):
+            message = f"{name}:{line_number}: {type(result).__name__}: {result}"
+            typer.echo(message, err=True)
+            failed = True
+            line = placeholder
+        else:
+            line = encode(result)
+
+        block.append(line)
+        size += len(line)
+        if size >= BUFFER_SIZE:
+            out.write(b"".join(block))
+            block, size = [], 0
+
+    out.write(b"".join(block))
+    out.flush()
+    return failed
+
+
+def _get_served(socket: str, doc: str, pointers: List[str]) -> bool:
+    with server.Client(socket) as client:
+        results = client.get(doc, pointers)
+
+    failed = False
+    for pointer, result in zip(pointers, results):
+        if "error" in result:
+            typer.echo(f"{pointer}: {result['error']}", err=True)
+            failed = True
+        else:
+            typer.echo(json.dumps(result["value"]))
+    return failed
+
+
+def _check_served(socket: Optional[str], doc: Optional[str]) -> bool:
+    if socket is not None and doc is None:
+        raise typer.BadParameter("--doc is required with --socket")
+    return socket is not None
+
+
+@app.command("get")
+def get(
+    pointers: List[str] = typer.Argument(..., help="Pointers to get."),
+    inputs: List[str] = typer.Option(
+        None, "--input", "-i", help="JSON Lines files to read, defaults to stdin."
+    ),
+    output_format: Format = typer.Option(Format.jsonl, "--format", "-f"),
+    default: str = typer.Option(
+        "null", "--default", help="JSON value for pointers that don't resolve."
+    ),
+    jobs: int = typer.Option(1, "--jobs", "-j", help="Processes to use."),
+    socket: Optional[str] = typer.Option(
+        None, "--socket", "-s", help="Get from a document served by `fjp serve`."
+    ),
+    doc: Optional[str] = typer.Option(None, "--doc", help="Served document's name."),
+):
+    """Get pointers from each JSON Lines record, writing a JSON array (or TSV row)
+    of their values per record, in order.
+
+    With --socket, print the value of each pointer in a served document instead, one
+    JSON document per line.
+
+    Records that aren't valid JSON (or pointers that don't resolve in a served
+    document) are reported on stderr, by input and line number, and exit with status
+    1. Their output line is ``null`` (or an empty TSV row).
+    """
+    if _check_served(socket, doc):
+        failed = _get_served(socket, doc, pointers)
+    else:
+        positions: Deque[_Position] = collections.deque()
+        results = parallel.map_get(
+            pointers,
+            _records(inputs, positions),
+            workers=jobs,
+            default=json.loads(default),
+        )
+        if output_format is Format.tsv:
+            failed = _stream(
+                results, positions, _tsv_row, b"\t" * (len(pointers) - 1) + b"\n"
+            )
+        else:
+            failed = _stream(results, positions, _jsonl_row, b"null\n")
+
+    if failed:
+        raise typer.Exit(1)
+
+
+@app.command("patch")
+def patch(
+    patch: str = typer.Argument(..., help="RFC 6902 patch as JSON, or @PATH to one."),
+    inputs: List[str] = typer.Option(
+        None, "--input", "-i", help="JSON Lines files to read, defaults to stdin."
+    ),
+    jobs: int = typer.Option(1, "--jobs", "-j", help="Processes to use."),
+    socket: Optional[str] = typer.Option(
+        None, "--socket", "-s", help="Patch a document served by `fjp serve`."
+    ),
+    doc: Optional[str] = typer.Option(None, "--doc", help="Served document's name."),
+):
+    """Apply a RFC 6902 patch to each JSON Lines record, writing the patched records,
+    in order.
 
-# @app.command()
-# def hello(name: str):
-#    print(f"Hello {name}")
+    With --socket, apply the patch, atomically, to a served document instead.
 
+    Records that can't be patched are reported on stderr, by input and line number,
+    and exit with status 1. Their output line is ``null``.
+    """
+    ops = _load_patch(patch)
+    if _check_served(socket, doc):
+        with server.Client(socket) as client:
+            try:
+                client.patch(doc, ops)
+            except JsonPointerException as e:
+                typer.echo(str(e), err=True)
+                raise typer.Exit(1)
+        return
 
-# @app.command()
-# def goodbye(name: str, formal: bool = False):
-#    if formal:
-#        print(f"Goodbye Ms. {name}. Have a good day.")
-#    else:
-#        print(f"Bye {name}!")
+    positions: Deque[_Position] = collections.deque()
+    results = parallel.map_patch(ops, _records(inputs, positions), workers=jobs)
+    if _stream(results, positions, lambda record: record + b"\n", b"null\n"):
+        raise typer.Exit(1)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,268 @@
+"""Extract a fixed set of pointers from many documents into columns.
+
+Each pointer becomes one :class:`Column`, values are written straight into
+preallocated buffers, :class:`array.array` by default, or NumPy arrays with
+``backend="numpy"`` (NumPy is optional, and only imported when asked for).
+
+Columns without a dtype take one from the first value they resolve to, ``"q"`` for
+ints, ``"d"`` for floats, and :data:`OBJECT` for anything else. Integer columns are
+widened to ``"d"`` by the first float they see, so mixed ints and floats are all
+kept. Values are only stored in a column if their json type matches it, ints in
+integer columns, numbers in float columns, strings in string columns, on either
+backend, so nothing is silently truncated or parsed.
+
+Documents are consumed ``chunk_size`` at a time, so :func:`iter_column_chunks` holds
+at most one chunk of input and output in memory.
+
+>>> docs = [{"id": 1, "score": 0.5}, {"id": 2}, {"id": 3, "score": 2.0}]
+>>> id_col, score_col = extract_columns(docs, ["/id", "/score"], dtypes=["q", "d"])
+>>> id_col.values
+array('q', [1, 2, 3])
+>>> score_col.values, score_col.valid
+(array('d', [0.5, 0.0, 2.0]), array('B', [1, 0, 1]))
+"""
+
+import array
+import itertools
+from dataclasses import dataclass
+from typing import *
+
+from .pointer import JsonPointer
+from .resolver import JsonType, PointerTrie
+
+_MISSING: Any = object()
+
+OBJECT = "O"
+"""Typecode for columns of arbitrary python objects, stored in a plain ``list``."""
+
+DEFAULT_CHUNK_SIZE = 65536
+
+_INFERRED = {int: "q", float: "d"}
+"""Typecode of columns without a dtype, by the type of their first value."""
+
+_ARRAY_KINDS = {
+    **dict.fromkeys("bBhHiIlLqQ", "i"),
+    **dict.fromkeys("fd", "f"),
+    **dict.fromkeys("uw", "U"),
+}
+"""NumPy dtype kind of each ``array`` typecode."""
+
+_KIND_TYPES = {
+    "i": (int,),
+    "u": (int,),
+    "f": (int, float),
+    "c": (int, float),
+    "b": (bool,),
+    "U": (str,),
+    "S": (str,),
+}
+"""Json types storable in columns of each NumPy dtype kind."""
+
+
+@dataclass(slots=True)
+class Column:
+    """Values extracted for a single pointer."""
+
+    pointer: JsonPointer
+
+    values: Any
+    """``array.array``, NumPy array, or ``list`` for :data:`OBJECT` columns."""
+
+    valid: Any
+    """Validity mask, truthy where the pointer resolved to a storable value."""
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _default_fill(typecode: str) -> Any:
+    return None if typecode == OBJECT else 0
+
+
+def _infer(values: Iterable[Any], typecode: str | None = None) -> str:
+    """Typecode for a column without a dtype, from the first value it resolves to,
+    or it's ``typecode`` so far, widening integer columns if any value is a float.
+
+    >>> _infer([_MISSING, 1, "a", 2.5]), _infer([2.5, 1]), _infer(["a", 2.5])
+    ('d', 'd', 'O')
+    """
+    for value in values:
+        if value is _MISSING:
+            continue
+        if typecode is None:
+            typecode = _INFERRED.get(type(value), OBJECT)
+        if typecode != "q":
+            return typecode
+        if type(value) is float:
+            return "d"
+    return OBJECT if typecode is None else typecode
+
+
+def _storable(typecode: str, backend: str) -> tuple[type, ...] | None:
+    """Types of value storable in a column, ``None`` for any."""
+    if typecode == OBJECT:
+        return None
+    if backend == "numpy":
+        import numpy as np
+
+        return _KIND_TYPES.get(np.dtype(typecode).kind)
+    return _KIND_TYPES.get(_ARRAY_KINDS.get(typecode, ""))
+
+
+def _allocate(
+    pointer: JsonPointer, typecode: str, fill: Any, size: int, backend: str
+) -> Column:
+    if backend == "numpy":
+        import numpy as np
+
+        dtype = object if typecode == OBJECT else typecode
+        return Column(
+            pointer, np.full(size, fill, dtype=dtype), np.zeros(size, dtype=bool)
+        )
+
+    if typecode == OBJECT:
+        values = [fill] * size
+    else:
+        values = array.array(typecode, [fill]) * size
+
+    return Column(pointer, values, array.array("B", [0]) * size)
+
+
+def _normalize(
+    pointers: Sequence[str | JsonPointer] | PointerTrie,
+    option: Any,
+    default: Callable[[int], Any],
+) -> list:
+    if isinstance(option, (list, tuple)):
+        if len(option) != len(pointers):
+            raise ValueError("Expected one option per pointer")
+        return [default(i) if o is None else o for i, o in enumerate(option)]
+
+    return [default(i) if option is None else option for i in range(len(pointers))]
+
+
+def iter_column_chunks(
+    docs: Iterable[JsonType],
+    pointers: Sequence[str | JsonPointer] | PointerTrie,
+    *,
+    dtypes: str | Sequence[str | None] | None = None,
+    fill: Any = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    backend: Literal["array", "numpy"] = "array",
+) -> Iterator[list[Column]]:
+    """Yield one list of :class:`Column`, in pointer order, per chunk of ``docs``.
+
+    :param dtypes: ``array`` / NumPy typecode per pointer (or one for all),
+        :data:`OBJECT` stores python objects. Inferred from the first chunk by
+        default, see the module docs, so an inferred ``"q"`` column can be ``"d"``
+        in later chunks.
+    :param fill: Value stored where a pointer is missing, or its value can't be
+        stored in the column's type, per pointer or one for all. Defaults to ``0``,
+        or ``None`` for :data:`OBJECT` columns.
+
+    >>> docs = ({"x": i} for i in range(5))
+    >>> [list(x.values) for x, in iter_column_chunks(docs, ["/x"], chunk_size=2)]
+    [[0, 1], [2, 3], [4]]
+    """
+    trie = pointers if isinstance(pointers, PointerTrie) else PointerTrie(pointers)
+    typecodes = _normalize(trie, dtypes, lambda i: None)
+    inferred = [typecode is None for typecode in typecodes]
+    fills = None
+
+    docs = iter(docs)
+    while chunk := list(itertools.islice(docs, chunk_size)):
+        rows = [trie.get_many(doc, default=_MISSING) for doc in chunk]
+        if fills is None:
+            typecodes = [
+                _infer(row[i] for row in rows) if typecode is None else typecode
+                for i, typecode in enumerate(typecodes)
+            ]
+            fills = _normalize(trie, fill, lambda i: _default_fill(typecodes[i]))
+            storable = [_storable(typecode, backend) for typecode in typecodes]
+        else:
+            for i, typecode in enumerate(typecodes):
+                if inferred[i] and typecode == "q":
+                    typecodes[i] = _infer((row[i] for row in rows), typecode)
+                    storable[i] = _storable(typecodes[i], backend)
+
+        columns = [
+            _allocate(pointer, typecode, fill, len(chunk), backend)
+            for pointer, typecode, fill in zip(trie.pointers, typecodes, fills)
+        ]
+
+        for row, values in enumerate(rows):
+            for column, types, value in zip(columns, storable, values):
+                if value is _MISSING or (
+                    types is not None and type(value) not in types
+                ):
+                    continue
+
+                try:
+                    column.values[row] = value
+                except (TypeError, ValueError, OverflowError):
+                    continue
+
+                column.valid[row] = 1
+
+        yield columns
+
+
+def extract_columns(
+    docs: Iterable[JsonType],
+    pointers: Sequence[str | JsonPointer] | PointerTrie,
+    *,
+    dtypes: str | Sequence[str | None] | None = None,
+    fill: Any = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    backend: Literal["array", "numpy"] = "array",
+) -> list[Column]:
+    """Extract ``pointers`` from every document in ``docs`` into whole columns.
+
+    Takes the same options as :func:`iter_column_chunks`, and joins the chunks.
+
+    >>> col, = extract_columns([{"x": "a"}, {}, {"x": [1]}], ["/x"], fill="?")
+    >>> col.values, list(col.valid)
+    (['a', '?', [1]], [1, 0, 1])
+    """
+    trie = pointers if isinstance(pointers, PointerTrie) else PointerTrie(pointers)
+    chunks = iter_column_chunks(
+        docs,
+        trie,
+        dtypes=dtypes,
+        fill=fill,
+        chunk_size=chunk_size,
+        backend=backend,
+    )
+
+    columns = next(chunks, None)
+    if columns is None:
+        typecodes = _normalize(trie, dtypes, lambda i: OBJECT)
+        fills = _normalize(trie, fill, lambda i: _default_fill(typecodes[i]))
+        return [
+            _allocate(pointer, typecode, fill, 0, backend)
+            for pointer, typecode, fill in zip(trie.pointers, typecodes, fills)
+        ]
+
+    if backend == "numpy":
+        import numpy as np
+
+        collected = [columns, *chunks]
+        return [
+            Column(
+                trie.pointers[i],
+                np.concatenate([chunk[i].values for chunk in collected]),
+                np.concatenate([chunk[i].valid for chunk in collected]),
+            )
+            for i in range(len(trie))
+        ]
+
+    for chunk in chunks:
+        for column, part in zip(columns, chunk):
+            if type(part.values) is array.array:
+                if column.values.typecode != part.values.typecode:
+                    # An inferred int column was widened to floats
+                    column.values = array.array(part.values.typecode, column.values)
+            column.values.extend(part.values)
+            column.valid.extend(part.valid)
+
+    return columns
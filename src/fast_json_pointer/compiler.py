@@ -0,0 +1,156 @@
+"""Compile fixed json pointers into specialized accessor functions.
+
+When a pointer is known ahead of time, the per-part type dispatch done by
+:mod:`.resolver` can be unrolled into straight line indexing, roughly
+``lambda doc: doc["a"][3]["b"]``. Every step is guarded by an exact ``dict`` /
+``list`` type check, anything unexpected (misses, other container types) is handed
+to the matching :mod:`.resolver` function, so errors are identical to the
+uncompiled path.
+
+>>> get_b = compile_getter("/a/3/b")
+>>> get_b({"a": [0, 1, 2, {"b": "found"}]})
+'found'
+>>> get_b({"a": {"3": {"b": "keys work too"}}})
+'keys work too'
+>>> get_b({"a": []})
+Traceback (most recent call last):
+fast_json_pointer.exceptions.ResolutionException: ...
+"""
+
+import functools
+from typing import *
+
+from . import resolver, rfc6901_parser
+from .exceptions import JsonPointerException
+from .pointer import JsonPointer
+from .resolver import JsonType
+
+COMPILE_CACHE_SIZE = 1024
+"""Number of compiled accessors kept, per accessor kind."""
+
+
+def _walk_src(parts: Sequence[str], fallback: str) -> list[str]:
+    """Source lines walking ``node`` down ``parts``, bailing to ``fallback``."""
+    lines = []
+    for part in parts:
+        lines.append("t = type(node)")
+        lines.append(f"if t is dict: node = node[{part!r}]")
+        if rfc6901_parser.is_array_index(part):
+            lines.append(f"elif t is list: node = node[{int(part)}]")
+        lines.append(f"else: return {fallback}")
+    return lines
+
+
+def _build(name: str, args: str, body: list[str], fallback: str, namespace: dict):
+    src = "\n".join(
+        [
+            f"def {name}({args}):",
+            "    node = doc",
+            "    try:",
+            *(f"        {line}" for line in body),
+            "    except (KeyError, IndexError):",
+            f"        return {fallback}",
+        ]
+    )
+    exec(src, namespace)
+    return namespace[name]
+
+
+def _parse(pointer: str | JsonPointer) -> JsonPointer:
+    match pointer:
+        case str():
+            return JsonPointer.parse(pointer)
+    return pointer
+
+
+def compile_getter(pointer: str | JsonPointer) -> Callable[[JsonType], JsonType]:
+    """Compile ``pointer`` into a ``getter(doc)`` equivalent to :func:`.resolver.get`.
+
+    Compiled getters are cached per pointer.
+
+    >>> compile_getter("/x") is compile_getter("/x")
+    True
+    >>> compile_getter("")({"x": 1})
+    {'x': 1}
+    """
+    return _compile_getter(_parse(pointer))
+
+
+def compile_setter(
+    pointer: str | JsonPointer,
+) -> Callable[[JsonType, JsonType], None]:
+    """Compile ``pointer`` into a ``setter(doc, value)`` equivalent to
+    :func:`.resolver.add`.
+
+    :raises: :exc:`.JsonPointerException`: If ``pointer`` is the document root.
+
+    >>> set_y = compile_setter("/x/y")
+    >>> doc = {"x": {}}
+    >>> set_y(doc, 5)
+    >>> doc
+    {'x': {'y': 5}}
+    """
+    return _compile_setter(_parse(pointer))
+
+
+def compile_deleter(pointer: str | JsonPointer) -> Callable[[JsonType], None]:
+    """Compile ``pointer`` into a ``deleter(doc)`` equivalent to
+    :func:`.resolver.remove`.
+
+    :raises: :exc:`.JsonPointerException`: If ``pointer`` is the document root.
+
+    >>> del_first = compile_deleter("/x/0")
+    >>> doc = {"x": [1, 2]}
+    >>> del_first(doc)
+    >>> doc
+    {'x': [2]}
+    """
+    return _compile_deleter(_parse(pointer))
+
+
+@functools.lru_cache(COMPILE_CACHE_SIZE)
+def _compile_getter(pointer: JsonPointer) -> Callable[[JsonType], JsonType]:
+    fallback = "get(doc, pointer)"
+    body = [*_walk_src(pointer.parts, fallback), "return node"]
+    namespace = {"get": resolver.get, "pointer": pointer}
+    return _build("getter", "doc", body, fallback, namespace)
+
+
+@functools.lru_cache(COMPILE_CACHE_SIZE)
+def _compile_setter(pointer: JsonPointer) -> Callable[[JsonType, JsonType], None]:
+    if not pointer.parts:
+        raise JsonPointerException("Can't compile a setter for the document root")
+
+    *parents, last = pointer.parts
+    fallback = "add(doc, pointer, value)"
+    body = [
+        *_walk_src(parents, fallback),
+        "t = type(node)",
+        f"if t is dict: node[{last!r}] = value",
+    ]
+    if rfc6901_parser.is_array_index(last):
+        body.append(f"elif t is list: node[{int(last)}] = value")
+    body.append(f"else: return {fallback}")
+
+    namespace = {"add": resolver.add, "pointer": pointer}
+    return _build("setter", "doc, value", body, fallback, namespace)
+
+
+@functools.lru_cache(COMPILE_CACHE_SIZE)
+def _compile_deleter(pointer: JsonPointer) -> Callable[[JsonType], None]:
+    if not pointer.parts:
+        raise JsonPointerException("Can't compile a deleter for the document root")
+
+    *parents, last = pointer.parts
+    fallback = "remove(doc, pointer)"
+    body = [
+        *_walk_src(parents, fallback),
+        "t = type(node)",
+        f"if t is dict: del node[{last!r}]",
+    ]
+    if rfc6901_parser.is_array_index(last):
+        body.append(f"elif t is list: del node[{int(last)}]")
+    body.append(f"else: return {fallback}")
+
+    namespace = {"remove": resolver.remove, "pointer": pointer}
+    return _build("deleter", "doc", body, fallback, namespace)
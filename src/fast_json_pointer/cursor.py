@@ -0,0 +1,211 @@
+"""Cursors, resolved locations in a json document that can be navigated from.
+
+A :class:`JsonCursor` holds it's value, and a link to the cursor of it's parent, so
+relative json pointers are resolved by following ``offset`` links up and then the
+pointer's parts down, in time proportional to the relative pointer, rather than
+re-resolving from the root like ``resolver.get(doc, pointer, rel=...)``.
+
+>>> doc = {"items": [{"id": 1, "tags": ["a"]}, {"id": 2, "tags": []}], "owner": "x"}
+>>> tags = JsonCursor.at(doc, "/items/0/tags")
+>>> tags.rel("1/id").value, tags.rel("3/owner").value, tags.get("1#")
+(1, 'x', '0')
+>>> [c.get("0/id") for c in JsonCursor.at(doc, "/items").children()]
+[1, 2]
+
+Cursors are snapshots of the path they were resolved along, they aren't updated
+if the document is mutated under them.
+"""
+
+from typing import *
+
+from . import resolver
+from .exceptions import JsonPointerException, ResolutionException
+from .pointer import JsonPointer, RelativeJsonPointer, _ReprStrMixin
+from .resolver import JsonRef, JsonType
+
+
+class JsonCursor(_ReprStrMixin):
+    """A value in a json document, with the chain of it's ancestors.
+
+    >>> root = JsonCursor({"a": [True]})
+    >>> cursor = root.child("a").child(0)
+    >>> cursor, cursor.value, cursor.depth
+    (JsonCursor('/a/0'), True, 2)
+    >>> cursor.parent().parent() is root
+    True
+    """
+
+    __slots__ = ("value", "part", "depth", "_parent")
+
+    value: JsonType
+    """Value at the cursor."""
+
+    part: str | None
+    """Key or index of the value in it's parent, ``None`` for the root."""
+
+    depth: int
+    """Number of parts in the cursor's pointer, ``0`` for the root."""
+
+    def __init__(
+        self,
+        value: JsonType,
+        parent: "JsonCursor | None" = None,
+        part: str | None = None,
+    ) -> None:
+        self.value = value
+        self.part = part
+        self.depth = 0 if parent is None else parent.depth + 1
+        self._parent = parent
+
+    @classmethod
+    def at(cls, doc: JsonType, pointer: str | JsonPointer) -> Self:
+        """Cursor at ``pointer`` in ``doc``.
+
+        :raises: :exc:`.ResolutionException`: If ``pointer`` doesn't resolve.
+        """
+        match pointer:
+            case str():
+                pointer = JsonPointer.parse(pointer)
+
+        return cls(doc)._descend(pointer.parts)
+
+    @property
+    def pointer(self) -> JsonPointer:
+        """Absolute pointer to the cursor's value, built by walking up the parents."""
+        parts = [None] * self.depth
+        node = self
+        for idx in reversed(range(self.depth)):
+            parts[idx] = node.part
+            node = node._parent
+        return JsonPointer(parts)
+
+    @property
+    def root(self) -> Self:
+        """Cursor at the root of the document."""
+        node = self
+        while node._parent is not None:
+            node = node._parent
+        return node
+
+    def __str__(self) -> str:
+        """Serialize the cursor's pointer to RFC 6901 json pointer."""
+        return str(self.pointer)
+
+    def _refs(self) -> list[JsonRef]:
+        """Ancestor trail, like :func:`.resolver.resolve` returns."""
+        cursors = []
+        node = self
+        while node is not None:
+            cursors.append(node)
+            node = node._parent
+
+        refs, parts = [], []
+        for cursor in reversed(cursors):
+            if cursor.part is not None:
+                parts.append(cursor.part)
+            refs.append(JsonRef(cursor.value, JsonPointer(parts)))
+        return refs
+
+    def _descend(self, parts: Sequence[str]) -> Self:
+        cursor = self
+        for idx, part in enumerate(parts):
+            value = resolver.step(cursor.value, part)
+            if value is resolver.MISSING:
+                raise ResolutionException(
+                    "Error resolving json pointer",
+                    doc_refs=cursor._refs(),
+                    remaining=tuple(parts[idx:]),
+                )
+            cursor = type(self)(value, cursor, part)
+        return cursor
+
+    def _ascend(self, offset: int) -> Self:
+        cursor = self
+        for _ in range(offset):
+            if cursor._parent is None:
+                raise ResolutionException(
+                    "Relative json pointer ascends past the document root",
+                    doc_refs=self._refs(),
+                    remaining=(),
+                )
+            cursor = cursor._parent
+        return cursor
+
+    def parent(self) -> Self:
+        """Cursor at the containing object or array.
+
+        :raises: :exc:`.ResolutionException`: If this is the root.
+        """
+        return self._ascend(1)
+
+    def child(self, part: str | int) -> Self:
+        """Cursor at ``part`` below this cursor.
+
+        :raises: :exc:`.ResolutionException`: If there's no such key / index.
+        """
+        return self._descend((str(part),))
+
+    def children(self) -> Iterator[Self]:
+        """Cursors at every item / member of the value, in order, if it's a
+        container."""
+        cls = type(self)
+        match self.value:
+            case dict():
+                for key, value in self.value.items():
+                    yield cls(value, self, key)
+            case list():
+                for idx, value in enumerate(self.value):
+                    yield cls(value, self, str(idx))
+
+    def index_ref(self) -> str:
+        """Key or index of the value in it's parent, as a relative pointer's ``#``.
+
+        :raises: :exc:`.ResolutionException`: If this is the root.
+
+        >>> JsonCursor.at([{"a": 1}], "/0/a").index_ref()
+        'a'
+        """
+        if self.part is None:
+            raise ResolutionException(
+                "Root of the document has no index", doc_refs=self._refs(), remaining=()
+            )
+        return self.part
+
+    def rel(self, rel: str | RelativeJsonPointer) -> Self:
+        """Cursor at relative json pointer ``rel``, from this cursor.
+
+        :raises: :exc:`.ResolutionException`: If ``rel`` doesn't resolve.
+        :raises: :exc:`.JsonPointerException`: If ``rel`` is an index reference
+            (``#``), which resolves to a key rather than a value, see :meth:`get`.
+
+        >>> cursor = JsonCursor.at({"a": {"b": 1}, "c": 2}, "/a/b")
+        >>> cursor.rel("2/c")
+        JsonCursor('/c')
+        >>> cursor.rel("0")
+        JsonCursor('/a/b')
+        """
+        match rel:
+            case str():
+                rel = RelativeJsonPointer.parse(rel)
+
+        if rel.pointer is None:
+            raise JsonPointerException(
+                f"Index reference '{rel}' doesn't resolve to a location"
+            )
+
+        return self._ascend(rel.offset)._descend(rel.pointer.parts)
+
+    def get(self, rel: str | RelativeJsonPointer) -> JsonType:
+        """Value at relative json pointer ``rel``, from this cursor, index
+        references (``#``) giving the key or index of the ancestor they reference.
+
+        :raises: :exc:`.ResolutionException`: If ``rel`` doesn't resolve.
+        """
+        match rel:
+            case str():
+                rel = RelativeJsonPointer.parse(rel)
+
+        cursor = self._ascend(rel.offset)
+        if rel.pointer is None:
+            return cursor.index_ref()
+        return cursor._descend(rel.pointer.parts).value
@@ -0,0 +1,258 @@
+"""Structural diffs between json documents, as RFC 6902 json patches.
+
+>>> old = {"name": "a", "tags": ["x", "y", "z"], "meta": {"v": 1}}
+>>> new = {"name": "a", "tags": ["x", "z", "w"], "meta": {"v": 2}}
+>>> ops = diff(old, new)
+>>> ops
+[{'op': 'remove', 'path': '/tags/1'}, {'op': 'add', 'path': '/tags/2', 'value': 'w'}, {'op': 'replace', 'path': '/meta/v', 'value': 2}]
+>>> from .patch import apply_patch
+>>> apply_patch(old, ops) == new
+True
+
+Identical subtrees are skipped by identity, array items also by equality, which
+stops at the first difference, and arrays are aligned on cached structural hashes of
+their items, so diffing mostly unchanged documents is close to linear.
+Values in the patch are shared with ``new``, not copied.
+"""
+
+import difflib
+from typing import *
+
+from . import rfc6901_parser
+from .patch import Operation, json_equal
+from .resolver import JsonType
+
+DEFAULT_MAX_ARRAY_EDITS = 256
+"""Default bound on the insertions + deletions searched for when aligning two arrays
+exactly, past it arrays are aligned heuristically."""
+
+DEFAULT_MAX_ARRAY_ALIGN = 1 << 21
+"""Default bound on ``len(old) + len(new)`` for aligning the differing middle of two
+arrays heuristically, past it elements are paired up by position instead."""
+
+_Opcodes = list[tuple[str, int, int, int, int]]
+
+
+def _myers(a: Sequence[int], b: Sequence[int], max_edits: int) -> _Opcodes | None:
+    """Shortest edit script between ``a`` and ``b``, as :mod:`difflib` style opcodes.
+
+    Myers' O((N+M)D) algorithm, gives up (returning ``None``) past ``max_edits``, or
+    once it's compared more than a small multiple of ``N+M`` elements.
+
+    >>> _myers([1, 2, 3, 4], [1, 3, 4, 5], 4)
+    [('equal', 0, 1, 0, 1), ('replace', 1, 2, 1, 1), ('equal', 2, 4, 1, 3), ('replace', 4, 4, 3, 4)]
+    """
+    n, m = len(a), len(b)
+    offset = max_edits + 1
+    v = [0] * (2 * max_edits + 3)
+    trace = []
+    budget = 8 * (n + m) + max_edits * max_edits
+
+    for d in range(max_edits + 1):
+        trace.append(v[:])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            snake_start = x
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+
+            budget -= x - snake_start + 1
+            if budget < 0:
+                return None
+            if x >= n and y >= m:
+                return _backtrack(trace, offset, n, m)
+
+    return None
+
+
+def _backtrack(trace: list[list[int]], offset: int, x: int, y: int) -> _Opcodes:
+    steps = []  # "=" match, "-" delete, "+" insert, in reverse
+    for d in reversed(range(len(trace))):
+        if d == 0:
+            steps.extend("=" * x)
+            break
+
+        v, k = trace[d], x - y
+        if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[offset + prev_k]
+        prev_y = prev_x - prev_k
+
+        while x > prev_x and y > prev_y:
+            steps.append("=")
+            x, y = x - 1, y - 1
+        steps.append("+" if x == prev_x else "-")
+        x, y = prev_x, prev_y
+
+    # Group runs of matches, and of the deletes / inserts between them
+    opcodes: _Opcodes = []
+    i = j = 0
+    for step in reversed(steps):
+        tag = "equal" if step == "=" else "replace"
+        di, dj = {"=": (1, 1), "-": (1, 0), "+": (0, 1)}[step]
+        if opcodes and opcodes[-1][0] == tag:
+            _, i1, _, j1, _ = opcodes[-1]
+            opcodes[-1] = (tag, i1, i + di, j1, j + dj)
+        else:
+            opcodes.append((tag, i, i + di, j, j + dj))
+        i, j = i + di, j + dj
+
+    return opcodes
+
+
+class _Differ:
+    def __init__(self, max_array_edits: int, max_array_align: int) -> None:
+        self.max_array_edits = max_array_edits
+        self.max_array_align = max_array_align
+        self.ops: list[Operation] = []
+        self.path: list[str] = []
+        # Keyed by id, safe as both documents outlive the diff
+        self._hashes: dict[int, int] = {}
+
+    def _pointer(self, part: str | None = None) -> str:
+        if part is None:
+            return rfc6901_parser.unparse(self.path)
+        return rfc6901_parser.unparse([*self.path, part])
+
+    def hash(self, value: JsonType) -> int:
+        """Structural hash, distinguishing types (so ``1``, ``1.0`` & ``True``)."""
+        value_type = type(value)
+        if value_type is dict or value_type is list:
+            if (cached := self._hashes.get(id(value))) is None:
+                if value_type is dict:
+                    items = zip(value.keys(), map(self.hash, value.values()))
+                    cached = hash(frozenset(items))
+                else:
+                    cached = hash(tuple(map(self.hash, value)))
+                self._hashes[id(value)] = cached
+            return cached
+
+        return hash((value_type, value))
+
+    def equal(self, old: JsonType, new: JsonType) -> bool:
+        """Type strict equality, unlike ``==`` where ``1 == 1.0 == True``, returning
+        at the first difference."""
+        return json_equal(old, new, strict_numbers=True)
+
+    def diff(self, old: JsonType, new: JsonType) -> None:
+        if old is new:
+            return
+
+        # Containers aren't compared up front, walking them finds any differences
+        match old, new:
+            case dict(), dict():
+                self._diff_dict(old, new)
+            case list(), list():
+                self._diff_list(old, new)
+            case _ if not self.equal(old, new):
+                self.ops.append({"op": "replace", "path": self._pointer(), "value": new})
+
+    def _child(self, part: str, old: JsonType, new: JsonType) -> None:
+        self.path.append(part)
+        try:
+            self.diff(old, new)
+        finally:
+            self.path.pop()
+
+    def _diff_dict(self, old: dict, new: dict) -> None:
+        for key in old:
+            if key not in new:
+                self.ops.append({"op": "remove", "path": self._pointer(key)})
+
+        for key, value in new.items():
+            if key in old:
+                self._child(key, old[key], value)
+            else:
+                self.ops.append({"op": "add", "path": self._pointer(key), "value": value})
+
+    def _align(self, old: list, new: list) -> _Opcodes:
+        """Align two arrays (w/o common prefix / suffix) on their elements' hashes.
+
+        Exactly, if they differ by at most ``max_array_edits`` inserts + deletes,
+        then heuristically with :mod:`difflib`, who's "autojunk" ignores values
+        making up more than 1% of long arrays, and past ``max_array_align`` just by
+        position.
+        """
+        if not old or not new:
+            return [("replace", 0, len(old), 0, len(new))]
+
+        old_hashes = [self.hash(v) for v in old]
+        new_hashes = [self.hash(v) for v in new]
+
+        max_edits = min(self.max_array_edits, len(old) + len(new))
+        if (opcodes := _myers(old_hashes, new_hashes, max_edits)) is not None:
+            return opcodes
+
+        if len(old) + len(new) <= self.max_array_align:
+            return difflib.SequenceMatcher(None, old_hashes, new_hashes).get_opcodes()
+
+        return [("replace", 0, len(old), 0, len(new))]
+
+    def _diff_list(self, old: list, new: list) -> None:
+        # Trim the common prefix / suffix before aligning what's left
+        start, old_end, new_end = 0, len(old), len(new)
+        while start < min(old_end, new_end) and self.equal(old[start], new[start]):
+            start += 1
+        while (
+            old_end > start
+            and new_end > start
+            and self.equal(old[old_end - 1], new[new_end - 1])
+        ):
+            old_end -= 1
+            new_end -= 1
+
+        old_mid, new_mid = old[start:old_end], new[start:new_end]
+        opcodes = self._align(old_mid, new_mid)
+
+        # `idx` tracks the position in the array as the patch is being applied
+        idx = start
+        for tag, i1, i2, j1, j2 in opcodes:
+            if tag == "equal":
+                # Hashes could (very rarely) collide
+                for offset in range(i2 - i1):
+                    old_value, new_value = old_mid[i1 + offset], new_mid[j1 + offset]
+                    if not self.equal(old_value, new_value):
+                        self._child(str(idx), old_value, new_value)
+                    idx += 1
+                continue
+
+            paired = min(i2 - i1, j2 - j1)
+            for offset in range(paired):
+                self._child(str(idx), old_mid[i1 + offset], new_mid[j1 + offset])
+                idx += 1
+            for _ in range(i2 - i1 - paired):
+                self.ops.append({"op": "remove", "path": self._pointer(str(idx))})
+            for j in range(j1 + paired, j2):
+                self.ops.append(
+                    {"op": "add", "path": self._pointer(str(idx)), "value": new_mid[j]}
+                )
+                idx += 1
+
+
+def diff(
+    old: JsonType,
+    new: JsonType,
+    *,
+    max_array_edits: int = DEFAULT_MAX_ARRAY_EDITS,
+    max_array_align: int = DEFAULT_MAX_ARRAY_ALIGN,
+) -> list[Operation]:
+    """RFC 6902 operations that turn ``old`` into ``new``, see :func:`.apply_patch`.
+
+    >>> diff({"a": 1}, {"a": 1})
+    []
+    >>> diff([1], {"a": 1})
+    [{'op': 'replace', 'path': '', 'value': {'a': 1}}]
+    >>> diff({"a": 1}, {"a": True})
+    [{'op': 'replace', 'path': '/a', 'value': True}]
+    """
+    differ = _Differ(max_array_edits, max_array_align)
+    differ.diff(old, new)
+    return differ.ops
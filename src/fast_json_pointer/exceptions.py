@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from .resolver import JsonPointer, JsonRef
@@ -15,12 +15,51 @@ class ParseException(JsonPointerException):
 
 
 class ResolutionException(JsonPointerException):
-    """Failure occurred while resolving a json pointer."""
+    """Failure occurred while resolving a json pointer.
 
-    def __init__(self, *args, doc_refs: list[JsonRef], remaining) -> None:
-        self.doc_refs = doc_refs
+    ``doc_refs`` are the documents resolved before the failure, ``remaining`` the
+    parts left unresolved. Rather than passing ``doc_refs``, a ``context`` callable
+    can be given to build them on first access, so misses that are caught and
+    discarded never pay for them.
+    """
+
+    def __init__(
+        self,
+        *args,
+        doc_refs: list[JsonRef] | None = None,
+        remaining: tuple[str, ...] | None = None,
+        context: Callable[[], list[JsonRef]] | None = None,
+    ) -> None:
+        super().__init__(*args)
+        self._doc_refs = doc_refs
+        self._context = context
         self.remaining = remaining
 
+    @property
+    def doc_refs(self) -> list[JsonRef] | None:
+        if self._context is not None:
+            context, self._context = self._context, None
+            self._doc_refs = context()
+        return self._doc_refs
+
+    @doc_refs.setter
+    def doc_refs(self, doc_refs: list[JsonRef] | None) -> None:
+        self._context = None
+        self._doc_refs = doc_refs
+
+    def __reduce__(self):
+        # The context callable closes over the document, and may not pickle
+        self._doc_refs, self._context = self.doc_refs, None
+        return super().__reduce__()
+
 
 class EndOfArrayException(ResolutionException):
     """Reference pointed to the end of a array."""
+
+
+class PatchException(JsonPointerException):
+    """Failure occurred while applying a json patch."""
+
+    def __init__(self, *args, op_index: int | None = None) -> None:
+        super().__init__(*args)
+        self.op_index = op_index
@@ -0,0 +1,278 @@
+"""Persistent pointer to byte span indexes over large, immutable JSON files.
+
+:func:`build_index` scans a JSON file once, and writes a sidecar index mapping every
+pointer (down to ``max_depth``) to the byte span of it's value. A :class:`SpanIndex`
+memory maps both files read only, so any number of processes can share them, and
+lookups jump straight to the span of the value, only decoding that.
+
+Pointers deeper than the index are resolved by scanning from the span of their
+deepest indexed ancestor, see :mod:`.stream`.
+
+Index layout (little endian), records are sorted by their serialized pointer::
+
+    header   magic "FJPI", u16 version, u16 max_depth, u32 reserved,
+             u64 record count, u64 source size, u64 source mtime (ns)
+    records  (u64 key offset, u64 key length, u64 value offset, u64 value length)
+    keys     utf-8 serialized pointers
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from typing import *
+
+from . import rfc6901_parser, stream
+from .exceptions import JsonPointerException, ResolutionException
+from .pointer import JsonPointer
+from .resolver import JsonType
+
+INDEX_SUFFIX = ".fjpi"
+"""Suffix appended to the JSON file's path for the default index location."""
+
+DEFAULT_MAX_DEPTH = 4
+
+_MAGIC = b"FJPI"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHIQQQ")
+_RECORD = struct.Struct("<QQQQ")
+
+
+class IndexException(JsonPointerException):
+    """Index is missing, corrupt, or out of date with it's JSON file."""
+
+
+def _walk(
+    scanner: stream.Scanner,
+    key: bytes,
+    depth: int,
+    max_depth: int,
+    records: list[tuple[bytes, int, int]],
+) -> None:
+    scanner.skip_ws()
+    start = scanner.offset
+
+    if depth < max_depth:
+        match scanner.peek():
+            case 0x7B:  # {
+                scanner.pos += 1
+                first = True
+                while (member := scanner.next_member(first)) is not None:
+                    child = key + b"/" + rfc6901_parser.escape(member).encode()
+                    _walk(scanner, child, depth + 1, max_depth, records)
+                    first = False
+            case 0x5B:  # [
+                scanner.pos += 1
+                idx = 0
+                while scanner.next_item(idx == 0):
+                    child = key + b"/" + str(idx).encode()
+                    _walk(scanner, child, depth + 1, max_depth, records)
+                    idx += 1
+            case _:
+                scanner.skip_value()
+    else:
+        scanner.skip_value()
+
+    records.append((key, start, scanner.offset - start))
+
+
+def _map(fp: BinaryIO, path: str | os.PathLike) -> mmap.mmap:
+    """Map ``fp`` read only, empty files (which can't be mapped) aren't valid JSON /
+    indexes."""
+    if os.fstat(fp.fileno()).st_size == 0:
+        raise IndexException(f"'{os.fspath(path)}' is empty")
+    return mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def default_index_path(json_path: str | os.PathLike) -> str:
+    """Sidecar index path used when none is given, ``json_path`` + ``.fjpi``."""
+    return os.fspath(json_path) + INDEX_SUFFIX
+
+
+def build_index(
+    json_path: str | os.PathLike,
+    index_path: str | os.PathLike | None = None,
+    *,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+) -> str:
+    """Scan ``json_path`` and write it's index, returns the index's path.
+
+    The index is written to a temporary file and moved into place, so readers never
+    see a partial index.
+    """
+    index_path = os.fspath(index_path or default_index_path(json_path))
+    records: list[tuple[bytes, int, int]] = []
+
+    with open(json_path, "rb") as fp:
+        stat = os.fstat(fp.fileno())
+        with _map(fp, json_path) as mapped:
+            _walk(stream.Scanner(mapped), b"", 0, max_depth, records)
+
+    records.sort()
+
+    directory = os.path.dirname(os.path.abspath(index_path))
+    with tempfile.NamedTemporaryFile("wb", dir=directory, delete=False) as out:
+        try:
+            out.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    _VERSION,
+                    max_depth,
+                    0,
+                    len(records),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                )
+            )
+            key_offset = _HEADER.size + _RECORD.size * len(records)
+            for key, start, length in records:
+                out.write(_RECORD.pack(key_offset, len(key), start, length))
+                key_offset += len(key)
+            for key, _, _ in records:
+                out.write(key)
+        except BaseException:
+            os.unlink(out.name)
+            raise
+
+    os.replace(out.name, index_path)
+    return index_path
+
+
+def _key(pointer: str | JsonPointer) -> bytes:
+    match pointer:
+        case str():
+            pointer = JsonPointer.parse(pointer)
+    return str(pointer).encode()
+
+
+class SpanIndex:
+    """Read only view of a JSON file and it's index.
+
+    >>> import json, tempfile
+    >>> with tempfile.TemporaryDirectory() as tmp:
+    ...     path = os.path.join(tmp, "doc.json")
+    ...     with open(path, "w") as fp:
+    ...         json.dump({"a": {"b": [1, 2, {"c": "deep"}]}, "ab": 0}, fp)
+    ...     _ = build_index(path, max_depth=2)
+    ...     with SpanIndex(path) as index:
+    ...         print(index.get("/a/b"), index.get("/a/b/2/c"))
+    ...         print([str(p) for p, _ in index.prefix("/a")])
+    [1, 2, {'c': 'deep'}] deep
+    ['/a', '/a/b']
+    """
+
+    def __init__(
+        self,
+        json_path: str | os.PathLike,
+        index_path: str | os.PathLike | None = None,
+    ) -> None:
+        index_path = index_path or default_index_path(json_path)
+
+        with open(json_path, "rb") as fp:
+            stat = os.fstat(fp.fileno())
+            self._doc = _map(fp, json_path)
+
+        try:
+            with open(index_path, "rb") as fp:
+                self._index = _map(fp, index_path)
+        except FileNotFoundError as e:
+            self._doc.close()
+            raise IndexException(f"No index at '{index_path}'") from e
+        except BaseException:
+            self._doc.close()
+            raise
+
+        try:
+            magic, version, self.max_depth, _, self._count, size, mtime = (
+                _HEADER.unpack_from(self._index)
+            )
+            if magic != _MAGIC or version != _VERSION:
+                raise IndexException(f"'{index_path}' isn't a version {_VERSION} index")
+            if (size, mtime) != (stat.st_size, stat.st_mtime_ns):
+                raise IndexException(f"'{index_path}' is out of date with it's file")
+        except (IndexException, struct.error):
+            self.close()
+            raise
+
+    def close(self) -> None:
+        self._index.close()
+        self._doc.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _record(self, idx: int) -> tuple[bytes, int, int]:
+        key_offset, key_length, start, length = _RECORD.unpack_from(
+            self._index, _HEADER.size + _RECORD.size * idx
+        )
+        return self._index[key_offset : key_offset + key_length], start, length
+
+    def _bisect(self, key: bytes) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._record(mid)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def span(self, pointer: str | JsonPointer) -> tuple[int, int] | None:
+        """``(offset, length)`` of the value at ``pointer``, if it's indexed."""
+        key = _key(pointer)
+        idx = self._bisect(key)
+        if idx < self._count:
+            found, start, length = self._record(idx)
+            if found == key:
+                return start, length
+        return None
+
+    def __contains__(self, pointer: str | JsonPointer) -> bool:
+        return self.span(pointer) is not None
+
+    def prefix(
+        self, pointer: str | JsonPointer
+    ) -> Iterator[tuple[JsonPointer, tuple[int, int]]]:
+        """Every indexed pointer at, or below ``pointer``, with it's span."""
+        key = _key(pointer)
+        if (span := self.span(pointer)) is not None:
+            yield JsonPointer.parse(key.decode()), span
+
+        key += b"/"
+        idx = self._bisect(key)
+        while idx < self._count:
+            found, start, length = self._record(idx)
+            if not found.startswith(key):
+                return
+            yield JsonPointer.parse(found.decode()), (start, length)
+            idx += 1
+
+    def get(self, pointer: str | JsonPointer) -> JsonType:
+        """Get the value at ``pointer``, decoding only it's bytes.
+
+        :raises: :exc:`.ResolutionException`: If ``pointer`` doesn't resolve.
+        """
+        match pointer:
+            case str():
+                pointer = JsonPointer.parse(pointer)
+
+        # Every pointer down to `max_depth` is indexed, so missing there is a miss
+        depth = min(len(pointer.parts), self.max_depth)
+        span = self.span(JsonPointer(pointer.parts[:depth]))
+        if span is None:
+            raise ResolutionException(
+                "Error resolving json pointer", remaining=pointer.parts
+            )
+
+        start, length = span
+        view = memoryview(self._doc)[start : start + length]
+        try:
+            return stream.get_from_bytes(view, JsonPointer(pointer.parts[depth:]))
+        finally:
+            view.release()
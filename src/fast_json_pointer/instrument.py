@@ -0,0 +1,296 @@
+"""Opt-in counters and timings for pointer parsing, resolution and mutation.
+
+Instrumentation is off by default, and costs nothing while off. :func:`enable`
+swaps the hot functions (``rfc6901_parser.parse``, the resolver's lookups and
+mutations, ``apply_patch``) for counting wrappers, :func:`disable` puts the
+originals back. Lookups that don't raise, with a ``default``, ``exists`` or
+``get_many``, count their misses too.
+
+>>> from fast_json_pointer import resolver
+>>> enable()
+>>> resolver.get({"a": [1]}, "/a/0")
+1
+>>> resolver.get({"a": {}}, "/a/b", default=None)
+>>> stats = snapshot()
+>>> stats["resolve"]["calls"], stats["depth"], stats["misses"]
+(2, {2: 2}, {'key': 1})
+>>> disable()
+
+Mutations made by other mutations, like the remove and add of a ``move``, are only
+counted as the outer mutation. Counters are shared by all threads, and are best
+effort under concurrent use. Calls made through accessors compiled by
+:mod:`.compiler`, or cached by :class:`.CachedDocument`, don't go through the
+instrumented functions and aren't counted.
+"""
+
+import collections
+import functools
+import threading
+import time
+from types import ModuleType
+from typing import *
+
+from . import patch, pointer, resolver, rfc6901_parser
+from .exceptions import ResolutionException
+from .resolver import JsonType
+
+Hook = Callable[[str, int | None], None]
+"""Called with each event's name, and it's duration in nanoseconds, if timed."""
+
+_Wrap = Callable[[Callable], Callable]
+
+_MUTATIONS = (
+    "add",
+    "remove",
+    "replace",
+    "move",
+    "copy",
+    "set_many",
+    "add_many",
+    "remove_many",
+)
+
+_enabled = False
+_timing = False
+_hook: Hook | None = None
+_originals: dict[tuple[ModuleType | type, str], Callable] = {}
+_local = threading.local()
+
+_calls: collections.Counter[str] = collections.Counter()
+_time_ns: collections.Counter[str] = collections.Counter()
+_depths: collections.Counter[int] = collections.Counter()
+_misses: collections.Counter[str] = collections.Counter()
+_cache_base: dict[str, tuple[int, int]] = {}
+
+
+_UNRESOLVED: Any = object()
+
+
+def _miss_kind(node: JsonType, part: str) -> str:
+    """Why a pointer missed, from the last node reached and the part that failed."""
+    match node:
+        case dict():
+            return "key"
+        case list() if part == "-":
+            return "end_of_array"
+        case list() if rfc6901_parser.is_array_index(part):
+            return "index"
+        case list():
+            return "invalid_index"
+        case _:
+            return "not_container"
+
+
+def _miss(kind: str) -> None:
+    _misses[kind] += 1
+    if _hook is not None:
+        _hook(f"miss.{kind}", None)
+
+
+def _walked_miss(doc: JsonType, parts: Sequence[str]) -> list[JsonType]:
+    """Count the miss of ``parts``, and give the nodes walked to it."""
+    nodes = resolver._walk(doc, parts)
+    _miss(_miss_kind(nodes[-1], parts[len(nodes) - 1]))
+    return nodes
+
+
+def _record(event: str, start: int, count: int = 1) -> None:
+    _calls[event] += count
+    elapsed = None
+    if _timing:
+        elapsed = time.perf_counter_ns() - start
+        _time_ns[event] += elapsed
+    if _hook is not None:
+        _hook(event, elapsed)
+
+
+def _instrument(
+    event: str, fn: Callable, depth: Callable[..., int] | None = None
+) -> Callable:
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns() if _timing else 0
+        if depth is not None:
+            _depths[depth(*args, **kwargs)] += 1
+        try:
+            return fn(*args, **kwargs)
+        except ResolutionException as e:
+            if e.doc_refs and e.remaining:
+                _miss(_miss_kind(e.doc_refs[-1].doc, e.remaining[0]))
+            else:
+                _miss("other")
+            raise
+        finally:
+            _record(event, start)
+
+    return wrapper
+
+
+def _instrument_find(fn: Callable) -> Callable:
+    """Count ``resolver._find``, which misses by returning :data:`.MISSING`."""
+
+    @functools.wraps(fn)
+    def wrapper(doc, pointer, rel):
+        start = time.perf_counter_ns() if _timing else 0
+        parts = pointer.parts
+        if rel is not None and rel.offset == 0 and not rel.is_index_ref:
+            parts = (*parts, *rel.pointer.parts)
+        _depths[len(parts)] += 1
+
+        try:
+            value = fn(doc, pointer, rel)
+            if value is resolver.MISSING:
+                if rel is None or parts is not pointer.parts:
+                    _walked_miss(doc, parts)
+                else:
+                    # Ascending / index refs miss relative to where they ascended to
+                    _miss("other")
+            return value
+        finally:
+            _record("resolve", start)
+
+    return wrapper
+
+
+def _instrument_get_many(fn: Callable) -> Callable:
+    """Count ``PointerTrie.get_many``, as a resolution per pointer."""
+
+    @functools.wraps(fn)
+    def wrapper(self, doc, *, default=resolver.MISSING):
+        start = time.perf_counter_ns() if _timing else 0
+        results = fn(self, doc, default=_UNRESOLVED)
+
+        for idx, pointer in enumerate(self.pointers):
+            parts = pointer.parts
+            _depths[len(parts)] += 1
+            if results[idx] is _UNRESOLVED:
+                nodes = _walked_miss(doc, parts)
+                if default is resolver.MISSING:
+                    results[idx] = resolver.miss(nodes, parts)
+                else:
+                    results[idx] = default
+
+        _record("resolve", start, len(self.pointers))
+        return results
+
+    return wrapper
+
+
+def _instrument_mutation(event: str, fn: Callable) -> Callable:
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if getattr(_local, "mutating", False):
+            # Made by another mutation, which counts it
+            return fn(*args, **kwargs)
+
+        start = time.perf_counter_ns() if _timing else 0
+        _local.mutating = True
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _local.mutating = False
+            _record(event, start)
+
+    return wrapper
+
+
+def _targets() -> Iterator[tuple[ModuleType | type, str, _Wrap]]:
+    """``(owner, attribute, wrap)`` of every instrumented function.
+
+    The resolver's private lookups are wrapped by name, as they're what it's public
+    functions call, so they have to be kept in step with it.
+    """
+    yield rfc6901_parser, "parse", lambda fn: _instrument("parse", fn)
+    yield resolver, "_lookup", lambda fn: _instrument(
+        "resolve", fn, lambda doc, parts: len(parts)
+    )
+    yield resolver, "resolve", lambda fn: _instrument(
+        "resolve", fn, lambda doc, p, **kw: len(p.parts)
+    )
+    yield resolver, "_find", _instrument_find
+    yield resolver.PointerTrie, "get_many", _instrument_get_many
+    for name in _MUTATIONS:
+        yield resolver, name, functools.partial(
+            _instrument_mutation, f"mutation.{name}"
+        )
+    yield patch, "apply_patch", functools.partial(
+        _instrument_mutation, "mutation.apply_patch"
+    )
+
+
+def enable(*, timing: bool = False, hook: Hook | None = None) -> None:
+    """Start counting, resets the counters if already enabled.
+
+    :param timing: Also total the time spent in each kind of call.
+    :param hook: Called on every event, e.g. to forward to a metrics system.
+    """
+    global _enabled, _timing, _hook
+
+    disable()
+    reset()
+    _enabled, _timing, _hook = True, timing, hook
+
+    for owner, name, wrap in _targets():
+        fn = getattr(owner, name)
+        _originals[owner, name] = fn
+        setattr(owner, name, wrap(fn))
+
+
+def disable() -> None:
+    """Stop counting, restoring the uninstrumented functions. Counters are kept."""
+    global _enabled, _hook
+
+    for (owner, name), fn in _originals.items():
+        setattr(owner, name, fn)
+    _originals.clear()
+    _enabled, _hook = False, None
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    """Zero every counter."""
+    for counter in (_calls, _time_ns, _depths, _misses):
+        counter.clear()
+    _cache_base.update(
+        (name, (info.hits, info.misses))
+        for name, info in pointer.parse_cache_info().items()
+    )
+
+
+def snapshot() -> dict[str, Any]:
+    """Counters since instrumentation was enabled (or reset), as plain dicts.
+
+    ``parse`` counts pointers actually parsed, ``parse_cache`` the hits / misses of
+    the :meth:`.JsonPointer.parse` intern cache, ``resolve`` resolutions, with a
+    histogram of their ``depth`` in parts, ``misses`` resolutions that failed, by
+    kind, and ``mutations`` calls per mutating function. ``time_ns`` totals are
+    only kept with ``timing=True``.
+    """
+
+    def calls(event: str) -> dict[str, int]:
+        stats = {"calls": _calls[event]}
+        if _timing:
+            stats["time_ns"] = _time_ns[event]
+        return stats
+
+    cache = {}
+    for name, info in pointer.parse_cache_info().items():
+        hits, misses = _cache_base.get(name, (0, 0))
+        cache[name] = {"hits": info.hits - hits, "misses": info.misses - misses}
+
+    mutations = {}
+    for event in _calls:
+        if event.startswith("mutation."):
+            mutations[event.removeprefix("mutation.")] = calls(event)
+
+    return {
+        "parse": calls("parse"),
+        "parse_cache": cache,
+        "resolve": calls("resolve"),
+        "depth": dict(sorted(_depths.items())),
+        "misses": dict(_misses),
+        "mutations": mutations,
+    }
@@ -0,0 +1,214 @@
+"""Resolve or patch large batches of JSON records across a pool of processes.
+
+Records are sent to workers as raw JSON (``bytes``), in batches, and are only
+parsed in the worker, so the parent process never builds or pickles document
+trees. Pointers are parsed once per worker, results come back in input order, and
+at most ``window`` batches are in flight at a time, so memory use is bounded
+however many records are streamed through.
+
+Failures are reported per record, a record that isn't valid JSON, or can't be
+patched, has it's exception in place of it's result, rather than stopping the
+batch.
+
+>>> records = [b'{"id": 1, "tags": ["a"]}', b'{"id": 2}', b'not json']
+>>> for result in map_get(["/id", "/tags/0"], records, workers=1, default=None):
+...     print(repr(result))
+[1, 'a']
+[2, None]
+JSONDecodeError('Expecting value: line 1 column 1 (char 0)')
+"""
+
+import collections
+import concurrent.futures
+import functools
+import itertools
+import json
+import os
+from typing import *
+
+from . import patch, resolver
+from .exceptions import JsonPointerException, ResolutionException
+from .patch import Operation
+from .pointer import JsonPointer
+from .resolver import JsonType
+
+DEFAULT_BATCH_SIZE = 1024
+"""Records sent to a worker at a time."""
+
+Record = bytes | str
+
+# Per worker process state, set once by the pool's initializer. Never set in the
+# calling process, where concurrent iterators would share it
+_trie: resolver.PointerTrie | None = None
+_default: Any = resolver.MISSING
+_ops_json: str = "[]"
+
+
+def _detach(e: Exception) -> Exception:
+    """Drop references to the document, so the exception pickles cheaply."""
+    if isinstance(e, ResolutionException):
+        e.doc_refs = None
+    return e
+
+
+def _init_get(pointers: Sequence[str | JsonPointer], default: Any) -> None:
+    global _trie, _default
+    _trie = resolver.PointerTrie(pointers)
+    _default = default
+
+
+def _get_batch(records: list[bytes]) -> list[list[JsonType] | Exception]:
+    return _get_batch_with(_trie, _default, records)
+
+
+def _get_batch_with(
+    trie: resolver.PointerTrie, default: Any, records: list[bytes]
+) -> list[list[JsonType] | Exception]:
+    results = []
+    for record in records:
+        try:
+            values = trie.get_many(json.loads(record), default=default)
+        except Exception as e:
+            results.append(_detach(e))
+            continue
+
+        if default is resolver.MISSING:
+            values = [_detach(v) if isinstance(v, Exception) else v for v in values]
+        results.append(values)
+    return results
+
+
+def _init_patch(ops_json: str) -> None:
+    global _ops_json
+    _ops_json = ops_json
+
+    # Warm the worker's pointer intern cache, so records don't parse them again
+    for op in json.loads(ops_json):
+        for key in ("path", "from"):
+            if isinstance(op.get(key), str):
+                JsonPointer.parse(op[key])
+
+
+def _patch_batch(records: list[bytes]) -> list[bytes | Exception]:
+    return _patch_batch_with(_ops_json, records)
+
+
+def _patch_batch_with(ops_json: str, records: list[bytes]) -> list[bytes | Exception]:
+    results = []
+    for record in records:
+        try:
+            # Fresh ops per record, as patched documents share the ops' values
+            doc = patch.apply_patch(json.loads(record), json.loads(ops_json))
+            results.append(json.dumps(doc).encode())
+        except Exception as e:
+            results.append(_detach(e))
+    return results
+
+
+def _batches(records: Iterable[Record], batch_size: int) -> Iterator[list[bytes]]:
+    records = (r.encode() if isinstance(r, str) else r for r in records)
+    while batch := list(itertools.islice(records, batch_size)):
+        yield batch
+
+
+def _map(
+    fn: Callable[[list[bytes]], list],
+    initializer: Callable[..., None],
+    initargs: tuple,
+    local: Callable[[list[bytes]], list],
+    records: Iterable[Record],
+    *,
+    workers: int | None,
+    batch_size: int,
+    window: int | None,
+) -> Iterator:
+    workers = workers or os.cpu_count() or 1
+    if workers < 1 or batch_size < 1:
+        raise JsonPointerException("workers and batch_size must be positive")
+
+    batches = _batches(records, batch_size)
+    if workers == 1:
+        for batch in batches:
+            yield from local(batch)
+        return
+
+    window = window or 2 * workers
+    pool = concurrent.futures.ProcessPoolExecutor(
+        workers, initializer=initializer, initargs=initargs
+    )
+    pending: collections.deque[concurrent.futures.Future] = collections.deque()
+    try:
+        for batch in batches:
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+            pending.append(pool.submit(fn, batch))
+
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def map_get(
+    pointers: Iterable[str | JsonPointer],
+    records: Iterable[Record],
+    *,
+    workers: int | None = None,
+    default: Any = resolver.MISSING,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    window: int | None = None,
+) -> Iterator[list[JsonType] | Exception]:
+    """Lazily yield the values of ``pointers`` in each raw JSON record, in order.
+
+    Each result is a list like :meth:`.PointerTrie.get_many` returns, or the
+    exception raised parsing the record.
+
+    :param workers: Processes to use, defaults to the number of CPUs, ``1`` runs in
+        this process.
+    :param default: Value for pointers that don't resolve, by default their
+        :exc:`.ResolutionException`.
+    :param batch_size: Records sent to a worker at a time.
+    :param window: Most batches in flight at once, defaults to twice ``workers``.
+    """
+    pointers = list(pointers)
+    return _map(
+        _get_batch,
+        _init_get,
+        (pointers, default),
+        functools.partial(_get_batch_with, resolver.PointerTrie(pointers), default),
+        records,
+        workers=workers,
+        batch_size=batch_size,
+        window=window,
+    )
+
+
+def map_patch(
+    ops: Iterable[Operation],
+    records: Iterable[Record],
+    *,
+    workers: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    window: int | None = None,
+) -> Iterator[bytes | Exception]:
+    """Lazily yield each raw JSON record patched with ``ops``, as raw JSON, in order.
+
+    Failed records yield the exception raised parsing them, or the
+    :exc:`.PatchException` :func:`.apply_patch` raised. See :func:`map_get` for the
+    other parameters.
+
+    >>> ops = [{"op": "add", "path": "/seen", "value": True}]
+    >>> list(map_patch(ops, ['{"id": 1}', '[]'], workers=1))
+    [b'{"id": 1, "seen": true}', PatchException('Patch operation 0 failed')]
+    """
+    ops_json = json.dumps(list(ops))
+    return _map(
+        _patch_batch,
+        _init_patch,
+        (ops_json,),
+        functools.partial(_patch_batch_with, ops_json),
+        records,
+        workers=workers,
+        batch_size=batch_size,
+        window=window,
+    )
@@ -0,0 +1,246 @@
+"""Implements RFC 6902 json patches. See `RFC 6902
+<https://www.rfc-editor.org/rfc/rfc6902>`_ for the specification.
+
+Patches are applied in place, and all or nothing. Every mutation is recorded in an
+undo log, if any operation fails (including a ``test``) the operations already
+applied are reverted, so the document never has to be copied up front.
+
+>>> doc = {"a": [1, 2], "b": {}}
+>>> apply_patch(doc, [
+...     {"op": "add", "path": "/a/-", "value": 3},
+...     {"op": "move", "from": "/a/0", "path": "/b/first"},
+...     {"op": "test", "path": "/a", "value": [2, 3]},
+... ])
+{'a': [2, 3], 'b': {'first': 1}}
+>>> apply_patch(doc, [
+...     {"op": "remove", "path": "/b"},
+...     {"op": "test", "path": "/a/0", "value": "nope"},
+... ])
+Traceback (most recent call last):
+fast_json_pointer.exceptions.PatchException: ...
+>>> doc
+{'a': [2, 3], 'b': {'first': 1}}
+"""
+
+import copy
+from typing import *
+
+from . import resolver, rfc6901_parser
+from .exceptions import PatchException
+from .pointer import JsonPointer
+from .resolver import JsonType
+
+Operation = Mapping[str, Any]
+
+_UndoLog = list[tuple[Callable[..., Any], ...]]
+
+_NUMBERS = (int, float)
+
+_ABSENT: Any = object()
+
+
+def json_equal(a: JsonType, b: JsonType, *, strict_numbers: bool = False) -> bool:
+    """Json equality, per RFC 6902 ``test``, unlike ``==`` where ``True == 1``.
+
+    Values of different json types are never equal, numbers are compared by value.
+    Returns at the first difference.
+
+    :param strict_numbers: Also tell ints from floats, so ``1`` isn't ``1.0``.
+
+    >>> json_equal({"a": [1, True]}, {"a": [1.0, True]})
+    True
+    >>> json_equal([1], [True]), json_equal(0, False)
+    (False, False)
+    >>> json_equal(1, 1.0, strict_numbers=True)
+    False
+    """
+    stack = [(a, b)]
+    while stack:
+        a, b = stack.pop()
+        if a is b:
+            continue
+
+        a_type, b_type = type(a), type(b)
+        if a_type is not b_type:
+            # `bool` isn't in `_NUMBERS`, as they're compared by exact type
+            if strict_numbers or a_type not in _NUMBERS or b_type not in _NUMBERS:
+                return False
+            if a != b:
+                return False
+        elif a_type is dict:
+            if len(a) != len(b):
+                return False
+            for key, value in a.items():
+                other = b.get(key, _ABSENT)
+                if other is _ABSENT:
+                    return False
+                stack.append((value, other))
+        elif a_type is list:
+            if len(a) != len(b):
+                return False
+            stack.extend(zip(a, b))
+        elif a != b:
+            return False
+    return True
+
+
+def _index(parent: list, part: str, *, end_ok: bool) -> int:
+    if end_ok and part == "-":
+        return len(parent)
+
+    if not rfc6901_parser.is_array_index(part):
+        raise PatchException(f"Invalid array index '{part}'")
+
+    idx = int(part)
+    if idx > len(parent) or (idx == len(parent) and not end_ok):
+        raise PatchException(f"Index '{part}' out of bounds")
+
+    return idx
+
+
+def _parent(doc: JsonType, pointer: JsonPointer) -> JsonType:
+    return resolver.get(doc, pointer.parent)
+
+
+def _add(doc: JsonType, pointer: JsonPointer, value: JsonType, undo: _UndoLog):
+    if not pointer.parts:
+        return value
+
+    parent, part = _parent(doc, pointer), pointer.parts[-1]
+    match parent:
+        case dict():
+            if part in parent:
+                undo.append((dict.__setitem__, parent, part, parent[part]))
+            else:
+                undo.append((dict.__delitem__, parent, part))
+            parent[part] = value
+        case list():
+            idx = _index(parent, part, end_ok=True)
+            parent.insert(idx, value)
+            undo.append((list.pop, parent, idx))
+        case _:
+            raise PatchException(f"Can't add to a '{type(parent).__name__}'")
+
+    return doc
+
+
+def _remove(doc: JsonType, pointer: JsonPointer, undo: _UndoLog) -> JsonType:
+    if not pointer.parts:
+        raise PatchException("Can't remove the document root")
+
+    parent, part = _parent(doc, pointer), pointer.parts[-1]
+    match parent:
+        case dict():
+            if part not in parent:
+                raise PatchException(f"Key '{part}' not in JSON object")
+            value = parent.pop(part)
+            undo.append((dict.__setitem__, parent, part, value))
+        case list():
+            idx = _index(parent, part, end_ok=False)
+            value = parent.pop(idx)
+            undo.append((list.insert, parent, idx, value))
+        case _:
+            raise PatchException(f"Can't remove from a '{type(parent).__name__}'")
+
+    return value
+
+
+def _replace(doc: JsonType, pointer: JsonPointer, value: JsonType, undo: _UndoLog):
+    if not pointer.parts:
+        return value
+
+    parent, part = _parent(doc, pointer), pointer.parts[-1]
+    match parent:
+        case dict():
+            if part not in parent:
+                raise PatchException(f"Key '{part}' not in JSON object")
+            undo.append((dict.__setitem__, parent, part, parent[part]))
+            parent[part] = value
+        case list():
+            idx = _index(parent, part, end_ok=False)
+            undo.append((list.__setitem__, parent, idx, parent[idx]))
+            parent[idx] = value
+        case _:
+            raise PatchException(f"Can't replace in a '{type(parent).__name__}'")
+
+    return doc
+
+
+def _apply(
+    doc: JsonType, op: Operation, parse: Callable[[str], JsonPointer], undo: _UndoLog
+) -> JsonType:
+    match op:
+        case {"op": "add", "path": str(path), "value": value}:
+            return _add(doc, parse(path), value, undo)
+
+        case {"op": "remove", "path": str(path)}:
+            _remove(doc, parse(path), undo)
+            return doc
+
+        case {"op": "replace", "path": str(path), "value": value}:
+            return _replace(doc, parse(path), value, undo)
+
+        case {"op": "move", "from": str(from_), "path": str(path)}:
+            from_pointer, pointer = parse(from_), parse(path)
+            if from_pointer == pointer:
+                return doc
+            if pointer.parts[: len(from_pointer.parts)] == from_pointer.parts:
+                raise PatchException("Can't move a value into one of it's children")
+
+            value = _remove(doc, from_pointer, undo)
+            return _add(doc, pointer, value, undo)
+
+        case {"op": "copy", "from": str(from_), "path": str(path)}:
+            value = copy.deepcopy(resolver.get(doc, parse(from_)))
+            return _add(doc, parse(path), value, undo)
+
+        case {"op": "test", "path": str(path), "value": value}:
+            if not json_equal(resolver.get(doc, parse(path)), value):
+                raise PatchException(f"Test failed, '{path}' isn't {value!r}")
+            return doc
+
+        case _:
+            raise PatchException(f"Invalid patch operation {op!r}")
+
+
+def _rollback(undo: _UndoLog) -> None:
+    for fn, *args in reversed(undo):
+        fn(*args)
+
+
+def apply_patch(doc: JsonType, ops: Iterable[Operation]) -> JsonType:
+    """Apply the RFC 6902 operations ``ops`` to ``doc``, in place.
+
+    Returns the patched document, which is only a different object than ``doc`` if
+    the root itself was replaced.
+
+    If an operation fails, every operation before it is reverted, and a
+    :exc:`.PatchException` chained to the cause is raised. Reverting restores
+    values, not the key order of objects values were removed from.
+
+    :raises: :exc:`.PatchException`: If any operation fails.
+
+    >>> apply_patch({"a": 1}, [{"op": "replace", "path": "", "value": [1]}])
+    [1]
+    >>> apply_patch([1, 2], [{"op": "copy", "from": "/0", "path": "/0"}])
+    [1, 1, 2]
+    """
+    # Pointers repeated within a patch are only parsed once
+    pointers: dict[str, JsonPointer] = {}
+
+    def parse(s: str) -> JsonPointer:
+        if (pointer := pointers.get(s)) is None:
+            pointer = pointers[s] = JsonPointer.parse(s)
+        return pointer
+
+    undo: _UndoLog = []
+    for op_index, op in enumerate(ops):
+        try:
+            doc = _apply(doc, op, parse, undo)
+        except Exception as e:
+            _rollback(undo)
+            raise PatchException(
+                f"Patch operation {op_index} failed", op_index=op_index
+            ) from e
+
+    return doc
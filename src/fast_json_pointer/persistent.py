@@ -0,0 +1,191 @@
+"""Persistent (copy-on-write) updates to json documents.
+
+Rather than mutating the document, updates return a new document, copying only the
+objects and arrays along the updated pointer's path, everything else is shared with
+the original. This makes each version O(depth x fan-out) to create, rather than
+O(document) for a ``copy.deepcopy`` before every in place update.
+
+>>> v1 = {"users": [{"name": "a"}, {"name": "b"}], "config": {"debug": False}}
+>>> v2 = assoc(v1, "/users/1/name", "c")
+>>> v1["users"][1]["name"], v2["users"][1]["name"]
+('b', 'c')
+>>> v2["config"] is v1["config"], v2["users"][0] is v1["users"][0]
+(True, True)
+
+Shared subtrees mean versions must be treated as immutable, mutating one in place
+may change others.
+"""
+
+import copy
+from typing import *
+
+from . import resolver, rfc6901_parser
+from .exceptions import JsonPointerException
+from .pointer import JsonPointer
+from .resolver import JsonType
+
+
+class _Remove:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "REMOVE"
+
+
+REMOVE: Any = _Remove()
+"""Value removing the pointer's value, rather than setting it, in :func:`batch`."""
+
+Update = tuple[str | JsonPointer, JsonType]
+
+
+def _parts(pointer: str | JsonPointer) -> tuple[str, ...]:
+    match pointer:
+        case str():
+            pointer = JsonPointer.parse(pointer)
+    return pointer.parts
+
+
+def _in_bounds(parent: list, part: str) -> bool:
+    return rfc6901_parser.is_array_index(part) and int(part) < len(parent)
+
+
+class _Batch:
+    """Copies containers the first time they're written to, containers it's copied
+    are owned by the batch, and are updated in place from then on."""
+
+    def __init__(self, doc: JsonType) -> None:
+        self.root = doc
+        # Keyed by id, values keep the copies (and so their ids) alive
+        self._owned: dict[int, dict | list] = {}
+
+    def _own(self, node: JsonType) -> dict | list | None:
+        """Batch's copy of the container ``node``, ``None`` if it isn't one."""
+        if id(node) in self._owned:
+            return node
+
+        if type(node) is dict or type(node) is list:
+            copied = node.copy()
+        elif isinstance(node, (dict, list)):
+            copied = copy.copy(node)
+        else:
+            return None
+
+        self._owned[id(copied)] = copied
+        return copied
+
+    def _path(self, parts: Sequence[str]) -> list[dict | list]:
+        """Own every container down to the parent of ``parts``, and return them.
+
+        :raises: :exc:`.ResolutionException`: If the parent doesn't resolve.
+        """
+        nodes = [self.root]
+        if (node := self._own(self.root)) is None:
+            raise resolver.miss(nodes, parts)
+        self.root = nodes[0] = node
+
+        for part in parts[:-1]:
+            child = resolver.step(node, part)
+            if child is resolver.MISSING:
+                raise resolver.miss(nodes, parts)
+            nodes.append(child)
+
+            if (owned := self._own(child)) is None:
+                raise resolver.miss(nodes, parts)
+            if owned is not child:
+                node[part if isinstance(node, dict) else int(part)] = owned
+            node = nodes[-1] = owned
+
+        return nodes
+
+    def assoc(self, parts: Sequence[str], value: JsonType) -> None:
+        if not parts:
+            self.root = value
+            return
+
+        nodes, part = self._path(parts), parts[-1]
+        parent = nodes[-1]
+        match parent:
+            case dict():
+                parent[part] = value
+            case list() if part == "-" or part == str(len(parent)):
+                parent.append(value)
+            case list() if _in_bounds(parent, part):
+                parent[int(part)] = value
+            case _:
+                raise resolver.miss(nodes, parts)
+
+    def dissoc(self, parts: Sequence[str]) -> None:
+        if not parts:
+            raise JsonPointerException("Can't remove the document root")
+
+        nodes, part = self._path(parts), parts[-1]
+        parent = nodes[-1]
+        match parent:
+            case dict() if part in parent:
+                del parent[part]
+            case list() if _in_bounds(parent, part):
+                del parent[int(part)]
+            case _:
+                raise resolver.miss(nodes, parts)
+
+
+def assoc(doc: JsonType, pointer: str | JsonPointer, value: JsonType) -> JsonType:
+    """New document with ``pointer`` set to ``value``, ``doc`` is left untouched.
+
+    Object members are added or replaced, array items are replaced, or appended if
+    the index is ``-`` or the array's length.
+
+    :raises: :exc:`.ResolutionException`: If ``pointer``'s parent doesn't resolve,
+        or it's index is out of the array's bounds.
+
+    >>> assoc({"a": [1]}, "/a/-", 2)
+    {'a': [1, 2]}
+    >>> assoc({"a": [1]}, "", None) is None
+    True
+    """
+    update = _Batch(doc)
+    update.assoc(_parts(pointer), value)
+    return update.root
+
+
+def dissoc(doc: JsonType, pointer: str | JsonPointer) -> JsonType:
+    """New document without the value at ``pointer``, ``doc`` is left untouched.
+
+    :raises: :exc:`.ResolutionException`: If ``pointer`` doesn't resolve.
+
+    >>> dissoc({"a": [1, 2, 3]}, "/a/1")
+    {'a': [1, 3]}
+    """
+    update = _Batch(doc)
+    update.dissoc(_parts(pointer))
+    return update.root
+
+
+def batch(doc: JsonType, updates: Iterable[Update] | Mapping[str, JsonType]) -> JsonType:
+    """New document with every ``(pointer, value)`` update applied, in order, ``doc``
+    is left untouched.
+
+    Each container is copied at most once per batch, however many updates go
+    through it. Values of :data:`REMOVE` remove the pointer's value, see
+    :func:`assoc` and :func:`dissoc`.
+
+    :raises: :exc:`.ResolutionException`: If any update doesn't resolve, against
+        the document as updated so far.
+
+    >>> v1 = {"a": {"x": 1, "y": 2}, "b": [0]}
+    >>> batch(v1, [("/a/x", 10), ("/a/y", REMOVE), ("/a/z", 3), ("/b/0", REMOVE)])
+    {'a': {'x': 10, 'z': 3}, 'b': []}
+    >>> v1
+    {'a': {'x': 1, 'y': 2}, 'b': [0]}
+    """
+    if isinstance(updates, Mapping):
+        updates = updates.items()
+
+    update = _Batch(doc)
+    for pointer, value in updates:
+        if value is REMOVE:
+            update.dissoc(_parts(pointer))
+        else:
+            update.assoc(_parts(pointer), value)
+
+    return update.root
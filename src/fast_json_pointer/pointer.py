@@ -1,42 +1,147 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import *
 
 from . import rel_parser, rfc6901_parser
+from .exceptions import JsonPointerException
+
+DEFAULT_PARSE_CACHE_SIZE = 4096
+"""Default number of parsed pointers kept (per pointer class) by the intern cache."""
+
+
+def _parse_pointer(cls: type[JsonPointer], s: str) -> JsonPointer:
+    return cls(parts=rfc6901_parser.parse(s))
+
+
+def _parse_rel_pointer(
+    cls: type[RelativeJsonPointer], s: str
+) -> RelativeJsonPointer:
+    offset, parts = rel_parser.parse(s)
+    return cls(
+        offset=offset, pointer=None if parts is None else JsonPointer(parts=parts)
+    )
+
+
+_parse_pointer_cached = functools.lru_cache(DEFAULT_PARSE_CACHE_SIZE)(_parse_pointer)
+_parse_rel_pointer_cached = functools.lru_cache(DEFAULT_PARSE_CACHE_SIZE)(
+    _parse_rel_pointer
+)
+
+
+def set_parse_cache_size(maxsize: int | None = DEFAULT_PARSE_CACHE_SIZE) -> None:
+    """Resize the ``parse`` intern caches, dropping everything cached so far.
+
+    ``maxsize=None`` makes the caches unbounded, ``maxsize=0`` disables caching.
+
+    >>> set_parse_cache_size(2)
+    >>> parse_cache_info()["JsonPointer"].maxsize
+    2
+    >>> set_parse_cache_size()
+    """
+    global _parse_pointer_cached, _parse_rel_pointer_cached
+
+    _parse_pointer_cached = functools.lru_cache(maxsize)(_parse_pointer)
+    _parse_rel_pointer_cached = functools.lru_cache(maxsize)(_parse_rel_pointer)
+
+
+def parse_cache_info() -> dict[str, functools._CacheInfo]:
+    """Hit / miss statistics of the ``parse`` intern caches, keyed by class name.
+
+    >>> clear_parse_cache()
+    >>> _ = JsonPointer.parse("/foo"), JsonPointer.parse("/foo")
+    >>> info = parse_cache_info()["JsonPointer"]
+    >>> info.hits, info.misses
+    (1, 1)
+    """
+    return {
+        "JsonPointer": _parse_pointer_cached.cache_info(),
+        "RelativeJsonPointer": _parse_rel_pointer_cached.cache_info(),
+    }
+
+
+def clear_parse_cache() -> None:
+    """Empty the ``parse`` intern caches and reset their statistics."""
+    _parse_pointer_cached.cache_clear()
+    _parse_rel_pointer_cached.cache_clear()
 
 
 class _ReprStrMixin:
+    __slots__ = ()
+
     def __repr__(self) -> str:
         # inner single quotes is consistent w/ how str.__repr__ works
         return f"{type(self).__name__}('{str(self)}')"
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, frozen=True, slots=True)
 class JsonPointer(_ReprStrMixin):
-    """Primitive dataclass for RFC 6901 json pointers.
+    """Primitive immutable dataclass for RFC 6901 json pointers.
 
     >>> JsonPointer(['~home', 'foo.txt', 'mime/type'])
     JsonPointer('/~0home/foo.txt/mime~1type')
     >>> JsonPointer.parse('/~0home/foo.txt/mime~1type')
     JsonPointer('/~0home/foo.txt/mime~1type')
+
+    Pointers are hashable, so they can be used as dict keys or set members.
+
+    >>> {JsonPointer(['a']): 1}[JsonPointer.parse('/a')]
+    1
     """
 
-    parts: list[str]
-    """Unescaped list of path parts.
-    
+    parts: tuple[str, ...]
+    """Unescaped tuple of path parts.
+
     >>> JsonPointer.parse("/data/items/0/id").parts
-    ['data', 'items', '0', 'id']
+    ('data', 'items', '0', 'id')
     """
 
+    def __post_init__(self) -> None:
+        if type(self.parts) is not tuple:
+            object.__setattr__(self, "parts", tuple(self.parts))
+
     def __str__(self) -> str:
         """Serialize to RFC 6901 json pointer."""
         return rfc6901_parser.unparse(self.parts)
 
     @classmethod
     def parse(cls, s: str) -> Self:
-        """Parse a serialized RFC 6901 json pointer."""
-        return cls(parts=rfc6901_parser.parse(s))
+        """Parse a serialized RFC 6901 json pointer.
+
+        Results are interned in a bounded LRU cache, see :func:`set_parse_cache_size`.
+
+        >>> JsonPointer.parse("/foo") is JsonPointer.parse("/foo")
+        True
+        """
+        return _parse_pointer_cached(cls, s)
+
+    @property
+    def parent(self) -> Self:
+        """Pointer to the containing object or array.
+
+        :raises: :exc:`.JsonPointerException`: If this is the root pointer.
+
+        >>> JsonPointer.parse("/data/items/0").parent
+        JsonPointer('/data/items')
+        >>> JsonPointer([]).parent
+        Traceback (most recent call last):
+        fast_json_pointer.exceptions.JsonPointerException: ...
+        """
+        if not self.parts:
+            raise JsonPointerException("Root json pointer has no parent")
+
+        return type(self)(self.parts[:-1])
+
+    def child(self, part: str | int) -> Self:
+        """Pointer to ``part`` below this pointer.
+
+        >>> JsonPointer.parse("/data/items").child(0)
+        JsonPointer('/data/items/0')
+        >>> JsonPointer([]).child("a/b")
+        JsonPointer('/a~1b')
+        """
+        return type(self)((*self.parts, str(part)))
 
     # I dediced against this, as it's nagged at me since I first wrote it that you should't
     # resolve JSON pointers w/o having a Doccument you're resolving them across.
@@ -61,9 +166,9 @@ class JsonPointer(_ReprStrMixin):
     #            return type(self)(parts=[*our_parts, *their_parts])
 
 
-@dataclass(repr=False)
-class RelativeJsonPointer((_ReprStrMixin)):
-    """Primitive data class for 2020-12 draft json pointers.
+@dataclass(repr=False, frozen=True, slots=True)
+class RelativeJsonPointer(_ReprStrMixin):
+    """Primitive immutable dataclass for 2020-12 draft json pointers.
 
     >>> RelativeJsonPointer(0, JsonPointer(['data', 'items']))
     RelativeJsonPointer('0/data/items')
@@ -77,11 +182,11 @@ class RelativeJsonPointer((_ReprStrMixin)):
     pointer: JsonPointer | None
 
     @property
-    def parts(self) -> list[str] | None:
-        """Unescaped list of path parts, if this isn't an index reference.
+    def parts(self) -> tuple[str, ...] | None:
+        """Unescaped tuple of path parts, if this isn't an index reference.
 
         >>> RelativeJsonPointer.parse("0/data/items/0/id").parts
-        ['data', 'items', '0', 'id']
+        ('data', 'items', '0', 'id')
         >>> RelativeJsonPointer.parse("0#").parts is None
         True
         """
@@ -105,8 +210,8 @@ class RelativeJsonPointer((_ReprStrMixin)):
 
     @classmethod
     def parse(cls, s: str) -> Self:
-        """Parse a serialized 2020-12 draft relative json pointer."""
-        offset, parts = rel_parser.parse(s)
-        return cls(
-            offset=offset, pointer=None if parts is None else JsonPointer(parts=parts)
-        )
+        """Parse a serialized 2020-12 draft relative json pointer.
+
+        Results are interned in a bounded LRU cache, see :func:`set_parse_cache_size`.
+        """
+        return _parse_rel_pointer_cached(cls, s)
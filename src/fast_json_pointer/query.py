@@ -0,0 +1,179 @@
+"""Wildcard queries over json documents.
+
+A query is written as a json pointer, but parts that are exactly ``*`` match any
+single key or index, and parts that are exactly ``**`` match any number (including
+zero) of keys or indexes. Queries are compiled once, and evaluated as a generator
+in a single, depth first traversal, memory use is proportional to the depth of the
+document, not the number of matches.
+
+>>> doc = {"items": [{"id": 1}, {"id": 2, "sub": {"id": 3}}]}
+>>> [(str(p), v) for p, v in iter_query(doc, "/items/*/id")]
+[('/items/0/id', 1), ('/items/1/id', 2)]
+>>> [str(p) for p, _ in iter_query(doc, "/**/id")]
+['/items/0/id', '/items/1/id', '/items/1/sub/id']
+
+Literal ``*`` / ``**`` keys can't be expressed in a query, use a plain
+:class:`.JsonPointer` to reach those.
+"""
+
+import functools
+from dataclasses import dataclass, field
+from typing import *
+
+from . import rfc6901_parser
+from .pointer import JsonPointer, _ReprStrMixin
+from .resolver import JsonType
+
+ANY = "*"
+"""Query part matching any single key or index."""
+
+DEEP = "**"
+"""Query part matching any number of keys or indexes."""
+
+_States = frozenset[int]
+
+
+@dataclass(repr=False, frozen=True, slots=True)
+class JsonQuery(_ReprStrMixin):
+    """Compiled wildcard query.
+
+    >>> JsonQuery.parse("/catalog/**/price")
+    JsonQuery('/catalog/**/price')
+    >>> JsonQuery.parse("/a/b").is_pointer
+    True
+    """
+
+    parts: tuple[str, ...]
+    """Unescaped tuple of path parts, including ``*`` / ``**`` wildcards."""
+
+    _transitions: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False, hash=False
+    )
+    """Memoized ``states -> (wildcard states, {key: states})``."""
+
+    def __post_init__(self) -> None:
+        if type(self.parts) is not tuple:
+            object.__setattr__(self, "parts", tuple(self.parts))
+
+    def __str__(self) -> str:
+        """Serialize to a json pointer like query string."""
+        return rfc6901_parser.unparse(self.parts)
+
+    @classmethod
+    def parse(cls, s: str) -> Self:
+        """Parse a query string, results are cached like :meth:`.JsonPointer.parse`."""
+        return _parse_query(cls, s)
+
+    @property
+    def is_pointer(self) -> bool:
+        """Whether the query has no wildcards, and so matches at most one value."""
+        return ANY not in self.parts and DEEP not in self.parts
+
+    def _closure(self, states: Iterable[int]) -> _States:
+        """Add the states reachable by having ``**`` match nothing."""
+        closed = set()
+        for state in states:
+            closed.add(state)
+            while state < len(self.parts) and self.parts[state] == DEEP:
+                state += 1
+                closed.add(state)
+        return frozenset(closed)
+
+    def _step(self, states: _States) -> tuple[_States, dict[str, _States]]:
+        """Transitions out of ``states``, states for any key, and for specific keys."""
+        if (cached := self._transitions.get(states)) is not None:
+            return cached
+
+        wild, keyed = set(), {}
+        for state in states:
+            if state == len(self.parts):
+                continue
+            match self.parts[state]:
+                case "**":
+                    wild.add(state)
+                case "*":
+                    wild.add(state + 1)
+                case part:
+                    keyed.setdefault(part, set()).add(state + 1)
+
+        result = (
+            self._closure(wild),
+            {key: self._closure(wild | next) for key, next in keyed.items()},
+        )
+        self._transitions[states] = result
+        return result
+
+    def _children(
+        self, doc: JsonType, states: _States
+    ) -> Iterator[tuple[str, JsonType, _States]]:
+        wild, keyed = self._step(states)
+
+        match doc:
+            case dict():
+                if wild:
+                    for key, child in doc.items():
+                        yield key, child, keyed.get(key, wild)
+                else:
+                    for key, next in keyed.items():
+                        if key in doc:
+                            yield key, doc[key], next
+
+            case list():
+                if wild:
+                    for idx, child in enumerate(doc):
+                        key = str(idx)
+                        yield key, child, keyed.get(key, wild)
+                else:
+                    for key, next in keyed.items():
+                        if rfc6901_parser.is_array_index(key) and int(key) < len(doc):
+                            yield key, doc[int(key)], next
+
+    def iter(self, doc: JsonType) -> Iterator[tuple[JsonPointer, JsonType]]:
+        """Lazily yield ``(pointer, value)`` for every match in ``doc``, in document
+        order. Each value is yielded once, even if the query matches it many ways.
+
+        >>> q = JsonQuery.parse("/**")
+        >>> [str(p) for p, _ in q.iter({"a": [True]})]
+        ['', '/a', '/a/0']
+        """
+        accept = len(self.parts)
+        states = self._closure([0])
+        if accept in states:
+            yield JsonPointer(()), doc
+
+        path: list[str] = []
+        stack = [self._children(doc, states)]
+        while stack:
+            for key, child, states in stack[-1]:
+                path.append(key)
+                if accept in states:
+                    yield JsonPointer(path), child
+                if isinstance(child, (dict, list)):
+                    stack.append(self._children(child, states))
+                else:
+                    path.pop()
+                    continue
+                break
+            else:
+                stack.pop()
+                if path:
+                    path.pop()
+
+
+@functools.lru_cache(1024)
+def _parse_query(cls: type[JsonQuery], s: str) -> JsonQuery:
+    return cls(rfc6901_parser.parse(s))
+
+
+def iter_query(
+    doc: JsonType, query: str | JsonQuery
+) -> Iterator[tuple[JsonPointer, JsonType]]:
+    """Lazily yield ``(pointer, value)`` for every match of ``query`` in ``doc``.
+
+    See :meth:`JsonQuery.iter`.
+    """
+    match query:
+        case str():
+            query = JsonQuery.parse(query)
+
+    return query.iter(doc)
@@ -3,13 +3,12 @@ pointer draft <https://json-schema.org/draft/2020-12/relative-json-pointer.html>
 the (draft) specification.
 """
 
-import re
 from typing import Iterable
 
 from . import rfc6901_parser
 from .exceptions import ParseException
 
-RE_NONNEG_INT = re.compile("0|[1-9][0-9]*")
+_DIGITS = "0123456789"
 
 
 def parse(s: str) -> tuple[int, list[str] | None]:
@@ -85,13 +84,17 @@ def parse(s: str) -> tuple[int, list[str] | None]:
     Traceback (most recent call last):
     fast_json_pointer.exceptions.ParseException: ...
     """
-    match = RE_NONNEG_INT.match(s)
+    rest = s.lstrip(_DIGITS)
+    digits = s[: len(s) - len(rest)]
 
-    if not match:
+    if not digits:
         raise ParseException("Relative json-pointer must begin with non-neg int")
 
-    offset = int(match.group())
-    rest = s[match.end() :]
+    if digits[0] == "0" and len(digits) > 1:
+        # Offsets can't have leading zeros, "01" is offset 0 followed by "1"
+        digits, rest = "0", s[1:]
+
+    offset = int(digits)
 
     if rest.startswith("#"):
         if len(rest) > 1:
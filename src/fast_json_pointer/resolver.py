@@ -1,11 +1,16 @@
 from dataclasses import dataclass, field
 from typing import *
 
-from .exceptions import EndOfArrayException, ResolutionException
+from . import access, rfc6901_parser
+from .exceptions import EndOfArrayException, JsonPointerException, ResolutionException
 from .pointer import JsonPointer, RelativeJsonPointer
 
 JsonType = dict[str, "JsonType"] | list["JsonType"] | str | bool | int | float | None
 
+MISSING: Any = object()
+"""Sentinel for values that aren't there, returned by :func:`step` on a miss, and the
+default of ``default`` parameters that raise when not given."""
+
 
 @dataclass
 class JsonRef:
@@ -25,6 +30,9 @@ def _resolve_ref(doc: JsonType, part: str) -> JsonType:
             if part == "-":
                 raise EndOfArrayException("Hit '-' (end of array) token")
 
+            if not rfc6901_parser.is_array_index(part):
+                raise ResolutionException(f"Invalid JSON array index '{part}'")
+
             part_idx = int(part)
             if part_idx >= len(doc):
                 raise ResolutionException(f"Index '{part_idx}' not in JSON array")
@@ -32,7 +40,15 @@ def _resolve_ref(doc: JsonType, part: str) -> JsonType:
             return doc[part_idx]
 
         case _:
-            raise ResolutionException(f"Unnvaigable doc type '{type(part)}'")
+            if (accessor := access.accessor_for(doc)) is None:
+                raise ResolutionException(f"Unnvaigable doc type '{type(doc)}'")
+
+            try:
+                return accessor.get(doc, part)
+            except LookupError as e:
+                raise ResolutionException(
+                    f"'{part}' not in '{type(doc).__name__}'"
+                ) from e
 
 
 def _resolve(doc: JsonType, pointer: JsonPointer, *, base_pointer: JsonPointer | None = None) -> list[JsonRef]:
@@ -55,6 +71,118 @@ def _resolve(doc: JsonType, pointer: JsonPointer, *, base_pointer: JsonPointer |
     return doc_refs
 
 
+def step(doc: JsonType, part: str) -> JsonType:
+    """Single non-raising step of :func:`_lookup`, returns :data:`MISSING` on a miss.
+
+    For modules resolving pointers their own way, with :func:`miss` to raise the
+    same exception :func:`get` does. Misses in plain json never raise (and allocate)
+    an exception internally, only misses in containers read through an
+    :class:`.Accessor` do. Other errors raised by an accessor aren't misses, and
+    propagate.
+
+    >>> step({'a': 1}, 'a'), step([1], '1') is MISSING
+    (1, True)
+    """
+    if type(doc) is dict:
+        return doc.get(part, MISSING)
+
+    if type(doc) is list:
+        if not rfc6901_parser.is_array_index(part):
+            return MISSING
+        idx = int(part)
+        return doc[idx] if idx < len(doc) else MISSING
+
+    if access.accessor_for(doc) is None:
+        return MISSING
+
+    try:
+        return _resolve_ref(doc, part)
+    except ResolutionException:
+        return MISSING
+
+
+def _walk(doc: JsonType, parts: Sequence[str]) -> list[JsonType]:
+    """Nodes from ``doc`` down along ``parts``, up to (not incl.) the first miss."""
+    nodes = [doc]
+    for part in parts:
+        doc = step(doc, part)
+        if doc is MISSING:
+            break
+        nodes.append(doc)
+    return nodes
+
+
+def _refs(
+    nodes: Sequence[JsonType],
+    parts: Sequence[str],
+    *,
+    base_pointer: JsonPointer | None = None,
+) -> list[JsonRef]:
+    doc_pointer = JsonPointer([]) if base_pointer is None else base_pointer
+    doc_refs = [JsonRef(nodes[0], doc_pointer)]
+    for node, part in zip(nodes[1:], parts):
+        doc_pointer = JsonPointer([*doc_pointer.parts, part])
+        doc_refs.append(JsonRef(node, doc_pointer))
+    return doc_refs
+
+
+def _trail(
+    doc: JsonType, parts: Sequence[str], *, base_pointer: JsonPointer | None = None
+) -> tuple[list[JsonRef], tuple[str, ...]]:
+    """Non-raising :func:`_resolve`, the refs resolved, and the parts that weren't.
+
+    >>> doc_refs, remaining = _trail({'a': [{'b': 1}]}, ['a', '0', 'c', 'd'])
+    >>> [str(ref.pointer) for ref in doc_refs], remaining
+    (['', '/a', '/a/0'], ('c', 'd'))
+    """
+    nodes = _walk(doc, parts)
+    doc_refs = _refs(nodes, parts, base_pointer=base_pointer)
+    return doc_refs, tuple(parts[len(nodes) - 1 :])
+
+
+def miss(nodes: list[JsonType], parts: Sequence[str]) -> ResolutionException:
+    """Exception for ``parts`` missing after resolving ``nodes``, the nodes along
+    ``parts`` up to the miss, starting at the document.
+
+    ``remaining`` is set up front, and ``doc_refs`` are built from ``nodes`` when
+    first accessed, so their pointers describe the miss even if the document has
+    since been changed (e.g. by a rolled back patch). Their ``doc`` s are the nodes
+    themselves, as they are at access time.
+    """
+    parts = tuple(parts)
+    return ResolutionException(
+        "Error resolving json pointer",
+        remaining=parts[len(nodes) - 1 :],
+        context=lambda: _refs(nodes, parts),
+    )
+
+
+def _lookup(doc: JsonType, parts: Sequence[str]) -> JsonType:
+    """Walk ``parts`` down from ``doc`` without building the :class:`JsonRef` trail.
+
+    Plain ``dict`` / ``list`` nodes are indexed directly, anything else falls back to
+    :func:`_resolve_ref`. On a miss the raised :exc:`.ResolutionException` gives the
+    same ancestor trail ``resolve`` does, but only builds it if it's asked for.
+
+    >>> _lookup({'a': [{'b': 1}]}, ['a', '0', 'b'])
+    1
+    >>> _lookup({'a': []}, ['a', '0'])
+    Traceback (most recent call last):
+    fast_json_pointer.exceptions.ResolutionException: ...
+    """
+    node = doc
+    try:
+        for part in parts:
+            if type(node) is dict:
+                node = node[part]
+            elif type(node) is list and rfc6901_parser.is_array_index(part):
+                node = node[int(part)]
+            else:
+                node = _resolve_ref(node, part)
+        return node
+    except (LookupError, ResolutionException) as e:
+        raise miss(_walk(doc, parts), parts) from e
+
 
 def resolve(
     doc: JsonType, pointer: JsonPointer, *, rel: RelativeJsonPointer | None = None
@@ -63,10 +191,16 @@ def resolve(
 
     if rel:
         if rel.offset > 0:
+            if rel.offset >= len(doc_refs):
+                raise ResolutionException(
+                    "Relative json pointer ascends past the document root",
+                    doc_refs=doc_refs,
+                    remaining=[],
+                )
             doc_refs = doc_refs[: -rel.offset]
 
         last_ref = doc_refs[-1]
-        
+
         if rel.is_index_ref:
             return doc_refs + [JsonRef(last_ref.pointer.parts[-1], last_ref.pointer)]
 
@@ -76,14 +210,16 @@ def resolve(
     return doc_refs
 
 
-
 def get(
     doc: JsonType,
     pointer: str | JsonPointer,
     *,
     rel: str | RelativeJsonPointer | None = None,
+    default: Any = MISSING,
 ) -> JsonType:
     """
+    Pass a ``default`` to have it returned for pointers that don't resolve, rather
+    than raising, without allocating an exception.
 
     >>> get({}, "")
     {}
@@ -109,6 +245,8 @@ def get(
     >>> get([{'x': {'': 3}}, 4], "/0/z")
     Traceback (most recent call last):
     fast_json_pointer.exceptions.ResolutionException: ...
+    >>> get([{'x': {'': 3}}, 4], "/0/z", default=None) is None
+    True
     """
     match pointer:
         case str():
@@ -118,11 +256,222 @@ def get(
         case str():
             rel = RelativeJsonPointer.parse(rel)
 
+    if default is not MISSING:
+        value = _find(doc, pointer, rel)
+        return default if value is MISSING else value
+
+    if rel is None:
+        return _lookup(doc, pointer.parts)
+
+    if rel.offset == 0 and not rel.is_index_ref:
+        return _lookup(doc, [*pointer.parts, *rel.pointer.parts])
+
+    # Ascending / index refs need the ancestor trail
     doc_refs = resolve(doc, pointer, rel=rel)
 
     return doc_refs[-1].doc
 
 
+def try_resolve(
+    doc: JsonType,
+    pointer: str | JsonPointer,
+    *,
+    rel: str | RelativeJsonPointer | None = None,
+) -> list[JsonRef] | None:
+    """Like :func:`resolve`, but returns ``None`` rather than raising on a miss.
+
+    >>> [ref.doc for ref in try_resolve({'x': [5]}, "/x/0")]
+    [{'x': [5]}, [5], 5]
+    >>> try_resolve({'x': [5]}, "/x/0", rel="3/y") is None
+    True
+    """
+    match pointer:
+        case str():
+            pointer = JsonPointer.parse(pointer)
+
+    match rel:
+        case str():
+            rel = RelativeJsonPointer.parse(rel)
+
+    doc_refs, remaining = _trail(doc, pointer.parts)
+    if remaining:
+        return None
+
+    if rel:
+        if rel.offset > 0:
+            if rel.offset >= len(doc_refs):
+                return None
+            doc_refs = doc_refs[: -rel.offset]
+
+        last_ref = doc_refs[-1]
+
+        if rel.is_index_ref:
+            if not last_ref.pointer.parts:
+                return None
+            return doc_refs + [JsonRef(last_ref.pointer.parts[-1], last_ref.pointer)]
+
+        new_refs, remaining = _trail(
+            last_ref.doc, rel.pointer.parts, base_pointer=last_ref.pointer
+        )
+        if remaining:
+            return None
+        doc_refs.extend(new_refs)
+
+    return doc_refs
+
+
+def _find(
+    doc: JsonType, pointer: JsonPointer, rel: RelativeJsonPointer | None
+) -> JsonType:
+    """Non-raising :func:`get`, returns ``MISSING`` on a miss."""
+    if rel is None:
+        parts = pointer.parts
+    elif rel.offset == 0 and not rel.is_index_ref:
+        parts = (*pointer.parts, *rel.pointer.parts)
+    else:
+        doc_refs = try_resolve(doc, pointer, rel=rel)
+        return MISSING if doc_refs is None else doc_refs[-1].doc
+
+    node = doc
+    for part in parts:
+        if type(node) is dict:
+            node = node.get(part, MISSING)
+        else:
+            node = step(node, part)
+        if node is MISSING:
+            break
+    return node
+
+
+def exists(
+    doc: JsonType,
+    pointer: str | JsonPointer,
+    *,
+    rel: str | RelativeJsonPointer | None = None,
+) -> bool:
+    """Whether ``pointer`` resolves in ``doc``, never raises on a miss.
+
+    >>> exists({'x': [None]}, "/x/0"), exists({'x': [None]}, "/x/1")
+    (True, False)
+    >>> exists({'x': [None]}, "/x/0", rel="1#")
+    True
+    """
+    match pointer:
+        case str():
+            pointer = JsonPointer.parse(pointer)
+
+    match rel:
+        case str():
+            rel = RelativeJsonPointer.parse(rel)
+
+    return _find(doc, pointer, rel) is not MISSING
+
+
+class PointerTrie:
+    """A fixed set of pointers, compiled into a prefix trie of their parts.
+
+    Shared prefixes are only walked once per document, and the trie can be reused
+    across documents.
+
+    >>> trie = PointerTrie(["/data/items/0/id", "/data/items/0/name", "/data/meta"])
+    >>> trie.get_many({"data": {"items": [{"id": 1, "name": "a"}], "meta": None}})
+    [1, 'a', None]
+    >>> trie.get_many({"data": {"items": []}}, default="?")
+    ['?', '?', '?']
+    """
+
+    __slots__ = ("pointers", "_root")
+
+    pointers: tuple[JsonPointer, ...]
+    """Parsed pointers, in the order results are returned."""
+
+    def __init__(self, pointers: Iterable[str | JsonPointer]) -> None:
+        self.pointers = tuple(
+            JsonPointer.parse(p) if isinstance(p, str) else p for p in pointers
+        )
+
+        # Build as nested `[terminals, {part: child}]` lists, then freeze to tuples
+        root: list = [[], {}]
+        for idx, pointer in enumerate(self.pointers):
+            node = root
+            for part in pointer.parts:
+                node = node[1].setdefault(part, [[], {}])
+            node[0].append(idx)
+
+        def freeze(node: list) -> tuple:
+            terminals, children = node
+            return (
+                tuple(terminals),
+                tuple((part, freeze(child)) for part, child in children.items()),
+            )
+
+        self._root = freeze(root)
+
+    def __len__(self) -> int:
+        return len(self.pointers)
+
+    def get_many(self, doc: JsonType, *, default: Any = MISSING) -> list[JsonType]:
+        """Resolve every pointer against ``doc``, in input order.
+
+        Missing pointers are filled with ``default`` if given, otherwise with the
+        :exc:`.ResolutionException` :func:`get` would have raised for them.
+
+        >>> trie = PointerTrie(["/x", "/y"])
+        >>> trie.get_many({"x": 1})
+        [1, ResolutionException('Error resolving json pointer')]
+        """
+        results = [MISSING] * len(self.pointers)
+        found = 0
+
+        stack = [(doc, self._root)]
+        while stack:
+            node, (terminals, children) = stack.pop()
+
+            for idx in terminals:
+                results[idx] = node
+            found += len(terminals)
+
+            for part, child in children:
+                child_doc = step(node, part)
+                if child_doc is not MISSING:
+                    stack.append((child_doc, child))
+
+        if found < len(results):
+            for idx, result in enumerate(results):
+                if result is MISSING:
+                    results[idx] = (
+                        self._error(doc, idx) if default is MISSING else default
+                    )
+
+        return results
+
+    def _error(self, doc: JsonType, idx: int) -> ResolutionException | JsonType:
+        try:
+            return _lookup(doc, self.pointers[idx].parts)
+        except ResolutionException as e:
+            return e
+
+
+def get_many(
+    doc: JsonType,
+    pointers: Iterable[str | JsonPointer] | PointerTrie,
+    *,
+    default: Any = MISSING,
+) -> list[JsonType]:
+    """Get many pointers out of one document, walking shared prefixes only once.
+
+    See :meth:`PointerTrie.get_many`, pass a :class:`PointerTrie` to reuse it across
+    documents.
+
+    >>> get_many({'a': {'b': 1, 'c': 2}}, ["/a/c", "/a/b", "/d"], default=None)
+    [2, 1, None]
+    """
+    if not isinstance(pointers, PointerTrie):
+        pointers = PointerTrie(pointers)
+
+    return pointers.get_many(doc, default=default)
+
+
 def _set_ref(doc: JsonType, part: str, value: JsonType) -> None:
     match doc:
         case dict():
@@ -131,7 +480,9 @@ def _set_ref(doc: JsonType, part: str, value: JsonType) -> None:
             part_idx = int(part)
             doc[part_idx] = value
         case _:
-            raise RuntimeError(f"Unnavigable type {type(doc)}")
+            if (accessor := access.accessor_for(doc)) is None:
+                raise RuntimeError(f"Unnavigable type {type(doc)}")
+            accessor.set(doc, part, value)
 
 
 def add(
@@ -215,7 +566,9 @@ def remove(doc, pointer: str | JsonPointer,  *, rel: str | RelativeJsonPointer |
         case list():
             del parent.doc[int(part)]
         case _:
-            raise RuntimeError()
+            if (accessor := access.accessor_for(parent.doc)) is None:
+                raise RuntimeError()
+            accessor.delete(parent.doc, part)
     
 
 def replace(doc, pointer: str | JsonPointer, value: JsonType, *, rel: str | RelativeJsonPointer | None = None) -> None:
@@ -246,7 +599,9 @@ def replace(doc, pointer: str | JsonPointer, value: JsonType, *, rel: str | Rela
         case list():
             parent.doc.insert(int(part), value)
         case _:
-            raise RuntimeError()
+            if (accessor := access.accessor_for(parent.doc)) is None:
+                raise RuntimeError()
+            accessor.set(parent.doc, part, value)
 
 
 def move(doc, from_: str | JsonPointer, pointer: str | JsonPointer, *, rel: str | RelativeJsonPointer | None = None, from_rel: str | RelativeJsonPointer | None = None) -> None:
@@ -280,4 +635,209 @@ def test(doc, pointer: str | JsonPointer, value: JsonType, *, rel: str | Relativ
     True
     '''
     obj = get(doc, pointer, rel=rel)
-    return obj == value
\ No newline at end of file
+    return obj == value
+
+_Updates = Iterable[tuple[str | JsonPointer, JsonType]] | Mapping[str, JsonType]
+_Group = tuple[tuple[str, ...], JsonType, list[tuple[str, Any]]]
+
+
+def _parse_updates(updates: _Updates) -> list[tuple[JsonPointer, JsonType]]:
+    if isinstance(updates, Mapping):
+        updates = updates.items()
+
+    return [
+        (JsonPointer.parse(p) if isinstance(p, str) else p, value)
+        for p, value in updates
+    ]
+
+
+def _check_overlap(pointers: Iterable[JsonPointer]) -> None:
+    seen = {pointer.parts for pointer in pointers}
+    for parts in seen:
+        for depth in range(len(parts)):
+            if parts[:depth] in seen:
+                raise JsonPointerException(
+                    f"'{JsonPointer(parts)}' is below '{JsonPointer(parts[:depth])}'"
+                )
+
+
+def _by_parent(doc: JsonType, items: list[tuple[JsonPointer, Any]]) -> list[_Group]:
+    """Group ``items`` by their pointer's parent, resolving each parent only once.
+
+    Every parent is resolved before anything is mutated, so pointers are relative to
+    the document as it was passed in.
+    """
+    groups: dict[tuple[str, ...], list[tuple[str, Any]]] = {}
+    for pointer, value in items:
+        if not pointer.parts:
+            raise JsonPointerException("Can't update the document root in place")
+        groups.setdefault(pointer.parts[:-1], []).append((pointer.parts[-1], value))
+
+    containers = PointerTrie(map(JsonPointer, groups)).get_many(doc)
+    for container in containers:
+        if isinstance(container, ResolutionException):
+            raise container
+
+    return list(zip(groups, containers, groups.values()))
+
+
+def _has_index(container: list, part: str, *, end_ok: bool) -> bool:
+    if not rfc6901_parser.is_array_index(part):
+        return False
+    return int(part) < len(container) + end_ok
+
+
+def _settable(container: JsonType, part: str) -> bool:
+    match container:
+        case dict():
+            return True
+        case list():
+            return part == "-" or _has_index(container, part, end_ok=False)
+    return False
+
+
+def _insertable(container: JsonType, part: str) -> bool:
+    match container:
+        case dict():
+            return True
+        case list():
+            return part == "-" or _has_index(container, part, end_ok=True)
+    return False
+
+
+def _removable(container: JsonType, part: str) -> bool:
+    match container:
+        case dict():
+            return part in container
+        case list():
+            return _has_index(container, part, end_ok=False)
+    return False
+
+
+def _check_members(
+    doc: JsonType, groups: list[_Group], valid: Callable[[JsonType, str], bool]
+) -> None:
+    """Raise the :func:`get` miss for the first member that isn't ``valid``."""
+    for parent, container, members in groups:
+        for part, _ in members:
+            if not valid(container, part):
+                _lookup(doc, (*parent, part))
+                raise ResolutionException(
+                    f"Can't update '{part}' in JSON value", remaining=(*parent, part)
+                )
+
+
+def set_many(doc: JsonType, updates: _Updates) -> None:
+    """Set many values at once, each parent is resolved once, and every pointer is
+    relative to ``doc`` as it was passed in.
+
+    Object members are added or replaced, array items are replaced, or appended if
+    the index is ``-``. The last of repeated pointers wins. Nothing is mutated if
+    any pointer fails.
+
+    :raises: :exc:`.ResolutionException`: If a pointer's parent doesn't resolve, or
+        it's index is out of bounds.
+    :raises: :exc:`.JsonPointerException`: If a pointer is the root, or below
+        another of the pointers.
+
+    >>> doc = {"a": [1, 2], "b": {}}
+    >>> set_many(doc, {"/a/0": 10, "/a/-": 3, "/b/c": True})
+    >>> doc
+    {'a': [10, 2, 3], 'b': {'c': True}}
+    """
+    items = _parse_updates(updates)
+    _check_overlap(pointer for pointer, _ in items)
+    groups = _by_parent(doc, items)
+    _check_members(doc, groups, _settable)
+
+    for _, container, members in groups:
+        if isinstance(container, dict):
+            container.update(members)
+            continue
+
+        for part, value in members:
+            if part == "-":
+                container.append(value)
+            else:
+                container[int(part)] = value
+
+
+def add_many(doc: JsonType, updates: _Updates) -> None:
+    """Add many values at once, with RFC 6902 ``add`` semantics, each parent is
+    resolved once, and every pointer is relative to ``doc`` as it was passed in.
+
+    Values are inserted before the item at their (original) index, in the order
+    given, so all the inserts into an array are done in a single pass. Nothing is
+    mutated if any pointer fails.
+
+    :raises: :exc:`.ResolutionException`: If a pointer's parent doesn't resolve, or
+        it's index is out of bounds.
+    :raises: :exc:`.JsonPointerException`: If a pointer is the root, or below
+        another of the pointers.
+
+    >>> doc = ["a", "b"]
+    >>> add_many(doc, [("/2", "end"), ("/0", "x"), ("/1", "y"), ("/0", "z")])
+    >>> doc
+    ['x', 'z', 'a', 'y', 'b', 'end']
+    """
+    items = _parse_updates(updates)
+    _check_overlap(pointer for pointer, _ in items)
+    groups = _by_parent(doc, items)
+    _check_members(doc, groups, _insertable)
+
+    for _, container, members in groups:
+        if isinstance(container, dict):
+            container.update(members)
+            continue
+
+        inserts: dict[int, list[JsonType]] = {}
+        for part, value in members:
+            idx = len(container) if part == "-" else int(part)
+            inserts.setdefault(idx, []).append(value)
+
+        merged, prev = [], 0
+        for idx in sorted(inserts):
+            merged.extend(container[prev:idx])
+            merged.extend(inserts[idx])
+            prev = idx
+        merged.extend(container[prev:])
+        container[:] = merged
+
+
+def remove_many(doc: JsonType, pointers: Iterable[str | JsonPointer]) -> None:
+    """Remove many values at once, each parent is resolved once, and every pointer
+    is relative to ``doc`` as it was passed in, so indexes don't need to be sorted.
+
+    Array items are removed in a single compaction pass per array. Repeated
+    pointers, and pointers below another removed pointer, are only removed once.
+    Nothing is mutated if any pointer fails.
+
+    :raises: :exc:`.ResolutionException`: If a pointer doesn't resolve.
+    :raises: :exc:`.JsonPointerException`: If a pointer is the root.
+
+    >>> doc = {"a": [0, 1, 2, 3, 4], "b": {"c": 1}, "d": 2}
+    >>> remove_many(doc, ["/a/1", "/a/3", "/a/1", "/b/c", "/b"])
+    >>> doc
+    {'a': [0, 2, 4], 'd': 2}
+    """
+    items = _parse_updates((pointer, None) for pointer in pointers)
+    removed = {pointer.parts for pointer, _ in items}
+    groups = _by_parent(doc, items)
+    _check_members(doc, groups, _removable)
+
+    for parent, container, members in groups:
+        # Anything below a removed pointer goes with it
+        if any(parent[:depth] in removed for depth in range(len(parent) + 1)):
+            continue
+
+        if isinstance(container, dict):
+            for part, _ in members:
+                container.pop(part, None)
+            continue
+
+        kept, prev = [], 0
+        for idx in sorted({int(part) for part, _ in members}):
+            kept.extend(container[prev:idx])
+            prev = idx + 1
+        kept.extend(container[prev:])
+        container[:] = kept
@@ -52,12 +52,55 @@ def parse(pointer: str) -> list[str]:
     >>> parse(r'/i\\j/g|h/k\l') # r-string avoids escaping backslashes
     ['i\\\\j', 'g|h', 'k\\l']
     """
-    validate(pointer)
+    if not pointer:
+        return []
 
-    parts = pointer.split("/")
-    # discard "empty" str, as "/foo/bar".split() becomes ["", "foo", "bar"]
-    parts.pop(0)
-    return [unescape(p) for p in parts]
+    if pointer[0] != "/":
+        raise ParseException("JSON pointers must be empty or start with '/'")
+
+    # Fast path, w/o escapes the parts are already unescaped
+    if "~" not in pointer:
+        return pointer[1:].split("/")
+
+    return _parse_escaped(pointer)
+
+
+def _parse_escaped(pointer: str) -> list[str]:
+    # Three passes, but each in C. Validating per part, and only unescaping parts
+    # with a `~`, wins on long pointers with a single escape, but is ~2x slower on
+    # pointers escaped throughout, so isn't worth it.
+    if match := RE_INVALID_ESCAPE.search(pointer):
+        raise ParseException("Found invalid escape {}".format(match.group()))
+
+    # Inlined `unescape`, `~` is unescaped last!
+    return [p.replace("~1", "/").replace("~0", "~") for p in pointer[1:].split("/")]
+
+
+def parse_many(pointers: Iterable[str]) -> list[list[str]]:
+    """Parse many json pointers, see :func:`parse`.
+
+    :raises: :exc:`.ParseException`: If any json pointer is invalid.
+
+    >>> parse_many(['', '/foo/0', '/m~0n'])
+    [[], ['foo', '0'], ['m~n']]
+    >>> parse_many(['/foo', 'bar'])
+    Traceback (most recent call last):
+    fast_json_pointer.exceptions.ParseException: ...
+    """
+    parsed = []
+    append = parsed.append
+
+    for pointer in pointers:
+        if not pointer:
+            append([])
+        elif pointer[0] != "/":
+            raise ParseException("JSON pointers must be empty or start with '/'")
+        elif "~" not in pointer:
+            append(pointer[1:].split("/"))
+        else:
+            append(_parse_escaped(pointer))
+
+    return parsed
 
 
 def unparse(parts: Iterable[str]) -> str:
@@ -79,6 +122,19 @@ def unparse(parts: Iterable[str]) -> str:
     return "".join("/" + escape(part) for part in parts)
 
 
+def is_array_index(part: str) -> bool:
+    """Whether a path part is a valid array index, per RFC 6901 ``array-index``.
+
+    >>> is_array_index("0"), is_array_index("12")
+    (True, True)
+    >>> is_array_index("01"), is_array_index("-"), is_array_index("-1")
+    (False, False, False)
+    >>> is_array_index("\u0663") # non-ascii digits don't count
+    False
+    """
+    return part.isascii() and part.isdigit() and (part == "0" or part[0] != "0")
+
+
 def escape(part: str) -> str:
     """Escape a path part.
 
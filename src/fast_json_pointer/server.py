@@ -0,0 +1,235 @@
+"""Serve pointer lookups and patches against documents kept loaded in memory.
+
+A :class:`DocumentServer` holds named documents, and answers newline delimited
+JSON requests over a unix domain socket, each connection handled concurrently by
+asyncio. Clients pay for one socket round trip per request, rather than for
+starting an interpreter and parsing the document.
+
+Requests are JSON objects, one per line, responses echo the request's ``id``::
+
+    {"op": "get", "doc": "config", "pointers": ["/a", "/b/0"], "id": 1}
+    {"results": [{"value": 1}, {"error": "ResolutionException: ..."}], "id": 1}
+
+    {"op": "patch", "doc": "config", "patch": [{"op": "remove", "path": "/a"}]}
+    {"ok": true}
+
+    {"op": "load", "doc": "other", "path": "other.json"}
+    {"ok": true}
+
+    {"op": "docs"}
+    {"docs": ["config", "other"]}
+
+Failed requests get ``{"error": "..."}`` back, patches are atomic, and as requests
+are handled one at a time on the event loop, never interleave with other
+requests. Loads are read off the event loop, and only from below the server's
+``root``, without one they're refused.
+
+The socket is only accessible by it's owner, anyone who can connect can read and
+change every served document.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import stat
+from typing import *
+
+from .cache import CachedDocument
+from .exceptions import JsonPointerException
+from .patch import Operation
+from .resolver import JsonType
+
+MAX_LINE = 1 << 26
+"""Longest request / response line, in bytes."""
+
+
+def _read(path: str | os.PathLike) -> CachedDocument:
+    with open(path, "rb") as fp:
+        return CachedDocument(json.load(fp))
+
+
+def _error(e: Exception) -> dict:
+    return {"error": f"{type(e).__name__}: {e}"}
+
+
+class DocumentServer:
+    """Named documents, and the request handlers serving them.
+
+    >>> server = DocumentServer({"config": {"a": [1, 2]}})
+    >>> server.handle({"op": "get", "doc": "config", "pointers": ["/a/1", "/b"]})
+    {'results': [{'value': 2}, {'error': 'ResolutionException: Error resolving json pointer'}]}
+
+    :param root: Directory ``load`` requests may read documents from, relative paths
+        are relative to it. ``None`` refuses all ``load`` requests.
+    """
+
+    def __init__(
+        self,
+        docs: Mapping[str, JsonType] | None = None,
+        *,
+        root: str | os.PathLike | None = None,
+    ) -> None:
+        self.docs = {name: CachedDocument(doc) for name, doc in (docs or {}).items()}
+        self.root = root
+
+    def load(self, name: str, path: str | os.PathLike) -> None:
+        """Load a document from any ``path``, unlike ``load`` requests."""
+        self.docs[name] = _read(path)
+
+    def _requested_path(self, path: str) -> str:
+        """``path`` of a ``load`` request, resolved, if it's below :attr:`root`."""
+        if self.root is None:
+            raise JsonPointerException("Server has no root to load documents from")
+
+        root = os.path.realpath(self.root)
+        resolved = os.path.realpath(os.path.join(root, path))
+        if os.path.commonpath([root, resolved]) != root:
+            raise JsonPointerException(f"'{path}' is outside the server's root")
+        return resolved
+
+    def _doc(self, name: str) -> CachedDocument:
+        if name not in self.docs:
+            raise JsonPointerException(f"No document named '{name}'")
+        return self.docs[name]
+
+    def handle(self, request: Any) -> dict:
+        """Response to one request, raises for invalid requests."""
+        match request:
+            case {"op": "get", "doc": str(name), "pointers": list(pointers)}:
+                doc, results = self._doc(name), []
+                for pointer in pointers:
+                    try:
+                        results.append({"value": doc.get(pointer)})
+                    except JsonPointerException as e:
+                        results.append(_error(e))
+                return {"results": results}
+
+            case {"op": "patch", "doc": str(name), "patch": list(ops)}:
+                self._doc(name).patch(ops)
+                return {"ok": True}
+
+            case {"op": "load", "doc": str(name), "path": str(path)}:
+                self.docs[name] = _read(self._requested_path(path))
+                return {"ok": True}
+
+            case {"op": "docs"}:
+                return {"docs": sorted(self.docs)}
+
+            case _:
+                raise JsonPointerException(f"Invalid request {request!r}")
+
+    async def _handle(self, request: Any) -> dict:
+        match request:
+            case {"op": "load", "doc": str(name), "path": str(path)}:
+                # Parsing could take a while, don't block other connections on it
+                doc = await asyncio.to_thread(_read, self._requested_path(path))
+                self.docs[name] = doc
+                return {"ok": True}
+        return self.handle(request)
+
+    async def _connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while line := await reader.readline():
+                request = None
+                try:
+                    request = json.loads(line)
+                    response = await self._handle(request)
+                except Exception as e:
+                    response = _error(e)
+
+                if isinstance(request, dict) and "id" in request:
+                    response["id"] = request["id"]
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, ValueError):  # incl. over long lines
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, path: str | os.PathLike) -> None:
+        """Serve on a unix socket at ``path`` until cancelled.
+
+        A stale socket left at ``path`` is replaced, anything else there is an error.
+        The socket is only accessible by it's owner.
+        """
+        path = os.fspath(path)
+        try:
+            if stat.S_ISSOCK(os.stat(path).st_mode):
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+        # Restrict the socket before listening, so there's no window to connect in
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(path)
+            os.chmod(path, 0o600)
+        except OSError:
+            sock.close()
+            raise
+        server = await asyncio.start_unix_server(
+            self._connection, sock=sock, limit=MAX_LINE
+        )
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            os.unlink(path)
+
+
+class Client:
+    """Blocking client of a :class:`DocumentServer`.
+
+    :raises: :exc:`.JsonPointerException`: From any method, if the server responds
+        with an error.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._sock.connect(os.fspath(path))
+        except OSError:
+            self._sock.close()
+            raise
+        self._file = self._sock.makefile("rwb")
+
+    def close(self) -> None:
+        self._file.close()
+        self._sock.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def request(self, request: dict) -> dict:
+        self._file.write(json.dumps(request).encode() + b"\n")
+        self._file.flush()
+
+        line = self._file.readline()
+        if not line:
+            raise JsonPointerException("Server closed the connection")
+
+        response = json.loads(line)
+        if "error" in response:
+            raise JsonPointerException(response["error"])
+        return response
+
+    def get(self, doc: str, pointers: Iterable[str]) -> list[dict]:
+        """``{"value": ...}`` or ``{"error": "..."}`` for each pointer, in order."""
+        request = {"op": "get", "doc": doc, "pointers": [str(p) for p in pointers]}
+        return self.request(request)["results"]
+
+    def patch(self, doc: str, ops: Iterable[Operation]) -> None:
+        self.request({"op": "patch", "doc": doc, "patch": list(ops)})
+
+    def load(self, doc: str, path: str | os.PathLike) -> None:
+        """Load ``path``, relative to the server's root, as ``doc``."""
+        self.request({"op": "load", "doc": doc, "path": os.fspath(path)})
+
+    def docs(self) -> list[str]:
+        return self.request({"op": "docs"})["docs"]
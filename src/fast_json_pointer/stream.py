@@ -0,0 +1,291 @@
+"""Resolve json pointers directly against raw (UTF-8) JSON, without parsing it.
+
+The input is scanned once, front to back, subtrees that aren't on the pointer's path
+are skipped over without being built, and only the targeted value is decoded. Inputs
+are assumed to be well formed JSON, the scanner doesn't validate what it skips.
+
+In memory inputs can be anything supporting the buffer protocol (``bytes``,
+``memoryview``, ``mmap``, ...), and are never copied, file objects are either
+memory mapped, or read incrementally if they can't be.
+
+>>> raw = b'{"skip": [1, {"a": "}"}], "data": {"m~n": [10, {"a/b": true}]}}'
+>>> get_from_bytes(raw, "/data/m~0n/1/a~1b")
+True
+>>> get_from_bytes(memoryview(raw), "/skip/1")
+{'a': '}'}
+>>> get_from_bytes(raw, "/data/nope")
+Traceback (most recent call last):
+fast_json_pointer.exceptions.ResolutionException: ...
+"""
+
+import io
+import json
+import mmap
+import os
+import re
+from typing import *
+
+from . import rfc6901_parser
+from .exceptions import ResolutionException
+from .pointer import JsonPointer
+from .resolver import JsonType
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+"""Bytes read at a time from streams that can't be memory mapped."""
+
+_WS = re.compile(rb"[ \t\n\r]*")
+_STRING_TAIL = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# Complete strings are skipped in the same search, a lone `"` means the string
+# continues past the end of the buffer
+_STRUCTURAL = re.compile(rb'[\[\]{}]|"(?:[^"\\]*(?:\\.[^"\\]*)*")?', re.DOTALL)
+_SCALAR = re.compile(rb"[-+.0-9a-zA-Z]+")
+
+_QUOTE, _BACKSLASH, _COMMA, _COLON = b'"\\,:'
+_LBRACE, _RBRACE, _LBRACKET, _RBRACKET = b"{}[]"
+
+
+class Scanner:
+    """Cursor over raw JSON, ``read`` refills the buffer when scanning streams.
+
+    Used by the lookups here, and to build :class:`.SpanIndex` files. When
+    refilling, everything before ``pos`` (or ``keep``, if set) is dropped.
+    """
+
+    def __init__(
+        self, buf: Any, read: Callable[[int], bytes] | None = None, chunk_size: int = 0
+    ) -> None:
+        self.buf = buf
+        self.pos = 0
+        self.base = 0
+        """Absolute offset of ``buf[0]`` in the input."""
+        self.keep: int | None = None
+        self._read = read
+        self._chunk_size = chunk_size
+
+    @property
+    def offset(self) -> int:
+        """Absolute offset of ``pos`` in the input."""
+        return self.base + self.pos
+
+    def fill(self) -> bool:
+        """Read more input, returns ``False`` at EOF."""
+        if self._read is None:
+            return False
+
+        chunk = self._read(self._chunk_size)
+        if not chunk:
+            return False
+
+        drop = self.pos if self.keep is None else self.keep
+        self.buf = self.buf[drop:] + chunk
+        self.base += drop
+        self.pos -= drop
+        if self.keep is not None:
+            self.keep = 0
+
+        return True
+
+    def _match(self, pattern: re.Pattern, *, partial_ok: bool) -> re.Match:
+        while True:
+            match = pattern.match(self.buf, self.pos)
+            if match is not None and (match.end() < len(self.buf) or partial_ok):
+                return match
+            if not self.fill():
+                if match is None:
+                    raise ValueError(f"Malformed JSON at byte {self.offset}")
+                return match
+
+    def skip_ws(self) -> None:
+        self.pos = self._match(_WS, partial_ok=False).end()
+
+    def peek(self) -> int:
+        """Next non-whitespace byte, without consuming it."""
+        self.skip_ws()
+        if self.pos >= len(self.buf):
+            raise ValueError("Unexpected end of JSON input")
+        return self.buf[self.pos]
+
+    def expect(self, byte: int) -> None:
+        if self.peek() != byte:
+            raise ValueError(f"Expected {chr(byte)!r} at byte {self.offset}")
+        self.pos += 1
+
+    def skip_string(self) -> tuple[int, int]:
+        """Skip a string (after it's opening quote), returns span of it's content."""
+        start = self.offset
+        self.pos = self._match(_STRING_TAIL, partial_ok=True).end()
+        # `fill` may have shifted the buffer under us
+        return start - self.base, self.pos - 1
+
+    def read_key(self) -> str:
+        """Read an object key, the leading ``"`` must already be consumed."""
+        start, end = self.skip_string()
+        raw = bytes(self.buf[start:end])
+        if _BACKSLASH in raw:
+            return json.loads(b'"' + raw + b'"')
+        return raw.decode("utf-8")
+
+    def skip_value(self) -> None:
+        match self.peek():
+            case 0x22:  # "
+                self.pos += 1
+                self.skip_string()
+            case 0x7B | 0x5B:  # { [
+                self._skip_container()
+            case _:
+                self.pos = self._match(_SCALAR, partial_ok=False).end()
+
+    def _skip_container(self) -> None:
+        depth = 0
+        while True:
+            match = _STRUCTURAL.search(self.buf, self.pos)
+            if match is None:
+                self.pos = len(self.buf)
+                if not self.fill():
+                    raise ValueError("Unexpected end of JSON input")
+                continue
+
+            self.pos = match.end()
+            match self.buf[match.start()]:
+                case 0x22:
+                    if match.end() - match.start() == 1:
+                        self.skip_string()
+                case 0x7B | 0x5B:
+                    depth += 1
+                case _:
+                    depth -= 1
+                    if depth == 0:
+                        return
+
+    def next_member(self, first: bool) -> str | None:
+        """Advance to the next key of the current object, ``None`` at it's end."""
+        c = self.peek()
+        if c == _RBRACE:
+            self.pos += 1
+            return None
+        if not first:
+            self.expect(_COMMA)
+        self.expect(_QUOTE)
+        key = self.read_key()
+        self.expect(_COLON)
+        return key
+
+    def next_item(self, first: bool) -> bool:
+        """Advance to the next item of the current array, ``False`` at it's end."""
+        c = self.peek()
+        if c == _RBRACKET:
+            self.pos += 1
+            return False
+        if not first:
+            self.expect(_COMMA)
+        return True
+
+    def value(self) -> JsonType:
+        """Decode the value at the cursor, only copying it's bytes."""
+        self.skip_ws()
+        self.keep = self.pos
+        try:
+            self.skip_value()
+            return json.loads(bytes(self.buf[self.keep : self.pos]))
+        finally:
+            self.keep = None
+
+
+def _seek(scanner: Scanner, pointer: JsonPointer) -> None:
+    """Move ``scanner`` to the start of the value ``pointer`` references."""
+    parts = pointer.parts
+    for idx, part in enumerate(parts):
+        match scanner.peek():
+            case 0x7B:  # {
+                scanner.pos += 1
+                first = True
+                while (key := scanner.next_member(first)) is not None:
+                    if key == part:
+                        break
+                    scanner.skip_value()
+                    first = False
+                else:
+                    raise ResolutionException(
+                        f"Key '{part}' not in JSON object", remaining=parts[idx:]
+                    )
+
+            case 0x5B if rfc6901_parser.is_array_index(part):  # [
+                scanner.pos += 1
+                for item_idx in range(int(part) + 1):
+                    if not scanner.next_item(item_idx == 0):
+                        raise ResolutionException(
+                            f"Index '{part}' not in JSON array", remaining=parts[idx:]
+                        )
+                    if item_idx < int(part):
+                        scanner.skip_value()
+
+            case _:
+                raise ResolutionException(
+                    f"Can't resolve '{part}' in JSON value", remaining=parts[idx:]
+                )
+
+
+def _parse(pointer: str | JsonPointer) -> JsonPointer:
+    match pointer:
+        case str():
+            return JsonPointer.parse(pointer)
+    return pointer
+
+
+def get_from_bytes(buf: Any, pointer: str | JsonPointer) -> JsonType:
+    """Get the value ``pointer`` references in the raw JSON document ``buf``.
+
+    :raises: :exc:`.ResolutionException`: If ``pointer`` doesn't resolve.
+
+    >>> get_from_bytes(b'[0, "a", {"b": null}]', "/2/b") is None
+    True
+    >>> get_from_bytes(b' "whole doc" ', "")
+    'whole doc'
+    """
+    scanner = Scanner(buf)
+    _seek(scanner, _parse(pointer))
+    return scanner.value()
+
+
+def get_from_stream(
+    stream: BinaryIO,
+    pointer: str | JsonPointer,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> JsonType:
+    """Get the value ``pointer`` references, reading ``stream`` incrementally.
+
+    At most one chunk plus the targeted value is held in memory, and ``stream`` is
+    only read up to the end of the targeted value.
+
+    >>> get_from_stream(io.BytesIO(b'{"a": [1, 2, 3]}'), "/a/1", chunk_size=2)
+    2
+    """
+    scanner = Scanner(b"", stream.read, chunk_size)
+    scanner.fill()
+    _seek(scanner, _parse(pointer))
+    return scanner.value()
+
+
+def get_from_file(
+    file: str | os.PathLike | BinaryIO,
+    pointer: str | JsonPointer,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> JsonType:
+    """Get the value ``pointer`` references in a JSON file.
+
+    Regular files are memory mapped, anything else (pipes, sockets, ``BytesIO``, ...)
+    falls back to :func:`get_from_stream`.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as fp:
+            return get_from_file(fp, pointer, chunk_size=chunk_size)
+
+    try:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # incl. io.UnsupportedOperation
+        return get_from_stream(file, pointer, chunk_size=chunk_size)
+
+    with mapped:
+        return get_from_bytes(mapped, pointer)
@@ -0,0 +1,319 @@
+"""A json document shared between threads, locked by pointer prefix.
+
+A :class:`ConcurrentDocument` takes hierarchical read / write locks on only the
+pointers an operation touches, with intention locks on their ancestors, so readers
+and writers of disjoint subtrees never wait for each other. Writers lock the value
+they replace, or for inserts / removals that shift array items, the array.
+
+Locks are always taken in the same (pointer) order, so any number of them can be
+held without deadlocking, and :meth:`~ConcurrentDocument.patch` applies a whole
+RFC 6902 patch atomically, under the locks of all it's operations. Waiters are
+granted locks first come first served, so writers aren't starved by readers.
+
+>>> shared = ConcurrentDocument({"jobs": {"a": {"state": "queued"}}, "done": []})
+>>> shared.patch([
+...     {"op": "replace", "path": "/jobs/a/state", "value": "done"},
+...     {"op": "add", "path": "/done/-", "value": "a"},
+... ])
+>>> shared.get("/jobs/a/state"), shared.get("/done")
+('done', ['a'])
+
+Locks only cover operations made through the document, values returned by
+:meth:`~ConcurrentDocument.get` are the document's own, so containers should only
+be read or changed in place while their pointer is :meth:`~ConcurrentDocument.locked`.
+"""
+
+import collections
+import contextlib
+import functools
+import threading
+from typing import *
+
+from . import patch, resolver, rfc6901_parser
+from .exceptions import ParseException
+from .patch import Operation
+from .pointer import JsonPointer
+from .resolver import JsonType
+
+_Parts = tuple[str, ...]
+
+# Multiple granularity lock modes, intention shared / exclusive, shared, exclusive
+_IS, _IX, _S, _X = range(4)
+
+_CONFLICTS = ((_X,), (_S, _X), (_IX, _X), (_IS, _IX, _S, _X))
+"""Modes held by others, that each mode has to wait for."""
+
+_COMBINED = (
+    (_IS, _IX, _S, _X),
+    (_IX, _IX, _X, _X),  # shared + intention exclusive escalates to exclusive
+    (_S, _X, _S, _X),
+    (_X, _X, _X, _X),
+)
+"""Weakest mode granting both of two modes."""
+
+_Lock = tuple[_Parts, int]
+
+
+def _parts(pointer: str | JsonPointer) -> _Parts:
+    match pointer:
+        case str():
+            pointer = JsonPointer.parse(pointer)
+    return pointer.parts
+
+
+def _write_target(op: str, parts: _Parts) -> _Parts:
+    """What an ``add`` / ``remove`` of ``parts`` has to lock.
+
+    Array items shift, so inserts / removals lock the whole array, parts that could
+    be array indexes are assumed to be.
+    """
+    if op in ("add", "remove") and parts[-1:] and (
+        parts[-1] == "-" or rfc6901_parser.is_array_index(parts[-1])
+    ):
+        return parts[:-1]
+    return parts
+
+
+def _op_targets(op: Operation) -> list[_Lock]:
+    """Locks taken for a patch operation, the root's for unrecognised ones.
+
+    :raises: :exc:`.ParseException`: If one of it's pointers is malformed.
+    """
+    match op:
+        case {"op": "add" | "remove" | "replace" as name, "path": str(path)}:
+            return [(_write_target(name, _parts(path)), _X)]
+        case {"op": "move", "from": str(from_), "path": str(path)}:
+            return [
+                (_write_target("remove", _parts(from_)), _X),
+                (_write_target("add", _parts(path)), _X),
+            ]
+        case {"op": "copy", "from": str(from_), "path": str(path)}:
+            return [(_parts(from_), _S), (_write_target("add", _parts(path)), _X)]
+        case {"op": "test", "path": str(path)}:
+            return [(_parts(path), _S)]
+        case _:
+            return [((), _X)]
+
+
+@functools.lru_cache(maxsize=4096)
+def _plan_one(parts: _Parts, mode: int) -> tuple[_Lock, ...]:
+    # Ancestors already sort before their descendants
+    intention = _IX if mode == _X else _IS
+    return (*((parts[:depth], intention) for depth in range(len(parts))), (parts, mode))
+
+
+def _plan(targets: Sequence[_Lock]) -> Sequence[_Lock]:
+    """Locks for ``targets``, with intention locks on their ancestors, merged per
+    pointer, in acquisition (pointer) order."""
+    if len(targets) == 1:
+        return _plan_one(*targets[0])
+
+    modes: dict[_Parts, int] = {}
+    for parts, mode in targets:
+        for lock, lock_mode in _plan_one(parts, mode):
+            held = modes.get(lock)
+            modes[lock] = lock_mode if held is None else _COMBINED[held][lock_mode]
+    return sorted(modes.items())
+
+
+_STRIPES = 64
+"""Mutexes the lock table is sharded over."""
+
+
+def _grantable(node: list, mode: int) -> bool:
+    for conflict in _CONFLICTS[mode]:
+        if node[conflict]:
+            return False
+    return True
+
+
+class _LockTable:
+    """Multiple granularity locks, on pointers, created as they're needed.
+
+    Each lock is a ``[IS, IX, S, X, queue, condition]`` list, of the counts of each
+    mode held, and once it's contended, a FIFO queue of ``[mode, granted]`` tickets
+    waiting for it, and a condition to wait on. Requests queue behind any waiting
+    ticket, so a stream of readers can't starve a writer, and compatible tickets at
+    the head of the queue are granted together.
+
+    Locks are sharded over striped mutexes, by pointer, which are only held while
+    locks are granted / released, never while they're held. Ancestors every
+    operation takes an intention lock on, like the root, still share a stripe.
+    """
+
+    def __init__(self, stripes: int = _STRIPES) -> None:
+        self._stripes = [(threading.Lock(), {}) for _ in range(stripes)]
+
+    def _stripe(self, parts: _Parts) -> tuple[threading.Lock, dict[_Parts, list]]:
+        return self._stripes[hash(parts) % len(self._stripes)]
+
+    def acquire(self, locks: Sequence[_Lock]) -> None:
+        acquired = 0
+        try:
+            for parts, mode in locks:
+                mutex, nodes = self._stripe(parts)
+                with mutex:
+                    node = nodes.get(parts)
+                    if node is None:
+                        node = nodes[parts] = [0, 0, 0, 0, None, None]
+                    elif node[4] or not _grantable(node, mode):
+                        self._wait(mutex, nodes, parts, node, mode)
+                        acquired += 1
+                        continue
+                    node[mode] += 1
+                acquired += 1
+        except BaseException:
+            self.release(locks[:acquired])
+            raise
+
+    def _wait(
+        self,
+        mutex: threading.Lock,
+        nodes: dict[_Parts, list],
+        parts: _Parts,
+        node: list,
+        mode: int,
+    ) -> None:
+        """Queue for ``node``, returns once it's been granted, with ``mutex`` held."""
+        if node[4] is None:
+            node[4] = collections.deque()
+            node[5] = threading.Condition(mutex)
+
+        ticket = [mode, False]
+        node[4].append(ticket)
+        try:
+            while not ticket[1]:
+                node[5].wait()
+        except BaseException:
+            if ticket[1]:
+                node[mode] -= 1
+            else:
+                node[4].remove(ticket)
+            self._grant(node)
+            if not node[4] and not (node[0] or node[1] or node[2] or node[3]):
+                del nodes[parts]
+            raise
+
+    @staticmethod
+    def _grant(node: list) -> None:
+        """Grant the compatible tickets at the head of ``node``'s queue."""
+        queue, granted = node[4], False
+        while queue and _grantable(node, queue[0][0]):
+            ticket = queue.popleft()
+            node[ticket[0]] += 1
+            ticket[1] = granted = True
+        if granted:
+            node[5].notify_all()
+
+    def release(self, locks: Sequence[_Lock]) -> None:
+        for parts, mode in locks:
+            mutex, nodes = self._stripe(parts)
+            with mutex:
+                node = nodes[parts]
+                node[mode] -= 1
+                if node[4]:
+                    self._grant(node)
+                elif not (node[0] or node[1] or node[2] or node[3]):
+                    del nodes[parts]
+
+
+class ConcurrentDocument:
+    """A json document, who's operations lock only the pointers they touch.
+
+    Mutations follow RFC 6902 semantics, see :func:`.apply_patch`.
+    """
+
+    def __init__(self, doc: JsonType) -> None:
+        self._doc = doc
+        self._locks = _LockTable()
+
+    @property
+    def doc(self) -> JsonType:
+        """The document, unlocked, which may be replaced by mutating it's root."""
+        return self._doc
+
+    @contextlib.contextmanager
+    def _holding(self, targets: Sequence[_Lock]) -> Iterator[None]:
+        locks = _plan(targets)
+        self._locks.acquire(locks)
+        try:
+            yield
+        finally:
+            self._locks.release(locks)
+
+    @contextlib.contextmanager
+    def locked(
+        self, pointer: str | JsonPointer, *, write: bool = False
+    ) -> Iterator[JsonType]:
+        """Lock the value at ``pointer`` for the ``with`` block, and give it.
+
+        The value can be read while locked, and with ``write``, changed in place, but
+        not replaced. Locks aren't reentrant, the block mustn't use the document's
+        other methods on pointers overlapping ``pointer``.
+
+        >>> shared = ConcurrentDocument({"counters": {"a": 0}})
+        >>> with shared.locked("/counters", write=True) as counters:
+        ...     counters["a"] += 1
+        >>> shared.get("/counters/a")
+        1
+
+        :raises: :exc:`.ResolutionException`: If ``pointer`` doesn't resolve.
+        """
+        with self._holding([(_parts(pointer), _X if write else _S)]):
+            yield resolver.get(self._doc, pointer)
+
+    def get(
+        self, pointer: str | JsonPointer, *, default: Any = resolver.MISSING
+    ) -> JsonType:
+        """Get the value at ``pointer``, see :func:`.resolver.get`.
+
+        :raises: :exc:`.ResolutionException`: If ``pointer`` doesn't resolve, and no
+            ``default`` is given.
+        """
+        # Hot path, so w/o the context manager
+        locks = _plan([(_parts(pointer), _S)])
+        self._locks.acquire(locks)
+        try:
+            return resolver.get(self._doc, pointer, default=default)
+        finally:
+            self._locks.release(locks)
+
+    def exists(self, pointer: str | JsonPointer) -> bool:
+        with self._holding([(_parts(pointer), _S)]):
+            return resolver.exists(self._doc, pointer)
+
+    def patch(self, ops: Iterable[Operation]) -> None:
+        """Apply RFC 6902 operations, see :func:`.apply_patch`, as one transaction.
+
+        The locks of every operation are taken up front, so other threads see either
+        none, or all of the patch.
+
+        :raises: :exc:`.PatchException`: If any operation fails, the document is left
+            as it was.
+        """
+        ops = list(ops)
+        targets: list[_Lock] = []
+        for op in ops:
+            try:
+                targets.extend(_op_targets(op))
+            except ParseException:
+                # Let apply_patch report it, under the document's root lock
+                targets.append(((), _X))
+
+        with self._holding(targets):
+            self._doc = patch.apply_patch(self._doc, ops)
+
+    def add(self, pointer: str | JsonPointer, value: JsonType) -> None:
+        self.patch([{"op": "add", "path": str(pointer), "value": value}])
+
+    def remove(self, pointer: str | JsonPointer) -> None:
+        self.patch([{"op": "remove", "path": str(pointer)}])
+
+    def replace(self, pointer: str | JsonPointer, value: JsonType) -> None:
+        self.patch([{"op": "replace", "path": str(pointer), "value": value}])
+
+    def move(self, from_: str | JsonPointer, pointer: str | JsonPointer) -> None:
+        self.patch([{"op": "move", "from": str(from_), "path": str(pointer)}])
+
+    def copy(self, from_: str | JsonPointer, pointer: str | JsonPointer) -> None:
+        self.patch([{"op": "copy", "from": str(from_), "path": str(pointer)}])
@@ -0,0 +1,186 @@
+"""Reverse index of a json document, from scalar values to the pointers holding them.
+
+A :class:`ValueIndex` walks it's document once, and answers "which pointers hold
+this value" with a single dict lookup, rather than a scan of the whole tree.
+Mutations made through it re-index only the values they could have moved, those at
+or below the mutated pointer, and for array inserts / removals, those in the later
+items of the array, who's indexes shift.
+
+>>> index = ValueIndex({"users": [{"id": "u1"}, {"id": "u2"}], "owner": "u2"})
+>>> sorted(map(str, index.find("u2")))
+['/owner', '/users/1/id']
+>>> index.remove("/users/0")
+>>> sorted(map(str, index.find("u2"))), index.find("u1")
+(['/owner', '/users/0/id'], frozenset())
+
+Values are matched by json equality, so ``1`` and ``1.0`` are the same value, but
+``true`` and ``1`` aren't. Mutating the document other than through the
+:class:`ValueIndex` leaves the index stale, until it's :meth:`~ValueIndex.rebuild`.
+"""
+
+import collections
+from typing import *
+
+from . import patch, resolver, rfc6901_parser
+from .patch import Operation
+from .pointer import JsonPointer
+from .resolver import JsonType
+
+_Parts = tuple[str, ...]
+_Key = tuple[bool, Hashable]
+
+# `(parts, shifts)`, a value a mutation can change, and if it's an array item,
+# whether the later items of the array shift too
+_Region = tuple[_Parts, bool]
+
+_ABSENT: Any = object()
+
+
+def _key(value: JsonType) -> _Key:
+    # `True == 1` in python, but not in json
+    return type(value) is bool, value
+
+
+def _parts(pointer: str | JsonPointer) -> _Parts:
+    match pointer:
+        case str():
+            pointer = JsonPointer.parse(pointer)
+    return pointer.parts
+
+
+def _leaves(parts: _Parts, value: JsonType) -> Iterator[tuple[_Key, _Parts]]:
+    """``(key, parts)`` of every hashable scalar at or below ``parts``."""
+    stack = [(parts, value)]
+    while stack:
+        parts, value = stack.pop()
+        if type(value) is dict:
+            stack.extend(((*parts, k), v) for k, v in value.items())
+        elif type(value) is list:
+            stack.extend(((*parts, str(i)), v) for i, v in enumerate(value))
+        else:
+            key = _key(value)
+            try:
+                hash(key)
+            except TypeError:
+                continue
+            yield key, parts
+
+
+class ValueIndex:
+    """A json document, with a value to pointers index kept in sync with it's
+    mutations.
+
+    Mutations follow RFC 6902 semantics, see :func:`.apply_patch`.
+    """
+
+    def __init__(self, doc: JsonType) -> None:
+        self._doc = doc
+        self._index: dict[_Key, set[JsonPointer]] = collections.defaultdict(set)
+        self.rebuild()
+
+    @property
+    def doc(self) -> JsonType:
+        """The document, which may be replaced by mutating it's root."""
+        return self._doc
+
+    def rebuild(self) -> None:
+        """Re-index the whole document, after mutating it other than through the
+        index."""
+        self._index.clear()
+        for key, parts in _leaves((), self._doc):
+            self._index[key].add(JsonPointer(parts))
+
+    def __len__(self) -> int:
+        """Number of distinct values indexed."""
+        return len(self._index)
+
+    def __contains__(self, value: JsonType) -> bool:
+        return self.count(value) > 0
+
+    def find(self, value: JsonType) -> frozenset[JsonPointer]:
+        """Pointers holding ``value``, empty for values that are never indexed, like
+        containers.
+
+        >>> sorted(map(str, ValueIndex([True, 1, 1.0, "1"]).find(1)))
+        ['/1', '/2']
+        """
+        try:
+            pointers = self._index.get(_key(value))
+        except TypeError:
+            return frozenset()
+        return frozenset(pointers or ())
+
+    def count(self, value: JsonType) -> int:
+        """Number of pointers holding ``value``."""
+        try:
+            pointers = self._index.get(_key(value))
+        except TypeError:
+            return 0
+        return len(pointers or ())
+
+    def _region(self, pointer: str | JsonPointer, *, shifts: bool) -> _Region:
+        parts = _parts(pointer)
+        if parts and parts[-1] == "-":
+            # Pin the end of the array to an index, as it moves once the array grows
+            container = resolver.get(self._doc, JsonPointer(parts[:-1]), default=None)
+            if type(container) is list:
+                parts = (*parts[:-1], str(len(container)))
+        return parts, shifts
+
+    def _entries(self, regions: Iterable[_Region]) -> set[tuple[_Key, _Parts]]:
+        entries = set()
+        for parts, shifts in regions:
+            if not parts:
+                entries.update(_leaves((), self._doc))
+                continue
+
+            *parent, part = parts
+            container = resolver.get(self._doc, JsonPointer(parent), default=None)
+            if (
+                type(container) is list
+                and shifts
+                and rfc6901_parser.is_array_index(part)
+            ):
+                for idx in range(int(part), len(container)):
+                    entries.update(_leaves((*parent, str(idx)), container[idx]))
+            else:
+                value = resolver.get(container, JsonPointer([part]), default=_ABSENT)
+                if value is not _ABSENT:
+                    entries.update(_leaves(parts, value))
+        return entries
+
+    def _mutate(self, op: Operation, regions: list[_Region]) -> None:
+        before = self._entries(regions)
+        self._doc = patch.apply_patch(self._doc, [op])
+        after = self._entries(regions)
+
+        for key, parts in before - after:
+            pointers = self._index[key]
+            pointers.discard(JsonPointer(parts))
+            if not pointers:
+                del self._index[key]
+        for key, parts in after - before:
+            self._index[key].add(JsonPointer(parts))
+
+    def add(self, pointer: str | JsonPointer, value: JsonType) -> None:
+        region = self._region(pointer, shifts=True)
+        self._mutate({"op": "add", "path": str(pointer), "value": value}, [region])
+
+    def remove(self, pointer: str | JsonPointer) -> None:
+        region = self._region(pointer, shifts=True)
+        self._mutate({"op": "remove", "path": str(pointer)}, [region])
+
+    def replace(self, pointer: str | JsonPointer, value: JsonType) -> None:
+        region = self._region(pointer, shifts=False)
+        self._mutate({"op": "replace", "path": str(pointer), "value": value}, [region])
+
+    def move(self, from_: str | JsonPointer, pointer: str | JsonPointer) -> None:
+        regions = [
+            self._region(from_, shifts=True),
+            self._region(pointer, shifts=True),
+        ]
+        self._mutate({"op": "move", "from": str(from_), "path": str(pointer)}, regions)
+
+    def copy(self, from_: str | JsonPointer, pointer: str | JsonPointer) -> None:
+        region = self._region(pointer, shifts=True)
+        self._mutate({"op": "copy", "from": str(from_), "path": str(pointer)}, [region])
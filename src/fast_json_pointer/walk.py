@@ -0,0 +1,125 @@
+"""Lazily enumerate every value in a json document, with it's pointer.
+
+The walk uses an explicit stack, so deep documents don't hit the recursion limit,
+and iterates containers in place, so large arrays aren't buffered. Pointers are
+yielded as :class:`LazyPointer` s, which only hold their last part and a link to
+their parent, siblings share their parent, and the full pointer is only built when
+asked for.
+
+>>> doc = {"a": [1, {"b": None}], "c": {}}
+>>> [(str(p), v) for p, v in iter_pointers(doc, leaves_only=True)]
+[('/a/0', 1), ('/a/1/b', None), ('/c', {})]
+"""
+
+from typing import *
+
+from . import rfc6901_parser
+from .pointer import JsonPointer, _ReprStrMixin
+from .resolver import JsonType
+
+
+class LazyPointer(_ReprStrMixin):
+    """A json pointer, stored as it's last part and a link to it's parent.
+
+    >>> child = LazyPointer(LazyPointer(LazyPointer(), "a"), "0")
+    >>> child
+    LazyPointer('/a/0')
+    >>> child.depth, child.part, child.parts
+    (2, '0', ('a', '0'))
+    >>> child.to_pointer()
+    JsonPointer('/a/0')
+    """
+
+    __slots__ = ("parent", "part", "depth")
+
+    parent: "LazyPointer | None"
+    """Pointer to the containing value, ``None`` for the root."""
+
+    part: str | None
+    """Key or index of this value in it's parent, ``None`` for the root."""
+
+    depth: int
+    """Number of parts, ``0`` for the root."""
+
+    def __init__(self, parent: "LazyPointer | None" = None, part: str | None = None):
+        self.parent = parent
+        self.part = part
+        self.depth = 0 if parent is None else parent.depth + 1
+
+    @property
+    def parts(self) -> tuple[str, ...]:
+        """Unescaped tuple of path parts, built by walking up the parents."""
+        parts = [None] * self.depth
+        node = self
+        for idx in reversed(range(self.depth)):
+            parts[idx] = node.part
+            node = node.parent
+        return tuple(parts)
+
+    def to_pointer(self) -> JsonPointer:
+        return JsonPointer(self.parts)
+
+    def __str__(self) -> str:
+        """Serialize to RFC 6901 json pointer."""
+        return rfc6901_parser.unparse(self.parts)
+
+
+def _items(doc: dict | list) -> Iterator[tuple[str, JsonType]]:
+    if isinstance(doc, dict):
+        return iter(doc.items())
+    return zip(map(str, range(len(doc))), doc)
+
+
+def iter_pointers(
+    doc: JsonType,
+    *,
+    max_depth: int | None = None,
+    leaves_only: bool = False,
+    prune: Callable[[LazyPointer, JsonType], bool] | None = None,
+) -> Iterator[tuple[LazyPointer, JsonType]]:
+    """Yield ``(pointer, value)`` for every value in ``doc``, depth first, in document
+    order, starting with the root.
+
+    :param max_depth: Don't descend below values this many parts deep.
+    :param leaves_only: Only yield values that aren't descended into, scalars, empty
+        containers, and containers at ``max_depth``.
+    :param prune: Called with every value before it's yielded, returning ``True``
+        skips the value, and everything below it.
+
+    >>> doc = {"a": {"b": {"c": 1}}, "skip": [1, 2]}
+    >>> [str(p) for p, _ in iter_pointers(doc, max_depth=2)]
+    ['', '/a', '/a/b', '/skip', '/skip/0', '/skip/1']
+    >>> prune = lambda p, v: p.part == "skip"
+    >>> [str(p) for p, _ in iter_pointers(doc, leaves_only=True, prune=prune)]
+    ['/a/b/c']
+    """
+    root = LazyPointer()
+    if prune is not None and prune(root, doc):
+        return
+
+    descend = isinstance(doc, (dict, list)) and doc and max_depth != 0
+    if not (leaves_only and descend):
+        yield root, doc
+    if not descend:
+        return
+
+    stack = [(root, _items(doc))]
+    while stack:
+        parent, items = stack[-1]
+        for part, child in items:
+            pointer = LazyPointer(parent, part)
+            if prune is not None and prune(pointer, child):
+                continue
+
+            descend = (
+                isinstance(child, (dict, list))
+                and child
+                and (max_depth is None or pointer.depth < max_depth)
+            )
+            if not (leaves_only and descend):
+                yield pointer, child
+            if descend:
+                stack.append((pointer, _items(child)))
+                break
+        else:
+            stack.pop()
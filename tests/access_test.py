@@ -0,0 +1,160 @@
+import collections
+import doctest
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import pytest
+
+from fast_json_pointer import resolver
+from fast_json_pointer import access
+from fast_json_pointer.access import (
+    Accessor,
+    AttributeAccessor,
+    MappingAccessor,
+    accessor_for,
+    register_accessor,
+    unregister_accessor,
+)
+from fast_json_pointer.exceptions import ResolutionException
+
+
+class LazyMapping(collections.abc.Mapping):
+    """Builds values on access, like a shelve / sqlite backed proxy would."""
+
+    def __init__(self, keys):
+        self._keys = keys
+        self.loads = []
+
+    def __getitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+        self.loads.append(key)
+        return {"key": key}
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+
+def test_resolves_without_conversion():
+    lazy = LazyMapping(["a", "b", "c"])
+    doc = MappingProxyType({"rows": (lazy,)})
+
+    assert resolver.get(doc, "/rows/0/b/key") == "b"
+    assert resolver.get_many(doc, ["/rows/0/c/key", "/rows/1"], default=None) == [
+        "c",
+        None,
+    ]
+    assert lazy.loads == ["b", "c"]
+
+    for pointer in ["/rows/0/z", "/rows/-", "/rows/01", "/rows/0/a/key/x"]:
+        with pytest.raises(ResolutionException):
+            resolver.get(doc, pointer)
+
+
+class FailingMapping(LazyMapping):
+    """A proxy whose backing store is broken, rather than missing keys."""
+
+    def __getitem__(self, key):
+        raise RuntimeError("backing store unavailable")
+
+
+def test_accessor_errors_arent_misses():
+    doc = {"rows": [FailingMapping(["a"])]}
+
+    for pointer in ["/rows/0/a", "/rows/0/a/b"]:
+        with pytest.raises(RuntimeError):
+            resolver.get(doc, pointer)
+        with pytest.raises(RuntimeError):
+            resolver.get(doc, pointer, default=None)
+        with pytest.raises(RuntimeError):
+            resolver.exists(doc, pointer)
+        with pytest.raises(RuntimeError):
+            resolver.get_many(doc, [pointer], default=None)
+
+
+def test_accessor_misses_chain_their_cause():
+    doc = {"rows": [LazyMapping(["a"])]}
+
+    with pytest.raises(ResolutionException) as info:
+        resolver.get(doc, "/rows/0/z")
+    assert isinstance(info.value.__cause__, ResolutionException)
+    assert isinstance(info.value.__cause__.__cause__, KeyError)
+
+    with pytest.raises(ResolutionException) as info:
+        resolver.get(doc, "/rows/1")
+    assert isinstance(info.value.__cause__, IndexError)
+
+
+def test_mutates_mutable_containers():
+    doc = collections.UserDict({"items": collections.UserList([1, 2])})
+
+    resolver.add(doc, "/new", 1)
+    resolver.replace(doc, "/items/0", 10)
+    resolver.remove(doc, "/items/1")
+    assert doc == {"new": 1, "items": [10]}
+
+    with pytest.raises(TypeError):
+        resolver.add(MappingProxyType({}), "/x", 1)
+
+
+def test_registered_types():
+    @dataclass
+    class Struct:
+        a: dict
+        _private: int = 0
+
+    register_accessor(Struct, AttributeAccessor())
+    doc = [Struct({"b": 1})]
+
+    assert resolver.get(doc, "/0/a/b") == 1
+    for pointer in ["/0/_private", "/0/__class__", "/0/missing"]:
+        with pytest.raises(ResolutionException):
+            resolver.get(doc, pointer)
+
+    resolver.add(doc, "/0/a", {"b": 2})
+    assert doc[0].a == {"b": 2}
+
+    # Registrations follow subclasses, and can be overridden
+    class Sub(Struct):
+        pass
+
+    assert isinstance(accessor_for(Sub({})), AttributeAccessor)
+    register_accessor(Sub, None)
+    with pytest.raises(ResolutionException):
+        resolver.get([Sub({})], "/0/a")
+    assert isinstance(accessor_for({}), MappingAccessor)
+
+    # Unregistering falls back to the bases' registrations
+    unregister_accessor(Sub)
+    assert resolver.get([Sub({"b": 3})], "/0/a/b") == 3
+    unregister_accessor(Struct)
+    assert accessor_for(Struct({})) is None
+    assert isinstance(accessor_for(MappingProxyType({})), MappingAccessor)
+
+    with pytest.raises(KeyError):
+        unregister_accessor(Struct)
+
+
+def test_accessor_requires_get():
+    class NoGet(Accessor):
+        pass
+
+    with pytest.raises(TypeError):
+        NoGet()
+
+    class Getter(Accessor):
+        def get(self, node, part):
+            return part
+
+    with pytest.raises(TypeError):
+        Getter().set({}, "a", 1)
+
+
+def test_module_doctest_unregisters():
+    flags = doctest.NORMALIZE_WHITESPACE | doctest.IGNORE_EXCEPTION_DETAIL
+    failures, _ = doctest.testmod(access, optionflags=flags)
+    assert not failures
+    assert all(cls.__name__ != "Point" for cls in access._registered)
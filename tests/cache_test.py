@@ -0,0 +1,102 @@
+import copy
+import random
+
+import pytest
+
+from fast_json_pointer import JsonPointer, resolver
+from fast_json_pointer.cache import CachedDocument
+from fast_json_pointer.exceptions import PatchException, ResolutionException
+from fast_json_pointer.patch import apply_patch
+from fast_json_pointer.walk import iter_pointers
+
+DOC = {"a": [{"x": 1}, {"x": 2}, {"x": 3}], "b": {"c": {"d": 4}, "e": [5, 6]}, "0": 7}
+
+
+def _random_op(rng, doc):
+    pointers = [str(p) for p, _ in iter_pointers(doc)][1:]
+    path = rng.choice(pointers)
+    match rng.choice(["add", "remove", "replace", "move", "copy"]):
+        case "add":
+            return {"op": "add", "path": path, "value": rng.random()}
+        case "remove":
+            return {"op": "remove", "path": path}
+        case "replace":
+            return {"op": "replace", "path": path, "value": {"x": rng.random()}}
+        case op:
+            return {"op": op, "from": rng.choice(pointers), "path": path}
+
+
+@pytest.mark.parametrize("maxsize", [2, 4096])
+def test_consistent_through_mutations(maxsize):
+    rng = random.Random(maxsize)
+    for _ in range(50):
+        plain = copy.deepcopy(DOC)
+        cached = CachedDocument(copy.deepcopy(DOC), maxsize=maxsize)
+
+        for _ in range(10):
+            pointers = [p for p, _ in iter_pointers(plain)]
+            for pointer in rng.sample(pointers, min(len(pointers), 5)):
+                assert cached.get(pointer.to_pointer()) == resolver.get(
+                    plain, pointer.to_pointer()
+                )
+
+            if not isinstance(plain, (dict, list)) or not plain:
+                break
+            op = _random_op(rng, plain)
+            try:
+                plain = apply_patch(plain, [op])
+            except PatchException:
+                with pytest.raises(PatchException):
+                    cached.patch([copy.deepcopy(op)])
+            else:
+                cached.patch([copy.deepcopy(op)])
+            assert cached.doc == plain
+            assert cached.cache_info().currsize <= maxsize
+
+
+def test_precise_eviction():
+    cached = CachedDocument(copy.deepcopy(DOC))
+    for pointer in ["/a/0/x", "/a/2/x", "/b/c/d", "/b/e/1", "/0"]:
+        cached.get(pointer)
+    before = set(cached._values)
+
+    cached.add("/a/1", {"x": 0})
+    evicted = before - set(cached._values)
+    assert evicted == {("a", "2"), ("a", "2", "x")}
+
+    cached.replace("/b/c", 1)
+    assert ("b", "c", "d") not in cached._values
+    assert ("b", "e", "1") in cached._values
+    assert ("0",) in cached._values
+
+    cached.add("", [])
+    assert cached.cache_info().currsize == 0
+    assert cached.doc == []
+
+
+def test_statistics():
+    cached = CachedDocument(DOC, maxsize=1)
+    for _ in range(3):
+        cached.get("/b/c")
+    cached.get("/a")
+    info = cached.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 2, 1)
+    assert info.hit_rate == 0.5
+
+    with pytest.raises(ResolutionException):
+        cached.get("/nope/x")
+
+    cached.cache_clear()
+    assert cached.cache_info().hits == 0
+    assert cached._trie == {}
+
+
+@pytest.mark.parametrize("ptr", ["/a/01", "/a/-1", "/a/01/x", "/a/²", "/b/c/d/x"])
+def test_invalid_indexes_miss(ptr):
+    cached = CachedDocument(copy.deepcopy(DOC))
+
+    with pytest.raises(ResolutionException) as exc_info:
+        cached.get(ptr)
+
+    e = exc_info.value
+    assert len(e.doc_refs) + len(e.remaining) == len(JsonPointer.parse(ptr).parts) + 1
@@ -0,0 +1,78 @@
+import json
+import re
+
+from typer.testing import CliRunner
+
+from fast_json_pointer.cli import app
+
+RECORDS = [{"id": i, "name": f"n\t{i}", "tags": ["x"] * (i % 2)} for i in range(50)]
+JSONL = "".join(json.dumps(record) + "\n" for record in RECORDS)
+
+
+def test_get_stdin():
+    result = CliRunner().invoke(app, ["get", "/id", "/tags/0"], input=JSONL + "\n")
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.stdout.splitlines()] == [
+        [record["id"], (record["tags"] or [None])[0]] for record in RECORDS
+    ]
+
+
+def test_get_files_tsv(tmp_path):
+    path = tmp_path / "records.jsonl"
+    path.write_text(JSONL)
+
+    args = ["get", "/name", "/id", "/tags", "-i", str(path), "-i", str(path)]
+    result = CliRunner().invoke(app, [*args, "--format", "tsv", "--default", '"-"'])
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert len(lines) == 2 * len(RECORDS)
+    assert lines[1] == 'n\\t1\t1\t["x"]'
+
+
+def _split(output):
+    """Records written to stdout, and errors to stderr, which older click mixes."""
+    lines = output.splitlines()
+    errors = [line for line in lines if re.match(r"\S+:\d+: ", line)]
+    return [line for line in lines if line not in errors], errors
+
+
+def test_get_reports_bad_records():
+    result = CliRunner().invoke(
+        app, ["get", "/id", "--jobs", "2"], input='{"id": 1}\n\nnope\n{"id": 2}\n'
+    )
+    assert result.exit_code == 1
+    records, errors = _split(result.output)
+    assert records == ["[1]", "null", "[2]"]
+    assert len(errors) == 1
+    assert errors[0].startswith("<stdin>:3: JSONDecodeError")
+
+
+def test_get_tsv_bad_records_keep_alignment(tmp_path):
+    path = tmp_path / "records.jsonl"
+    path.write_text('{"id": 1, "name": "a"}\n[\n{"id": 2, "name": "b"}\n')
+
+    args = ["get", "/id", "/name", "-i", str(path), "--format", "tsv"]
+    result = CliRunner().invoke(app, args)
+    assert result.exit_code == 1
+    records, errors = _split(result.output)
+    assert records == ["1\ta", "\t", "2\tb"]
+    assert len(errors) == 1
+    assert errors[0].startswith(f"{path}:2: JSONDecodeError")
+
+
+def test_patch_stdin():
+    patch = json.dumps([{"op": "remove", "path": "/tags/0"}])
+    result = CliRunner().invoke(app, ["patch", patch], input=JSONL)
+
+    assert result.exit_code == 1
+    records, errors = _split(result.output)
+    assert [json.loads(r) for r in records] == [
+        {**r, "tags": []} if r["tags"] else None for r in RECORDS
+    ]
+    assert len(errors) == 25
+    assert errors[0].startswith("<stdin>:1: ")
+
+
+def test_socket_requires_doc():
+    result = CliRunner().invoke(app, ["get", "/a", "--socket", "/nope.sock"])
+    assert result.exit_code != 0
@@ -0,0 +1,140 @@
+import array
+import sys
+
+import pytest
+
+from fast_json_pointer import columns
+
+
+def test_extract_columns_chunked():
+    docs = [{"a": {"b": i, "c": str(i)}} if i % 3 else {"a": {}} for i in range(10)]
+
+    b_col, c_col = columns.extract_columns(
+        iter(docs), ["/a/b", "/a/c"], dtypes=["q", None], fill=[-1, None], chunk_size=4
+    )
+
+    assert b_col.values == array.array(
+        "q", [-1 if i % 3 == 0 else i for i in range(10)]
+    )
+    assert c_col.values == [None if i % 3 == 0 else str(i) for i in range(10)]
+    assert list(b_col.valid) == [int(bool(i % 3)) for i in range(10)]
+
+
+def test_unstorable_values_are_invalid():
+    (col,) = columns.extract_columns([{"x": "nope"}, {"x": 1.5}], ["/x"], dtypes="d")
+
+    assert list(col.values) == [0.0, 1.5]
+    assert list(col.valid) == [0, 1]
+
+
+def test_inferred_dtypes():
+    docs = [
+        {"b": "x", "e": 1},
+        {"a": 1, "b": 2.5, "c": True, "e": 2.5},
+        {"a": 2.5, "b": 1, "e": 3},
+    ]
+
+    a_col, b_col, c_col, d_col, e_col = columns.extract_columns(
+        docs, ["/a", "/b", "/c", "/d", "/e"], chunk_size=2
+    )
+
+    assert a_col.values == array.array("d", [0, 1, 2.5])
+    assert list(a_col.valid) == [0, 1, 1]
+    assert b_col.values == ["x", 2.5, 1]
+    assert c_col.values == [None, True, None]
+    assert d_col.values == [None, None, None]
+    assert e_col.values == array.array("d", [1, 2.5, 3])
+    assert list(e_col.valid) == [1, 1, 1]
+
+
+def test_inferred_ints_widen_in_later_chunks():
+    docs = [{"x": 1}, {"x": 2}, {"x": 3}, {"x": 0.5}, {"x": 4}]
+
+    chunks = list(columns.iter_column_chunks(docs, ["/x"], chunk_size=2))
+    assert [x.values for x, in chunks] == [
+        array.array("q", [1, 2]),
+        array.array("d", [3, 0.5]),
+        array.array("d", [4]),
+    ]
+    assert all(list(x.valid) == [1] * len(x) for x, in chunks)
+
+    (explicit,) = columns.extract_columns(docs, ["/x"], dtypes="q", chunk_size=2)
+    assert explicit.values == array.array("q", [1, 2, 3, 0, 4])
+    assert list(explicit.valid) == [1, 1, 1, 0, 1]
+
+
+def test_array_backend_without_numpy(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    (col,) = columns.extract_columns([{"x": 1}, {"x": 1.5}], ["/x"], chunk_size=1)
+    assert col.values == array.array("d", [1, 1.5])
+
+    with pytest.raises(ImportError):
+        columns.extract_columns([{"x": 1}], ["/x"], backend="numpy")
+
+
+@pytest.mark.parametrize(
+    "dtype, values, valid",
+    [
+        ("q", [1, 1.5, True, "1", None], [1, 0, 0, 0, 0]),
+        ("B", [1, -1, 256, False], [1, 0, 0, 0]),
+        ("d", [1.5, 1, True, "1.5"], [1, 1, 0, 0]),
+    ],
+)
+def test_values_must_match_dtype(dtype, values, valid):
+    docs = [{"x": value} for value in values]
+    (col,) = columns.extract_columns(docs, ["/x"], dtypes=dtype)
+    assert list(col.valid) == valid
+
+
+def test_mismatched_options():
+    with pytest.raises(ValueError):
+        columns.extract_columns([], ["/x", "/y"], dtypes=["d"])
+
+
+def test_numpy_backend():
+    np = pytest.importorskip("numpy")
+
+    x_col, y_col = columns.extract_columns(
+        [{"x": 1.5, "y": "a"}, {"y": "b"}], ["/x", "/y"], dtypes=["d", None],
+        backend="numpy",
+    )
+
+    assert isinstance(x_col.values, np.ndarray)
+    assert x_col.values.tolist() == [1.5, 0.0]
+    assert x_col.valid.tolist() == [True, False]
+    assert y_col.values.tolist() == ["a", "b"]
+
+
+@pytest.mark.parametrize(
+    "dtype, values, valid",
+    [
+        ("int64", [1, 1.5, True, "1"], [True, False, False, False]),
+        ("float64", [1.5, 1, True, "1.5"], [True, True, False, False]),
+        ("bool", [True, 1, "true"], [True, False, False]),
+    ],
+)
+def test_numpy_values_must_match_dtype(dtype, values, valid):
+    pytest.importorskip("numpy")
+
+    docs = [{"x": value} for value in values]
+    (col,) = columns.extract_columns(docs, ["/x"], dtypes=dtype, backend="numpy")
+    assert col.valid.tolist() == valid
+    assert col.values[~col.valid].tolist() == [0] * valid.count(False)
+
+
+def test_numpy_inferred_dtypes():
+    np = pytest.importorskip("numpy")
+
+    a_col, b_col, c_col = columns.extract_columns(
+        [{"a": 1, "b": 0.5, "c": 1}, {"a": 1.5, "b": 2, "c": 2}, {"c": 2.5}],
+        ["/a", "/b", "/c"],
+        chunk_size=2,
+        backend="numpy",
+    )
+    assert a_col.values.dtype == np.float64
+    assert a_col.values.tolist() == [1.0, 1.5, 0.0]
+    assert a_col.valid.tolist() == [True, True, False]
+    assert b_col.values.tolist() == [0.5, 2.0, 0.0]
+    assert c_col.values.dtype == np.float64
+    assert c_col.values.tolist() == [1.0, 2.0, 2.5]
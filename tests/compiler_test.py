@@ -0,0 +1,46 @@
+import pytest
+
+from fast_json_pointer import compiler, resolver
+from fast_json_pointer.exceptions import JsonPointerException, ResolutionException
+
+
+class Doc(dict):
+    pass
+
+
+def test_getter_matches_resolver():
+    doc = {"a": [{"b": 1}, {"01": 2}], "-": {"~/": 3}, "c": Doc(d=4)}
+    for ptr in ["", "/a", "/a/0/b", "/a/1/01", "/-/~0~1", "/c/d"]:
+        assert compiler.compile_getter(ptr)(doc) == resolver.get(doc, ptr)
+
+
+def test_getter_miss_raises_resolution_exception():
+    getter = compiler.compile_getter("/a/1/b")
+
+    for doc in [{}, {"a": [0]}, {"a": [0, 1]}, {"a": "str"}]:
+        with pytest.raises(ResolutionException) as exc_info:
+            getter(doc)
+        assert exc_info.value.doc_refs is not None
+
+
+def test_setter_deleter():
+    doc = {"a": [1, 2, 3], "b": {}}
+
+    compiler.compile_setter("/a/1")(doc, "x")
+    compiler.compile_setter("/b/c")(doc, "y")
+    assert doc == {"a": [1, "x", 3], "b": {"c": "y"}}
+
+    compiler.compile_deleter("/a/0")(doc)
+    compiler.compile_deleter("/b/c")(doc)
+    assert doc == {"a": ["x", 3], "b": {}}
+
+    with pytest.raises(ResolutionException):
+        compiler.compile_deleter("/b/c")(doc)
+
+
+def test_root_mutators_rejected():
+    with pytest.raises(JsonPointerException):
+        compiler.compile_setter("")
+
+    with pytest.raises(JsonPointerException):
+        compiler.compile_deleter("")
@@ -0,0 +1,57 @@
+import pytest
+
+from fast_json_pointer import RelativeJsonPointer, resolver
+from fast_json_pointer.cursor import JsonCursor
+from fast_json_pointer.exceptions import JsonPointerException, ResolutionException
+from fast_json_pointer.walk import iter_pointers
+
+DOC = {"a": [1, {"b": None, "c~/": [[]]}], "d": {"e": "x"}}
+RELS = ["0", "1", "0#", "1#", "1/0", "2/d/e", "0/b", "1/1/c~0~1/0", "2#"]
+
+
+def test_matches_resolver():
+    for pointer, value in iter_pointers(DOC):
+        cursor = JsonCursor.at(DOC, str(pointer))
+        assert cursor.value is value
+        assert cursor.pointer == pointer.to_pointer()
+
+        for rel in RELS:
+            try:
+                expected = resolver.get(DOC, str(pointer), rel=rel)
+            except (ResolutionException, IndexError):
+                with pytest.raises(ResolutionException):
+                    cursor.get(rel)
+                continue
+
+            assert cursor.get(rel) == expected
+            if not rel.endswith("#"):
+                rel = RelativeJsonPointer.parse(rel)
+                doc_refs = resolver.resolve(DOC, pointer.to_pointer(), rel=rel)
+                assert cursor.rel(rel).pointer == doc_refs[-1].pointer
+
+
+def test_navigation():
+    root = JsonCursor(DOC)
+    item = root.child("a").child(1)
+    assert item.parent().parent() is root
+    assert item.root is root
+    assert item.index_ref() == "1"
+    assert [str(c) for c in item.children()] == ["/a/1/b", "/a/1/c~0~1"]
+    assert list(root.child("a").child(0).children()) == []
+
+
+def test_errors():
+    cursor = JsonCursor.at(DOC, "/a/1")
+    with pytest.raises(ResolutionException) as e:
+        cursor.rel("0/c~0~1/5")
+    assert e.value.remaining == ("5",)
+    assert [str(ref.pointer) for ref in e.value.doc_refs] == ["", "/a", "/a/1", "/a/1/c~0~1"]
+
+    with pytest.raises(ResolutionException):
+        cursor.rel("3/a")
+    with pytest.raises(ResolutionException):
+        JsonCursor(DOC).parent()
+    with pytest.raises(ResolutionException):
+        JsonCursor(DOC).index_ref()
+    with pytest.raises(JsonPointerException):
+        cursor.rel("1#")
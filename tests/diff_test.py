@@ -0,0 +1,134 @@
+import copy
+import random
+
+import pytest
+
+from fast_json_pointer.diff import diff
+from fast_json_pointer.patch import apply_patch
+
+
+def random_doc(rng, depth=0):
+    kind = rng.random()
+    if depth > 3 or kind < 0.3:
+        return rng.choice([None, True, False, 0, 1, 1.0, "a", "b", ""])
+    if kind < 0.65:
+        return [random_doc(rng, depth + 1) for _ in range(rng.randrange(6))]
+    return {rng.choice("abcdef~/"): random_doc(rng, depth + 1) for _ in range(4)}
+
+
+def mutate(rng, doc):
+    match doc:
+        case dict() if doc and rng.random() < 0.7:
+            key = rng.choice(list(doc))
+            if rng.random() < 0.2:
+                del doc[key]
+            else:
+                doc[key] = mutate(rng, doc[key])
+        case list() if doc and rng.random() < 0.7:
+            idx = rng.randrange(len(doc))
+            match rng.randrange(3):
+                case 0:
+                    del doc[idx]
+                case 1:
+                    doc.insert(idx, random_doc(rng, 3))
+                case 2:
+                    doc[idx] = mutate(rng, doc[idx])
+        case _:
+            return random_doc(rng, 2)
+    return doc
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_diff_round_trips(seed):
+    rng = random.Random(seed)
+    old = random_doc(rng)
+    new = copy.deepcopy(old)
+    for _ in range(rng.randrange(1, 4)):
+        new = mutate(rng, new)
+
+    ops = diff(old, new)
+    patched = apply_patch(copy.deepcopy(old), ops)
+
+    assert patched == new
+    assert diff(patched, new) == []
+
+
+def test_array_insert_is_single_add():
+    old = list(range(1000))
+    new = old[:500] + ["x"] + old[500:]
+
+    assert diff(old, new) == [{"op": "add", "path": "/500", "value": "x"}]
+
+
+def test_bounded_array_work():
+    old = [{"id": i} for i in range(20)]
+    new = old[1:] + [{"id": 20}]
+
+    assert len(diff(old, new)) == 2
+    for edits, align in [(1, 100), (1, 10)]:
+        ops = diff(old, new, max_array_edits=edits, max_array_align=align)
+        assert apply_patch(copy.deepcopy(old), ops) == new
+
+
+def test_repetitive_array_edits():
+    old = [0, 1] * 10_000
+    new = old[:]
+    new.insert(5, 7)
+    del new[15_000]
+
+    assert len(diff(old, new)) == 2
+
+
+def test_identical_subtrees_skipped():
+    shared = {"big": list(range(10))}
+    assert diff({"a": shared, "b": 1}, {"a": shared, "b": 2}) == [
+        {"op": "replace", "path": "/b", "value": 2}
+    ]
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ({"a": [True]}, {"a": [1]}),
+        ({"a": [1]}, {"a": [1.0]}),
+        ([{"x": 0}], [{"x": False}]),
+    ],
+)
+def test_equal_is_type_strict(old, new):
+    ops = diff(old, new)
+    assert ops
+    assert apply_patch(copy.deepcopy(old), ops) == new
+    assert repr(apply_patch(copy.deepcopy(old), ops)) == repr(new)
+
+
+def test_removes_in_old_key_order():
+    old = {key: i for i, key in enumerate("zyxwvuts")}
+    assert diff(old, {"y": 1}) == [
+        {"op": "remove", "path": f"/{key}"} for key in "zxwvuts"
+    ]
+
+
+def test_unchanged_objects_not_compared_per_level(monkeypatch):
+    from fast_json_pointer import diff as diff_module
+    from fast_json_pointer.patch import json_equal as real_equal
+
+    compared = []
+
+    def json_equal(old, new, **kwargs):
+        compared.append(old)
+        return real_equal(old, new, **kwargs)
+
+    monkeypatch.setattr(diff_module, "json_equal", json_equal)
+
+    old = {"leaf": 0}
+    for level in range(50):
+        old = {"k": old, "level": level}
+    new = copy.deepcopy(old)
+    leaf = new
+    while "k" in leaf:
+        leaf = leaf["k"]
+    leaf["leaf"] = 1
+
+    assert len(diff(old, new)) == 1
+    # Only the changed leaf is compared, rather than every subtree at every level
+    assert compared == [0]
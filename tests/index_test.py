@@ -0,0 +1,86 @@
+import json
+import os
+
+import pytest
+from typer.testing import CliRunner
+
+from fast_json_pointer import index, resolver
+from fast_json_pointer.cli import app
+from fast_json_pointer.exceptions import ResolutionException
+
+DOC = {
+    "a": {"b": [1, 2, {"c": "deep", "d~/": [True]}], "": None},
+    "a!": "sorts between /a and /a/",
+    "é": {"x": 1.5},
+}
+
+
+@pytest.fixture
+def doc_path(tmp_path):
+    path = tmp_path / "doc.json"
+    path.write_text(json.dumps(DOC, indent=1))
+    return path
+
+
+def test_index_matches_resolver(doc_path):
+    index.build_index(doc_path, max_depth=2)
+
+    with index.SpanIndex(doc_path) as span_index:
+        for pointer in ["", "/a", "/a/b", "/a/", "/a!", "/a/b/2/d~0~1/0", "/é/x"]:
+            assert span_index.get(pointer) == resolver.get(DOC, pointer)
+
+        for pointer in ["/nope", "/a/b/3", "/a/b/2/e"]:
+            with pytest.raises(ResolutionException):
+                span_index.get(pointer)
+
+        assert [str(p) for p, _ in span_index.prefix("/a")] == ["/a", "/a/", "/a/b"]
+        assert len(list(span_index.prefix(""))) == len(span_index) == 7
+
+
+@pytest.mark.parametrize("max_depth", [1, 3])
+@pytest.mark.parametrize(
+    "pointer", ["/a/b/01", "/a/b/-1", "/a/b/+1", "/a/b/-", "/a/b/\u0661", "/a/b/01/c"]
+)
+def test_non_canonical_indexes_miss_like_resolver(doc_path, max_depth, pointer):
+    index.build_index(doc_path, max_depth=max_depth)
+
+    with pytest.raises(ResolutionException):
+        resolver.get(DOC, pointer)
+    with index.SpanIndex(doc_path) as span_index:
+        with pytest.raises(ResolutionException):
+            span_index.get(pointer)
+
+
+def test_empty_files(doc_path, tmp_path):
+    empty = tmp_path / "empty.fjpi"
+    empty.write_bytes(b"")
+    with pytest.raises(index.IndexException):
+        index.SpanIndex(doc_path, empty)
+
+    empty_doc = tmp_path / "empty.json"
+    empty_doc.write_bytes(b"")
+    with pytest.raises(index.IndexException):
+        index.build_index(empty_doc)
+
+
+def test_stale_index(doc_path):
+    index.build_index(doc_path)
+    doc_path.write_text(json.dumps({"changed": True}))
+    os.utime(doc_path, ns=(0, 0))
+
+    with pytest.raises(index.IndexException):
+        index.SpanIndex(doc_path)
+
+
+def test_cli(doc_path):
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["index", "build", str(doc_path), "--depth", "1"])
+    assert result.exit_code == 0
+
+    result = runner.invoke(app, ["index", "get", str(doc_path), "/a/b/2/c", "/a!"])
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ['"deep"', '"sorts between /a and /a/"']
+
+    result = runner.invoke(app, ["index", "ls", str(doc_path), "/a"])
+    assert [line.split("\t")[0] for line in result.output.splitlines()] == ["/a"]
@@ -0,0 +1,113 @@
+import pytest
+
+from fast_json_pointer import JsonPointer, clear_parse_cache, instrument, patch, resolver
+from fast_json_pointer.cache import CachedDocument
+from fast_json_pointer.exceptions import ResolutionException
+from fast_json_pointer.threadsafe import ConcurrentDocument
+from fast_json_pointer.value_index import ValueIndex
+
+
+@pytest.fixture
+def enabled():
+    events = []
+    instrument.enable(timing=True, hook=lambda event, ns: events.append((event, ns)))
+    yield events
+    instrument.disable()
+
+
+def test_disabled_restores_originals():
+    get, lookup, parse = resolver.get, resolver._lookup, JsonPointer.parse
+    instrument.enable()
+    assert resolver._lookup is not lookup
+    instrument.disable()
+    assert (resolver.get, resolver._lookup, JsonPointer.parse) == (get, lookup, parse)
+    assert not instrument.is_enabled()
+
+
+def test_counts(enabled):
+    clear_parse_cache()
+    instrument.reset()
+    doc = {"a": [{"b": 1}], "c": "x"}
+
+    for pointer in ["/a/0/b", "/a/0/b", "/c", "/a/5", "/a/-", "/a/x", "/c/d", "/z"]:
+        try:
+            resolver.get(doc, pointer)
+        except ResolutionException:
+            pass
+    resolver.add(doc, "/d", 1)
+    patch.apply_patch(doc, [{"op": "remove", "path": "/d"}])
+
+    stats = instrument.snapshot()
+    # "/a/0/b" and "/d" are parsed once, then interned
+    assert stats["parse"]["calls"] == 8
+    assert stats["parse_cache"]["JsonPointer"] == {"hits": 2, "misses": 8}
+    assert stats["resolve"]["calls"] == 10
+    assert stats["depth"] == {0: 1, 1: 3, 2: 4, 3: 2}
+    assert stats["misses"] == {
+        "index": 1,
+        "end_of_array": 1,
+        "invalid_index": 1,
+        "not_container": 1,
+        "key": 2,
+    }
+    assert stats["mutations"].keys() == {"add", "apply_patch"}
+    assert stats["resolve"]["time_ns"] > 0
+
+    events = {event for event, _ in enabled}
+    assert {"parse", "resolve", "miss.key", "mutation.add"} <= events
+
+
+def test_disabled_counts_nothing():
+    instrument.enable()
+    instrument.disable()
+    resolver.get({"a": 1}, "/a")
+    assert instrument.snapshot()["resolve"] == {"calls": 0}
+
+
+def test_non_raising_misses(enabled):
+    doc = {"a": [{"b": 1}], "c": "x"}
+
+    assert resolver.get(doc, "/a/0/b", default=None) == 1
+    assert resolver.get(doc, "/a/1", default=None) is None
+    assert not resolver.exists(doc, "/c/d")
+    results = resolver.get_many(doc, ["/a/0/b", "/z", "/a/-"], default=0)
+    assert results == [1, 0, 0]
+    missing = resolver.get_many(doc, ["/a/0/x"])
+    assert isinstance(missing[0], ResolutionException)
+    assert missing[0].remaining == ("x",)
+
+    stats = instrument.snapshot()
+    assert stats["resolve"]["calls"] == 7
+    assert stats["depth"] == {1: 1, 2: 3, 3: 3}
+    assert stats["misses"] == {
+        "index": 1,
+        "not_container": 1,
+        "key": 2,
+        "end_of_array": 1,
+    }
+
+
+def test_nested_mutations_counted_once(enabled):
+    doc = {"a": 1}
+    resolver.move(doc, "/a", "/b")
+    resolver.copy(doc, "/b", "/c")
+    resolver.add(doc, "/d", 1)
+    assert doc == {"b": 1, "c": 1, "d": 1}
+
+    mutations = instrument.snapshot()["mutations"]
+    assert {name: stats["calls"] for name, stats in mutations.items()} == {
+        "move": 1,
+        "copy": 1,
+        "add": 1,
+    }
+
+
+@pytest.mark.parametrize("wrapper", [CachedDocument, ConcurrentDocument, ValueIndex])
+def test_patches_through_wrappers_counted(enabled, wrapper):
+    doc = wrapper({"a": 1})
+    doc.replace("/a", 2)
+    doc.remove("/a")
+
+    mutations = instrument.snapshot()["mutations"]
+    assert mutations.keys() == {"apply_patch"}
+    assert mutations["apply_patch"]["calls"] == 2
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from fast_json_pointer import resolver
+from fast_json_pointer.exceptions import PatchException, ResolutionException
+from fast_json_pointer.parallel import map_get, map_patch
+from fast_json_pointer.patch import apply_patch
+
+RECORDS = [json.dumps({"id": i, "tags": ["x"] * (i % 3)}) for i in range(200)]
+POINTERS = ["/id", "/tags/1"]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_map_get_in_order(workers):
+    records = [*RECORDS, "{broken"]
+    results = list(map_get(POINTERS, records, workers=workers, batch_size=7, window=2))
+
+    assert len(results) == len(records)
+    for record, result in zip(RECORDS, results):
+        doc = json.loads(record)
+        assert result[0] == doc["id"]
+        if len(doc["tags"]) > 1:
+            assert result[1] == resolver.get(doc, "/tags/1")
+        else:
+            assert isinstance(result[1], ResolutionException)
+            assert result[1].remaining == ("1",)
+    assert isinstance(results[-1], json.JSONDecodeError)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_map_patch_in_order(workers):
+    ops = [
+        {"op": "add", "path": "/meta", "value": {}},
+        {"op": "add", "path": "/meta/n", "value": 1},
+        {"op": "remove", "path": "/tags/0"},
+    ]
+    results = list(map_patch(ops, RECORDS, workers=workers, batch_size=16))
+
+    for record, result in zip(RECORDS, results):
+        doc = json.loads(record)
+        if doc["tags"]:
+            assert json.loads(result) == apply_patch(doc, json.loads(json.dumps(ops)))
+        else:
+            assert isinstance(result, PatchException)
+            assert result.op_index == 2
+
+
+def test_stops_early():
+    results = map_get(["/id"], iter(RECORDS * 100), workers=2, batch_size=10)
+    assert [next(results) for _ in range(3)] == [[0], [1], [2]]
+    results.close()
+
+
+def test_in_process_iterators_dont_share_state():
+    records = [json.dumps({"x": i, "y": -i}) for i in range(3)]
+    xs = map_get(["/x"], records, workers=1, batch_size=1)
+    ys = map_get(["/y"], records, workers=1, batch_size=1)
+    adds = map_patch([{"op": "add", "path": "/a", "value": 1}], records, workers=1)
+    removes = map_patch([{"op": "remove", "path": "/x"}], records, workers=1)
+
+    for i in range(len(records)):
+        assert (next(xs), next(ys)) == ([i], [-i])
+        assert json.loads(next(adds)) == {"x": i, "y": -i, "a": 1}
+        assert json.loads(next(removes)) == {"y": -i}
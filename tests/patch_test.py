@@ -0,0 +1,110 @@
+import pytest
+
+from fast_json_pointer.exceptions import PatchException
+from fast_json_pointer.patch import apply_patch
+
+# https://www.rfc-editor.org/rfc/rfc6902#appendix-A
+RFC_EXAMPLES = [
+    (
+        {"foo": "bar"},
+        [{"op": "add", "path": "/baz", "value": "qux"}],
+        {"baz": "qux", "foo": "bar"},
+    ),
+    (
+        {"foo": ["bar", "baz"]},
+        [{"op": "add", "path": "/foo/1", "value": "qux"}],
+        {"foo": ["bar", "qux", "baz"]},
+    ),
+    (
+        {"baz": "qux", "foo": "bar"},
+        [{"op": "remove", "path": "/baz"}],
+        {"foo": "bar"},
+    ),
+    (
+        {"foo": ["bar", "qux", "baz"]},
+        [{"op": "remove", "path": "/foo/1"}],
+        {"foo": ["bar", "baz"]},
+    ),
+    (
+        {"baz": "qux", "foo": "bar"},
+        [{"op": "replace", "path": "/baz", "value": "boo"}],
+        {"baz": "boo", "foo": "bar"},
+    ),
+    (
+        {"foo": {"bar": "baz", "waldo": "fred"}, "qux": {"corge": "grault"}},
+        [{"op": "move", "from": "/foo/waldo", "path": "/qux/thud"}],
+        {"foo": {"bar": "baz"}, "qux": {"corge": "grault", "thud": "fred"}},
+    ),
+    (
+        {"foo": ["all", "grass", "cows", "eat"]},
+        [{"op": "move", "from": "/foo/1", "path": "/foo/3"}],
+        {"foo": ["all", "cows", "eat", "grass"]},
+    ),
+    (
+        {"foo": ["bar"]},
+        [{"op": "add", "path": "/foo/-", "value": ["abc", "def"]}],
+        {"foo": ["bar", ["abc", "def"]]},
+    ),
+    (
+        {"/": 9, "~1": 10},
+        [{"op": "test", "path": "/~01", "value": 10}],
+        {"/": 9, "~1": 10},
+    ),
+]
+
+
+@pytest.mark.parametrize("doc,ops,expected", RFC_EXAMPLES)
+def test_rfc_examples(doc, ops, expected):
+    assert apply_patch(doc, ops) == expected
+    assert doc == expected
+
+
+@pytest.mark.parametrize(
+    "ops",
+    [
+        [{"op": "test", "path": "/baz", "value": "bar"}],
+        [{"op": "add", "path": "/baz/bat", "value": "qux"}],
+        [{"op": "add", "path": "/arr/3", "value": 0}],
+        [{"op": "remove", "path": "/arr/-"}],
+        [{"op": "move", "from": "/obj", "path": "/obj/child"}],
+        [{"op": "nope", "path": "/arr"}],
+        [{"op": "add", "path": "/arr"}],
+    ],
+)
+def test_rollback(ops):
+    doc = {"arr": [1, 2], "obj": {"k": "v"}, "foo": "bar"}
+    applied = [
+        {"op": "add", "path": "/arr/0", "value": 0},
+        {"op": "remove", "path": "/foo"},
+        {"op": "replace", "path": "/obj/k", "value": "w"},
+        {"op": "copy", "from": "/obj", "path": "/copied"},
+        {"op": "move", "from": "/arr/2", "path": "/moved"},
+    ]
+
+    with pytest.raises(PatchException) as exc_info:
+        apply_patch(doc, applied + ops)
+
+    assert exc_info.value.op_index == len(applied)
+    assert doc == {"arr": [1, 2], "obj": {"k": "v"}, "foo": "bar"}
+
+
+@pytest.mark.parametrize(
+    "doc, value, passes",
+    [
+        (True, 1, False),
+        (1, True, False),
+        (0, False, False),
+        (1, 1.0, True),
+        ([1], [True], False),
+        ({"a": [1, {"b": 2.0}]}, {"a": [1.0, {"b": 2}]}, True),
+        ({"a": [0]}, {"a": [None]}, False),
+        ({"a": 1}, {"a": 1, "b": 2}, False),
+    ],
+)
+def test_test_op_compares_json_types(doc, value, passes):
+    ops = [{"op": "test", "path": "/v", "value": value}]
+    if passes:
+        apply_patch({"v": doc}, ops)
+    else:
+        with pytest.raises(PatchException):
+            apply_patch({"v": doc}, ops)
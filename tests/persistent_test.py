@@ -0,0 +1,96 @@
+import copy
+import random
+
+import pytest
+
+from fast_json_pointer import JsonPointer, resolver
+from fast_json_pointer.exceptions import JsonPointerException, ResolutionException
+from fast_json_pointer.persistent import REMOVE, assoc, batch, dissoc
+from fast_json_pointer.walk import iter_pointers
+
+DOC = {"a": {"b": [1, {"c": 2}], "d": {"e": 3}}, "f": [[4], [5]]}
+
+
+def _ids(doc):
+    return {id(v): str(p) for p, v in iter_pointers(doc) if isinstance(v, (dict, list))}
+
+
+def test_only_path_copied():
+    before = copy.deepcopy(DOC)
+    new = assoc(DOC, "/a/b/1/c", 20)
+
+    assert DOC == before
+    assert new["a"]["b"][1]["c"] == 20
+    # Everything off the path is shared, everything on it copied
+    shared = _ids(DOC).keys() & _ids(new).keys()
+    assert sorted(_ids(DOC)[i] for i in shared) == ["/a/d", "/f", "/f/0", "/f/1"]
+
+
+def test_matches_in_place_updates():
+    rng = random.Random(0)
+    for _ in range(100):
+        doc = copy.deepcopy(DOC)
+        pointers = [str(p) for p, _ in iter_pointers(doc)][1:]
+        pointer = rng.choice(pointers)
+
+        expected = copy.deepcopy(doc)
+        resolver.add(expected, pointer, "new")
+        assert assoc(doc, pointer, "new") == expected
+
+        expected = copy.deepcopy(doc)
+        resolver.remove(expected, pointer)
+        assert dissoc(doc, pointer) == expected
+        assert doc == DOC
+
+
+def test_batch_copies_once():
+    new = batch(DOC, [("/a/b/0", 10), ("/a/b/-", 30), ("/a/d/e", REMOVE), ("/a/x", 1)])
+
+    assert new == {"a": {"b": [10, {"c": 2}, 30], "d": {}, "x": 1}, "f": [[4], [5]]}
+    assert new["a"]["b"][1] is DOC["a"]["b"][1]
+    assert new["f"] is DOC["f"]
+    assert DOC["a"] == {"b": [1, {"c": 2}], "d": {"e": 3}}
+
+
+def test_batch_doesnt_mutate_values():
+    value = {"x": 1}
+    new = batch({}, {"/v": value, "/v/y": 2})
+    assert value == {"x": 1}
+    assert new == {"v": {"x": 1, "y": 2}}
+
+
+def test_errors_leave_doc_untouched():
+    before = copy.deepcopy(DOC)
+    for updates in [
+        [("/a/d/e", 1), ("/nope/x", 1)],
+        [("/f/5", 1)],
+        [("/f/0/0/x", 1)],
+        [("/a/nope", REMOVE)],
+        [("/f/-", REMOVE)],
+    ]:
+        with pytest.raises(ResolutionException):
+            batch(DOC, updates)
+    assert DOC == before
+
+    with pytest.raises(JsonPointerException):
+        dissoc(DOC, "")
+
+
+@pytest.mark.parametrize("ptr", ["/a/01", "/a/-1", "/a/3", "/a/01/x", "/a/-1/x"])
+def test_invalid_indexes_miss(ptr):
+    doc = {"a": [{"x": 1}, {"x": 2}]}
+
+    with pytest.raises(ResolutionException) as exc_info:
+        assoc(doc, ptr, 5)
+    assert exc_info.value.remaining == tuple(JsonPointer.parse(ptr).parts[1:])
+    assert [str(ref.pointer) for ref in exc_info.value.doc_refs] == ["", "/a"]
+
+    with pytest.raises(ResolutionException):
+        dissoc(doc, ptr)
+    assert doc == {"a": [{"x": 1}, {"x": 2}]}
+
+
+def test_miss_below_scalar():
+    with pytest.raises(ResolutionException) as exc_info:
+        assoc({"a": 1}, "/a/b/c", 5)
+    assert exc_info.value.remaining == ("b", "c")
@@ -0,0 +1,48 @@
+import pytest
+
+from fast_json_pointer import (
+    JsonPointer,
+    RelativeJsonPointer,
+    clear_parse_cache,
+    parse_cache_info,
+    set_parse_cache_size,
+)
+
+
+def test_pointer_is_immutable_and_slotted():
+    pointer = JsonPointer(["a", "b"])
+
+    assert pointer.parts == ("a", "b")
+    assert not hasattr(pointer, "__dict__")
+    with pytest.raises(AttributeError):
+        pointer.parts = ("c",)
+
+
+def test_pointer_hash_eq():
+    assert JsonPointer(["a", "0"]) == JsonPointer.parse("/a/0")
+    assert hash(JsonPointer(["a", "0"])) == hash(JsonPointer.parse("/a/0"))
+    assert len({JsonPointer(["a"]), JsonPointer(("a",)), JsonPointer([])}) == 2
+
+    rel = RelativeJsonPointer.parse("1/a")
+    assert {rel: 1}[RelativeJsonPointer(1, JsonPointer(["a"]))] == 1
+
+
+def test_parse_cache():
+    clear_parse_cache()
+
+    first = RelativeJsonPointer.parse("0/x")
+    assert RelativeJsonPointer.parse("0/x") is first
+
+    info = parse_cache_info()["RelativeJsonPointer"]
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_parse_cache_bounded():
+    set_parse_cache_size(2)
+    try:
+        for s in ["/a", "/b", "/c"]:
+            JsonPointer.parse(s)
+
+        assert parse_cache_info()["JsonPointer"].currsize == 2
+    finally:
+        set_parse_cache_size()
@@ -0,0 +1,60 @@
+import itertools
+
+from fast_json_pointer import resolver
+from fast_json_pointer.query import JsonQuery, iter_query
+
+DOC = {
+    "catalog": {
+        "books": [{"price": 1, "tags": ["a"]}, {"price": 2}],
+        "music": {"price": 3, "bundle": {"price": 4}},
+    },
+    "price": 0,
+    "*": "literal",
+}
+
+
+def matches(query, doc=DOC):
+    return [(str(p), v) for p, v in iter_query(doc, query)]
+
+
+def test_pointers_match_resolver():
+    for query in ["", "/catalog/books/1/price", "/price"]:
+        assert matches(query) == [(query, resolver.get(DOC, query))]
+
+    assert matches("/catalog/nope") == []
+    assert matches("/catalog/books/2") == []
+
+
+def test_any():
+    assert matches("/catalog/books/*/price") == [
+        ("/catalog/books/0/price", 1),
+        ("/catalog/books/1/price", 2),
+    ]
+    assert matches("/*/music/price") == [("/catalog/music/price", 3)]
+
+
+def test_deep():
+    assert [p for p, _ in matches("/catalog/**/price")] == [
+        "/catalog/books/0/price",
+        "/catalog/books/1/price",
+        "/catalog/music/price",
+        "/catalog/music/bundle/price",
+    ]
+    # Matched many ways, yielded once
+    assert len(matches("/**/**/price")) == len(matches("/**/price")) == 5
+
+
+def test_pointers_resolve_to_values():
+    for pointer, value in iter_query(DOC, "/**"):
+        assert resolver.get(DOC, pointer) is value
+
+
+def test_lazy():
+    doc = {"items": [{"id": i} for i in range(10**6)]}
+    first = list(itertools.islice(iter_query(doc, "/items/*/id"), 3))
+    assert [v for _, v in first] == [0, 1, 2]
+
+
+def test_parse_cached():
+    assert JsonQuery.parse("/a/*") is JsonQuery.parse("/a/*")
+    assert not JsonQuery.parse("/a/*").is_pointer
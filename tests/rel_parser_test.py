@@ -0,0 +1,15 @@
+import pytest
+
+from fast_json_pointer import rel_parser
+from fast_json_pointer.exceptions import ParseException
+
+
+def test_parse():
+    assert rel_parser.parse("10/foo") == (10, ["foo"])
+    assert rel_parser.parse("0#") == (0, None)
+
+
+def test_parse_exceptions():
+    for invalid in ["", "#", "/foo", "01", "00#", "1#/foo", "1foo", "٣"]:
+        with pytest.raises(ParseException):
+            rel_parser.parse(invalid)
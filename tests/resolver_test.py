@@ -0,0 +1,185 @@
+import pickle
+
+import pytest
+
+from fast_json_pointer import JsonPointer, RelativeJsonPointer, resolver
+from fast_json_pointer.exceptions import (
+    JsonPointerException,
+    PatchException,
+    ResolutionException,
+)
+from fast_json_pointer.patch import apply_patch
+
+
+def test_get_matches_resolve():
+    doc = {"a": [{"b": {"c": 1}}, 2], "d": {"": 3}}
+    for ptr in ["", "/a", "/a/0", "/a/0/b/c", "/a/1", "/d/"]:
+        pointer = JsonPointer.parse(ptr)
+        assert resolver.get(doc, pointer) is resolver.resolve(doc, pointer)[-1].doc
+
+
+def test_get_miss_builds_trail():
+    doc = {"a": [{"b": 1}]}
+
+    with pytest.raises(ResolutionException) as exc_info:
+        resolver.get(doc, "/a/0/c/d")
+
+    assert [str(ref.pointer) for ref in exc_info.value.doc_refs] == ["", "/a", "/a/0"]
+    assert exc_info.value.remaining == ("c", "d")
+
+
+def test_get_rel_past_root():
+    with pytest.raises(ResolutionException):
+        resolver.get({"a": 1}, "/a", rel="2/a")
+
+
+def test_get_many_matches_get():
+    doc = {"data": {"items": [{"id": 1, "name": "a"}, {"id": 2}], "meta": {"": 0}}}
+    pointers = [
+        "/data/items/1/id",
+        "/data/items/0/name",
+        "/data/items/0/id",
+        "/data/meta/",
+        "/data/items/1/id",
+        "",
+    ]
+
+    assert resolver.get_many(doc, pointers) == [resolver.get(doc, p) for p in pointers]
+
+
+def test_get_many_misses():
+    trie = resolver.PointerTrie(["/a/0", "/a/5", "/b/c", "/a/-"])
+
+    results = trie.get_many({"a": [1], "b": 2})
+    assert results[0] == 1
+    for result in results[1:]:
+        assert isinstance(result, ResolutionException)
+
+    assert trie.get_many({"b": {"c": 3}}, default=None) == [None, None, 3, None]
+
+
+def test_remove_many_matches_descending_removes():
+    doc = {"a": list(range(100)), "b": {"c": 1, "d": 2}}
+    pointers = [f"/a/{idx}" for idx in [5, 0, 99, 50, 5, 51]] + ["/b/d"]
+
+    expected = {"a": list(range(100)), "b": {"c": 1, "d": 2}}
+    for idx in sorted({5, 0, 99, 50, 51}, reverse=True):
+        resolver.remove(expected, f"/a/{idx}")
+    resolver.remove(expected, "/b/d")
+
+    resolver.remove_many(doc, pointers)
+    assert doc == expected
+
+
+def test_remove_many_nested_and_atomic():
+    doc = {"a": [{"x": [1, 2]}, {"x": [3]}]}
+    resolver.remove_many(doc, ["/a/0/x/1", "/a/0", "/a/1/x/0"])
+    assert doc == {"a": [{"x": []}]}
+
+    with pytest.raises(ResolutionException):
+        resolver.remove_many(doc, ["/a/0/x", "/a/5"])
+    with pytest.raises(ResolutionException):
+        resolver.remove_many(doc, ["/a/-"])
+    assert doc == {"a": [{"x": []}]}
+
+
+def test_set_and_add_many():
+    doc = {"a": [0, 1], "b": {}}
+    resolver.set_many(doc, [("/a/1", "x"), ("/a/-", 2), ("/b/k", 1), ("/b/k", 2)])
+    assert doc == {"a": [0, "x", 2], "b": {"k": 2}}
+
+    resolver.add_many(doc, [("/a/0", "p"), ("/a/3", "q"), ("/a/-", "r"), ("/b/j", 0)])
+    assert doc == {"a": ["p", 0, "x", 2, "q", "r"], "b": {"k": 2, "j": 0}}
+
+    for updates in [{"/a/6": 1, "/b/z": 1}, {"/nope/x": 1}]:
+        with pytest.raises(ResolutionException):
+            resolver.set_many(doc, updates)
+    with pytest.raises(ResolutionException):
+        resolver.add_many(doc, {"/a/7": 1})
+    with pytest.raises(JsonPointerException):
+        resolver.set_many(doc, {"/b": {}, "/b/k": 1})
+    with pytest.raises(JsonPointerException):
+        resolver.add_many(doc, {"": 1})
+    assert doc == {"a": ["p", 0, "x", 2, "q", "r"], "b": {"k": 2, "j": 0}}
+
+
+def test_get_default_matches_get():
+    doc = {"a": [{"b": None}, "s"], "c": {"": 0}}
+    pointers = ["", "/a/0/b", "/a/1", "/a/2", "/a/-", "/a/x", "/a/1/0", "/c/", "/z"]
+    rels = [None, "0", "1", "0/b", "1/1", "2/c/", "1#", "9/a", "0#"]
+
+    for ptr in pointers:
+        for rel in rels:
+            try:
+                expected = resolver.get(doc, ptr, rel=rel)
+            except (ResolutionException, IndexError):
+                expected = "missing"
+
+            assert resolver.get(doc, ptr, rel=rel, default="missing") == expected
+            assert resolver.exists(doc, ptr, rel=rel) == (expected != "missing")
+
+            doc_refs = resolver.try_resolve(doc, ptr, rel=rel)
+            if expected == "missing":
+                assert doc_refs is None
+            else:
+                assert doc_refs == resolver.resolve(
+                    doc,
+                    JsonPointer.parse(ptr),
+                    rel=rel and RelativeJsonPointer.parse(rel),
+                )
+
+
+def test_miss_context_is_lazy():
+    doc = {"a": [{"b": 1}]}
+
+    with pytest.raises(ResolutionException) as exc_info:
+        resolver.get(doc, "/a/0/c/d")
+    assert exc_info.value._context is not None
+    assert isinstance(exc_info.value.__cause__, KeyError)
+
+    doc_refs = exc_info.value.doc_refs
+    assert exc_info.value._context is None
+    assert exc_info.value.doc_refs is doc_refs
+
+
+def test_miss_pickles_context():
+    with pytest.raises(ResolutionException) as exc_info:
+        resolver.get({"a": []}, "/a/0")
+
+    e = pickle.loads(pickle.dumps(exc_info.value))
+    assert e.remaining == ("0",)
+    assert [ref.doc for ref in e.doc_refs] == [{"a": []}, []]
+
+
+@pytest.mark.parametrize("part", ["²", "٣", "01", "-1", "+1", " 1", "-"])
+def test_invalid_array_index_misses(part):
+    doc = {"a": [1, 2]}
+
+    assert resolver.get_many(doc, [f"/a/{part}", "/a/0"], default=None) == [None, 1]
+    with pytest.raises(ResolutionException):
+        resolver.get(doc, f"/a/{part}")
+
+
+@pytest.mark.parametrize("ptr", ["/a/²", "/a/01", "/a/0/x", "/a/-"])
+def test_default_and_exists_never_raise(ptr):
+    doc = {"a": [1]}
+    assert resolver.get(doc, ptr, default=None) is None
+    assert not resolver.exists(doc, ptr)
+    assert resolver.try_resolve(doc, ptr) is None
+
+
+def test_miss_context_is_from_the_miss():
+    doc = {"a": {"b": {"c": 1}}}
+    with pytest.raises(PatchException) as exc_info:
+        apply_patch(
+            doc,
+            [
+                {"op": "remove", "path": "/a/b"},
+                {"op": "replace", "path": "/a/b/c", "value": 2},
+            ],
+        )
+
+    # Read after the patch was rolled back, and `/a/b` is back
+    cause = exc_info.value.__cause__
+    assert [str(ref.pointer) for ref in cause.doc_refs] == ["", "/a"]
+    assert cause.remaining == ("b",)
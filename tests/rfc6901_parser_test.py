@@ -31,3 +31,17 @@ def test_parse_exceptions():
 def test_unparse():
     unparsed = rfc6901_parser.unparse(["foo", "3", "za"])
     assert unparsed == "/foo/3/za"
+
+
+def test_parse_matches_parse_many():
+    pointers = ["", "/", "/foo//bar", "/m~0n/a~1b/~01", "/~1~0/x"]
+    assert rfc6901_parser.parse_many(pointers) == [
+        rfc6901_parser.parse(p) for p in pointers
+    ]
+    assert rfc6901_parser.parse("/~01") == ["~1"]
+
+
+def test_parse_many_exceptions():
+    for invalid in ["foo", "/~", "/a~2", "/~~01"]:
+        with pytest.raises(ParseException):
+            rfc6901_parser.parse_many(["/ok", invalid])
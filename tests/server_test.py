@@ -0,0 +1,127 @@
+import asyncio
+import json
+import os
+import stat
+import threading
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from fast_json_pointer.cli import app
+from fast_json_pointer.exceptions import JsonPointerException
+from fast_json_pointer.server import Client, DocumentServer
+
+
+@pytest.fixture
+def serving(tmp_path):
+    def serve(doc_server):
+        path = tmp_path / "fjp.sock"
+        started = threading.Event()
+        running = {}
+
+        async def main():
+            running["loop"] = asyncio.get_running_loop()
+            running["task"] = asyncio.current_task()
+            started.set()
+            await doc_server.serve(path)
+
+        def run():
+            try:
+                asyncio.run(main())
+            except asyncio.CancelledError:
+                pass
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        started.wait()
+        stops.append((running, thread))
+
+        # Wait for the socket to be bound
+        while not path.exists():
+            time.sleep(0.01)
+        return str(path)
+
+    stops = []
+    yield serve
+
+    for running, thread in stops:
+        running["loop"].call_soon_threadsafe(running["task"].cancel)
+        thread.join()
+
+
+@pytest.fixture
+def socket_path(serving, tmp_path):
+    doc_path = tmp_path / "config.json"
+    doc_path.write_text(json.dumps({"a": [1, 2], "b": {"c": None}}))
+
+    doc_server = DocumentServer(root=tmp_path)
+    doc_server.load("config", doc_path)
+    return serving(doc_server)
+
+
+def test_client(socket_path, tmp_path):
+    with Client(socket_path) as client, Client(socket_path) as other:
+        assert client.docs() == ["config"]
+        assert client.get("config", ["/a/1", "/b", "/nope"]) == [
+            {"value": 2},
+            {"value": {"c": None}},
+            {"error": "ResolutionException: Error resolving json pointer"},
+        ]
+
+        client.patch("config", [{"op": "add", "path": "/a/-", "value": 3}])
+        assert other.get("config", ["/a"]) == [{"value": [1, 2, 3]}]
+
+        with pytest.raises(JsonPointerException):
+            client.patch("config", [{"op": "remove", "path": "/nope"}])
+        with pytest.raises(JsonPointerException):
+            client.get("missing", ["/a"])
+        with pytest.raises(JsonPointerException):
+            client.request({"op": "unknown"})
+
+        (tmp_path / "other.json").write_text("[true]")
+        client.load("other", "other.json")
+        assert other.get("other", ["/0"]) == [{"value": True}]
+        client.load("other", tmp_path / "config.json")
+        assert other.get("other", ["/b"]) == [{"value": {"c": None}}]
+
+
+def test_socket_is_private(socket_path):
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+
+@pytest.mark.parametrize("path", ["../outside.json", "/etc/hostname", "link.json"])
+def test_load_outside_root_refused(socket_path, tmp_path, path):
+    (tmp_path.parent / "outside.json").write_text("{}")
+    (tmp_path / "link.json").symlink_to(tmp_path.parent / "outside.json")
+
+    with Client(socket_path) as client:
+        with pytest.raises(JsonPointerException, match="outside the server's root"):
+            client.load("other", path)
+        assert client.docs() == ["config"]
+
+
+def test_load_without_root_refused(serving, tmp_path):
+    (tmp_path / "other.json").write_text("{}")
+    with Client(serving(DocumentServer())) as client:
+        with pytest.raises(JsonPointerException, match="no root"):
+            client.load("other", tmp_path / "other.json")
+        assert client.docs() == []
+
+
+def test_cli(socket_path):
+    runner = CliRunner()
+
+    served = ["-s", socket_path, "--doc", "config"]
+
+    result = runner.invoke(app, ["get", "/a/0", "/b/c", *served])
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ["1", "null"]
+
+    patch = json.dumps([{"op": "replace", "path": "/a/0", "value": "x"}])
+    result = runner.invoke(app, ["patch", patch, *served])
+    assert result.exit_code == 0
+
+    result = runner.invoke(app, ["get", "/a/0", "/z", *served])
+    assert result.exit_code == 1
+    assert result.stdout.splitlines()[0] == '"x"'
@@ -0,0 +1,59 @@
+import io
+import json
+import mmap
+
+import pytest
+
+from fast_json_pointer import resolver, stream
+from fast_json_pointer.exceptions import ResolutionException
+
+DOC = {
+    "skip": [1, {"a": "}]\"{["}, [[[]]], -1.5e3, True, None],
+    "esc\"aped\\": {"é": "unicode ☃"},
+    "data": {"m~n": [10, {"a/b": True, "": []}], "n": {}},
+}
+POINTERS = [
+    "",
+    "/skip",
+    "/skip/1/a",
+    "/skip/3",
+    "/skip/5",
+    '/esc"aped\\/é',
+    "/data/m~0n/1/a~1b",
+    "/data/m~0n/1/",
+    "/data/n",
+]
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_matches_resolver(indent):
+    raw = json.dumps(DOC, indent=indent).encode()
+    escaped = json.dumps(DOC, indent=indent, ensure_ascii=True).encode()
+
+    for pointer in POINTERS:
+        expected = resolver.get(DOC, pointer)
+        assert stream.get_from_bytes(raw, pointer) == expected
+        assert stream.get_from_bytes(memoryview(escaped), pointer) == expected
+        for chunk_size in [1, 3, 64]:
+            assert (
+                stream.get_from_stream(io.BytesIO(raw), pointer, chunk_size=chunk_size)
+                == expected
+            )
+
+
+def test_misses():
+    raw = json.dumps(DOC).encode()
+
+    for pointer in ["/nope", "/skip/6", "/skip/-", "/skip/01", "/skip/0/x"]:
+        with pytest.raises(ResolutionException):
+            stream.get_from_bytes(raw, pointer)
+
+
+def test_get_from_file(tmp_path):
+    path = tmp_path / "doc.json"
+    path.write_bytes(json.dumps(DOC).encode())
+
+    assert stream.get_from_file(path, "/data/m~0n/0") == 10
+
+    with open(path, "rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        assert stream.get_from_bytes(m, "/skip/1") == {"a": '}]"{['}
@@ -0,0 +1,184 @@
+import random
+import threading
+
+import pytest
+
+from fast_json_pointer.exceptions import PatchException
+from fast_json_pointer.threadsafe import ConcurrentDocument
+
+TIMEOUT = 5
+
+
+def _run(fn):
+    thread = threading.Thread(target=fn, daemon=True)
+    thread.start()
+    return thread
+
+
+def _doc():
+    return ConcurrentDocument({"a": {"x": 1}, "b": {"y": 2}, "arr": [0, 1, 2]})
+
+
+@pytest.mark.parametrize(
+    "held, write, other",
+    [
+        ("/a", True, lambda d: d.get("/b/y")),
+        ("/a", True, lambda d: d.add("/b/z", 3)),
+        ("/a", True, lambda d: d.add("/c", 3)),
+        ("/a/x", True, lambda d: d.add("/a/y", 3)),
+        ("/a", False, lambda d: d.get("/a/x")),
+        ("/arr/0", True, lambda d: d.replace("/arr/1", 3)),
+        ("/arr/0", False, lambda d: d.get("/arr/1")),
+    ],
+)
+def test_disjoint_dont_block(held, write, other):
+    doc = _doc()
+    with doc.locked(held, write=write):
+        thread = _run(lambda: other(doc))
+        thread.join(TIMEOUT)
+        assert not thread.is_alive()
+
+
+@pytest.mark.parametrize(
+    "held, write, other",
+    [
+        ("/a", True, lambda d: d.get("/a/x")),
+        ("/a", True, lambda d: d.get("")),
+        ("/a", False, lambda d: d.replace("/a/x", 3)),
+        ("/a/x", False, lambda d: d.remove("/a")),
+        ("/a/x", True, lambda d: d.patch([{"op": "test", "path": "/a", "value": 1}])),
+        ("/arr/2", False, lambda d: d.add("/arr/0", 3)),
+        ("/arr/2", False, lambda d: d.remove("/arr/-")),
+        ("", False, lambda d: d.add("/c", 3)),
+    ],
+)
+def test_overlapping_block(held, write, other):
+    doc = _doc()
+    finished = threading.Event()
+
+    def run():
+        try:
+            other(doc)
+        except PatchException:
+            pass
+        finished.set()
+
+    with doc.locked(held, write=write):
+        thread = _run(run)
+        assert not finished.wait(0.1)
+
+    thread.join(TIMEOUT)
+    assert finished.is_set()
+
+
+def test_writer_not_starved_by_readers():
+    doc = _doc()
+    stop = threading.Event()
+    reading = threading.Barrier(5)
+
+    def read():
+        reading.wait()
+        while not stop.is_set():
+            with doc.locked("/a"):
+                # Overlapping readers, the lock is never free between them
+                stop.wait(0.005)
+
+    readers = [_run(read) for _ in range(4)]
+    reading.wait()
+    writer = _run(lambda: doc.replace("/a/x", 3))
+    writer.join(TIMEOUT)
+    stop.set()
+    for reader in readers:
+        reader.join(TIMEOUT)
+
+    assert not writer.is_alive()
+    assert doc.get("/a/x") == 3
+
+
+def test_queued_reader_waits_for_queued_writer():
+    doc = _doc()
+    order = []
+
+    with doc.locked("/a/x"):
+        writer = _run(lambda: (doc.replace("/a/x", 3), order.append("write")))
+        while not any(
+            node[4] for _, nodes in doc._locks._stripes for node in nodes.values()
+        ):
+            threading.Event().wait(0.001)
+        reader = _run(lambda: order.append(doc.get("/a/x")))
+        assert reader.join(0.1) is None and reader.is_alive()
+
+    writer.join(TIMEOUT)
+    reader.join(TIMEOUT)
+    assert order == ["write", 3]
+
+
+def test_failed_patch_releases_locks():
+    doc = _doc()
+    with pytest.raises(PatchException):
+        doc.patch(
+            [
+                {"op": "replace", "path": "/a/x", "value": 5},
+                {"op": "remove", "path": "/missing"},
+            ]
+        )
+    assert doc.doc["a"] == {"x": 1}
+    assert not any(nodes for _, nodes in doc._locks._stripes)
+
+    doc.replace("", [])
+    assert doc.doc == []
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        {"op": "add", "path": "a/x", "value": 5},
+        {"op": "move", "from": "/a/x", "path": "/b/~2"},
+        {"op": "copy", "from": "a", "path": "/b"},
+        {"op": "test", "path": "x", "value": 1},
+    ],
+)
+def test_malformed_pointers_raise_patch_exception(op):
+    doc = _doc()
+    with pytest.raises(PatchException):
+        doc.patch([{"op": "replace", "path": "/a/x", "value": 5}, op])
+    assert doc.doc["a"] == {"x": 1}
+    assert not any(nodes for _, nodes in doc._locks._stripes)
+
+
+def test_transactions_are_atomic():
+    items = list(range(40))
+    doc = ConcurrentDocument({"pools": {str(i): items[i::4] for i in range(4)}})
+    errors = []
+
+    def transfer(seed):
+        rng = random.Random(seed)
+        for _ in range(200):
+            src, dst = rng.sample(range(4), 2)
+            first, end = f"/pools/{src}/0", f"/pools/{dst}/-"
+            try:
+                # Item is in both pools between the two ops, unless atomic
+                doc.patch(
+                    [
+                        {"op": "copy", "from": first, "path": end},
+                        {"op": "remove", "path": first},
+                    ]
+                )
+            except PatchException:
+                pass  # empty pool
+
+    def audit():
+        for _ in range(200):
+            with doc.locked("/pools") as pools:
+                if sorted(sum(pools.values(), [])) != items:
+                    errors.append(dict(pools))
+
+    threads = [_run(lambda seed=seed: transfer(seed)) for seed in range(4)]
+    threads.append(_run(audit))
+    for thread in threads:
+        thread.join(TIMEOUT * 4)
+        assert not thread.is_alive()
+
+    assert not errors
+    assert sorted(sum(doc.get("/pools").values(), [])) == items
+    assert not any(nodes for _, nodes in doc._locks._stripes)
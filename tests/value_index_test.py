@@ -0,0 +1,104 @@
+import copy
+import random
+
+import pytest
+
+from fast_json_pointer import JsonPointer
+from fast_json_pointer.exceptions import PatchException
+from fast_json_pointer.patch import apply_patch
+from fast_json_pointer.value_index import ValueIndex
+from fast_json_pointer.walk import iter_pointers
+
+DOC = {"a": [{"x": 1}, {"x": 2}, {"x": 1}], "b": {"c": {"d": "1"}, "e": [True, 1.0]}}
+
+
+def _random_op(rng, doc):
+    pointers = [str(p) for p, _ in iter_pointers(doc)][1:]
+    ends = [f"{p}/-" for p, v in iter_pointers(doc) if isinstance(v, list)]
+    path = rng.choice(pointers + ends)
+    value = rng.choice([1, "1", True, None, {"x": 2}, [1, [2]]])
+    match rng.choice(["add", "remove", "replace", "move", "copy"]):
+        case "add":
+            return {"op": "add", "path": path, "value": value}
+        case "remove":
+            return {"op": "remove", "path": path}
+        case "replace":
+            return {"op": "replace", "path": path, "value": value}
+        case op:
+            return {"op": op, "from": rng.choice(pointers), "path": path}
+
+
+def _mutate(index, op):
+    match op:
+        case {"op": "add" | "replace" as name, "path": path, "value": value}:
+            getattr(index, name)(path, copy.deepcopy(value))
+        case {"op": "remove", "path": path}:
+            index.remove(path)
+        case {"op": "move" | "copy" as name, "from": from_, "path": path}:
+            getattr(index, name)(from_, path)
+
+
+def test_consistent_through_mutations():
+    rng = random.Random(0)
+    for _ in range(100):
+        plain = copy.deepcopy(DOC)
+        index = ValueIndex(copy.deepcopy(DOC))
+
+        for _ in range(10):
+            if not isinstance(plain, (dict, list)) or not plain:
+                break
+            op = _random_op(rng, plain)
+            try:
+                plain = apply_patch(plain, [copy.deepcopy(op)])
+            except PatchException:
+                with pytest.raises(PatchException):
+                    _mutate(index, op)
+            else:
+                _mutate(index, op)
+
+            assert index.doc == plain
+            assert index._index == ValueIndex(plain)._index
+
+
+def test_find():
+    index = ValueIndex(copy.deepcopy(DOC))
+
+    ones = {JsonPointer.parse(p) for p in ["/a/0/x", "/a/2/x", "/b/e/1"]}
+    assert index.find(1) == ones
+    assert index.find(True) == {JsonPointer.parse("/b/e/0")}
+    assert index.find("1") == {JsonPointer.parse("/b/c/d")}
+    assert index.find({"x": 1}) == index.find([1]) == frozenset()
+    assert index.count(1) == 3 and 2 in index and 3 not in index
+    assert len(index) == 4
+
+
+def test_shifted_siblings_rekeyed():
+    index = ValueIndex({"a": ["x", "y", "z"]})
+
+    index.add("/a/0", "w")
+    assert index.find("z") == {JsonPointer.parse("/a/3")}
+
+    index.move("/a/3", "/a/1")
+    for idx, value in enumerate("wzxy"):
+        assert index.find(value) == {JsonPointer(["a", str(idx)])}
+
+    index.add("/a/-", "z")
+    assert index.find("z") == {JsonPointer.parse("/a/1"), JsonPointer.parse("/a/4")}
+
+
+def test_root_replaced():
+    index = ValueIndex({"a": 1})
+    index.replace("", [1, 1])
+    assert index.doc == [1, 1]
+    assert index.find(1) == {JsonPointer.parse("/0"), JsonPointer.parse("/1")}
+
+
+@pytest.mark.parametrize("ptr", ["/a/²", "/a/01", "/a/-1", "/a/5"])
+def test_invalid_indexes_raise_patch_exception(ptr):
+    index = ValueIndex({"a": [1]})
+
+    with pytest.raises(PatchException):
+        index.add(ptr, 1)
+    with pytest.raises(PatchException):
+        index.remove(ptr)
+    assert index.find(1) == {JsonPointer.parse("/a/0")}
@@ -0,0 +1,56 @@
+import sys
+
+from fast_json_pointer import resolver
+from fast_json_pointer.walk import iter_pointers
+
+DOC = {"a": [1, {"b": None, "c~/": [[]]}], "d": {}, "e": "x"}
+
+
+def test_pointers_resolve_to_values():
+    pointers = [(str(p), v) for p, v in iter_pointers(DOC)]
+
+    assert [p for p, _ in pointers] == [
+        "",
+        "/a",
+        "/a/0",
+        "/a/1",
+        "/a/1/b",
+        "/a/1/c~0~1",
+        "/a/1/c~0~1/0",
+        "/d",
+        "/e",
+    ]
+    for pointer, value in pointers:
+        assert resolver.get(DOC, pointer) is value
+
+
+def test_leaves_only():
+    assert [str(p) for p, _ in iter_pointers(DOC, leaves_only=True)] == [
+        "/a/0",
+        "/a/1/b",
+        "/a/1/c~0~1/0",
+        "/d",
+        "/e",
+    ]
+    assert [str(p) for p, _ in iter_pointers(DOC, leaves_only=True, max_depth=1)] == [
+        "/a",
+        "/d",
+        "/e",
+    ]
+    assert list(iter_pointers(5, leaves_only=True))[0][1] == 5
+
+
+def test_siblings_share_parent():
+    (_, _), (a, _), (first, _), (second, _) = list(iter_pointers(DOC))[:4]
+    assert first.parent is second.parent is a
+
+
+def test_deep_document():
+    depth = sys.getrecursionlimit() * 2
+    doc = leaf = []
+    for _ in range(depth):
+        leaf.append([])
+        leaf = leaf[0]
+
+    *_, (pointer, value) = iter_pointers(doc)
+    assert pointer.depth == depth and value == []